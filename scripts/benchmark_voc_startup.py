@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+
+# Cold start of the VOC engine: every measurement runs in a fresh interpreter,
+# so module caches of earlier measurements do not hide import costs.
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+PACKAGE = "osbridgelcca.desktop_app.widgets.utils.core"
+
+SCENARIOS = {
+    "import": "",
+    "one vehicle type": "run({'small_cars': 100})",
+    "all vehicle types": "run({vt: 100 for vt in m.core.MODEL_MODULES})",
+}
+
+SCRIPT = """
+import copy, sys, time
+start = time.perf_counter()
+import {package}.main as m
+imported = time.perf_counter()
+
+def run(vehicle_info):
+    inputs = copy.deepcopy(m.vehicle_input)
+    inputs["vehicle_info"] = dict(dict.fromkeys(m.core.MODEL_MODULES, 0), **vehicle_info)
+    m.calc_voc(inputs, m.wpi, m.vc)
+
+{statement}
+done = time.perf_counter()
+print(f"{{(imported - start) * 1e3:.1f}} {{(done - start) * 1e3:.1f}} {{len(m.core.MODEL_MAP.loaded())}}")
+"""
+
+
+def measure(statement, repeat=5):
+    """Best (import ms, total ms) over `repeat` fresh interpreters, and the number of models loaded."""
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(SRC))
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", SCRIPT.format(package=PACKAGE, statement=statement)],
+                                env=env, capture_output=True, text=True, check=True).stdout.split()
+        runs.append((float(output[0]), float(output[1]), int(output[2])))
+    return min(runs)
+
+
+def main():
+    print("\n=== VOC Startup Benchmark ===\n")
+    for name, statement in SCENARIOS.items():
+        import_ms, total_ms, models = measure(statement)
+        print(f"{name:<20} import {import_ms:7.1f} ms   total {total_ms:7.1f} ms   models loaded {models}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -33,7 +33,9 @@ from PySide6.QtWidgets import QStackedWidget
 
 class UiMainWindow(object):
     def setupUi(self, MainWindow):
-        self.database_manager = DatabaseManager()
+        # Each session starts from an empty database; use DatabaseManager.open_project()
+        # to keep the data of a project between sessions
+        self.database_manager = DatabaseManager(recreate=True)
         # To check if tab widget is there or no
         self.tabs_active = False
         # Contains name of widget and its index in tabs
@@ -611,8 +611,8 @@ class BridgeAndTrafficData(QWidget):
         self.database_manager.accident_distribution = accident_dist
         self.database_manager.vehicle_distribution = vehicle_dist
 
-        # Carbon Emission due to Rerouting during Initial Construction
-        self.database_manager.init_carbon_emission_rerouting()
+        # Recompute the results depending on the traffic data (rerouting carbon emissions, ...)
+        self.database_manager.recompute()
     
     def close_widget(self):
         self.closed.emit()
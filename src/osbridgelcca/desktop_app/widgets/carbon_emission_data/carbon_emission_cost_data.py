@@ -407,8 +407,8 @@ class CarbonEmissionCostData(QWidget):
         # Save UI Data to Backend
         self.database_manager.carbon_emission_cost_data = data
 
-        # Carbon Emission Cost
-        # self.database_manager.carbon_emission_cost()
+        # Recompute the carbon emission cost and everything depending on the SCC
+        self.database_manager.recompute()
 
     def close_widget(self):
         self.closed.emit()
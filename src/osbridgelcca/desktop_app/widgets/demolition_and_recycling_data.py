@@ -413,17 +413,9 @@ class DemolitionAndRecyclingData(QWidget):
         # Save UI Data to Backend
         self.database_manager.demolition_and_recycling_data = data
 
-        # Demolition and Disposal Cost
-        self.database_manager.demolition_and_disposal_cost()
-
-        # Demolition and Disposal related Carbon Emission
-        self.database_manager.demolition_disposal_carbon_emission_cost()
-
-        # Carbon Emission due to Rerouting during Demolition and Disposal
-        self.database_manager.demolition_disposal_rerouting_carbon_emission_cost()
-
-        # Recycling Cost
-        self.database_manager.recycling_cost()
+        # Recompute the results depending on the demolition data
+        # (demolition, disposal and recycling costs)
+        self.database_manager.recompute()
 
         
         print("Results:\n")
@@ -345,8 +345,8 @@ class FinancialData(QWidget):
         # Save UI Data to Backend
         self.database_manager.financial_data = data
 
-        # calculate Time Cost
-        self.database_manager.calculate_time_cost()
+        # Recompute the results depending on the financial data (Time Cost, ...)
+        self.database_manager.recompute()
 
 #----------------Standalone-Test-Code--------------------------------
 
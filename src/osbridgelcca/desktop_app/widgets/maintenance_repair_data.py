@@ -460,32 +460,9 @@ class MaintenanceRepairData(QWidget):
         # Save UI Data to Backend
         self.database_manager.maintainance_and_repair_data = data
 
-        # Routine Inspection Cost Calculation
-        self.database_manager.routine_inspection_cost() 
-
-        # Periodic Maintenance Cost Calculation
-        self.database_manager.periodic_maintainance_cost()
-        
-        # Periodic Maintenance Carbon Emission Cost Calculation
-        self.database_manager.periodic_maintainance_carbon_emission_cost()
-        
-        # Major Inspection Cost
-        self.database_manager.major_inspection_cost()
-        
-        # Major Repair Cost
-        self.database_manager.major_repair_cost()
-        
-        # Major Repair Related Carbon Emisson Cost
-        self.database_manager.major_repair_related_carbon_emission_cost()
-
-        # 9. Replacement cost of Bearing and Expansion Joints
-        self.database_manager.bearing_expansion_joint_replacement_cost()
-
-        # Carbon Emission due to rerouting during Major Repairs
-        self.database_manager.carbon_emission_rerouting_during_major_repairs()
-
-        # Carbon Emission due to rerouting during Replacement
-        self.database_manager.carbon_emission_rerouting_during_replacement()
+        # Recompute the results depending on the maintenance data
+        # (inspection, maintenance, repair and replacement costs)
+        self.database_manager.recompute()
 
 #----------------Standalone-Test-Code--------------------------------
 
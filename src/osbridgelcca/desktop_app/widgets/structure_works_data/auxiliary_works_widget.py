@@ -698,8 +698,8 @@ class AuxiliaryWorks(QWidget):
             self.data_id = self.database_manager.replace_structure_work_rows(KEY_AUXILIARY, data, self.data_id)
         else:
             self.data_id = self.database_manager.input_data_row(KEY_AUXILIARY, data)
-        # calculating total initial cost
-        self.database_manager.calculate_total_initial_cost()
+        # Recompute the total initial cost and everything depending on it
+        self.database_manager.recompute()
         self.state_changed = False
 
     def on_next_clicked(self):
@@ -1,328 +1,392 @@
-import pandas as pd
+from typing import Dict, NamedTuple, Sequence, Tuple
+import numpy as np
 from .data import *
 
+# IRC SP-30 tables compiled once, at import, into read-only NumPy arrays.
+# Every axis (year, vehicle, road type, accident category, WPI column) is
+# integer coded through a name -> position dictionary, so a lookup is two
+# dictionary hits and one array index, and many keys can be looked up at once.
+
+YEARS = (2019, 2020, 2021, 2022, 2023, 2024)
+VEHICLES = (KEY_TWO_WHEELER, KEY_SMALL_CARS, KEY_BIG_CARS,
+            KEY_ORDINARY_BUS, KEY_DELUXE_BUS,
+            KEY_LCV, KEY_MCV, KEY_HCV)
+ROAD_TYPES = (KEY_SINGLE_LANE_ROAD, KEY_INTERMEDIATE_LANE_ROAD, KEY_TWO_LANE_ROAD,
+              KEY_FOUR_LANE_DIVIDED_ROAD, KEY_SIX_LANE_DIVIDED_ROAD,
+              KEY_FOUR_LANE_DIVIDED_EXPRESSWAY, KEY_SIX_LANE_DIVIDED_EXPRESSWAY,
+              KEY_EIGHT_LANE_DIVIDED_URBAN_EXPRESSWAY)
+ACCIDENT_CATEGORIES = (KEY_FATAL, KEY_MAJOR_INJURY, KEY_MINOR_INJURY)
+
+YEAR_INDEX = {year: i for i, year in enumerate(YEARS)}
+VEHICLE_INDEX = {vehicle: i for i, vehicle in enumerate(VEHICLES)}
+ROAD_INDEX = {road: i for i, road in enumerate(ROAD_TYPES)}
+ACCIDENT_INDEX = {category: i for i, category in enumerate(ACCIDENT_CATEGORIES)}
+
+
+def _frozen(values) -> np.ndarray:
+    array = np.array(values, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+class YearTable(NamedTuple):
+    """Yearly index values: one row per entry of YEARS, one column per item."""
+    columns: Tuple[str, ...]
+    column_index: Dict[str, int]
+    values: np.ndarray
+
+
+def _year_table(columns: Dict[str, Sequence[float]]) -> YearTable:
+    names = tuple(columns)
+    return YearTable(names, {name: j for j, name in enumerate(names)},
+                     _frozen([columns[name] for name in names]).T.copy())
+
+
+def _same_for_all_vehicles(series: Sequence[float]) -> Dict[str, Sequence[float]]:
+    return {vehicle: series for vehicle in VEHICLES}
+
+
+# Table 8: Accident Type Costs (Pg. 17), indexed by ACCIDENT_INDEX
+ACCIDENT_COST = _frozen([1325049.00, 432651.00, 46680.00])
+
+# Table 9: Vehicle Damage Costs (Pg. 18), indexed by VEHICLE_INDEX
+VEHICLE_DAMAGE_COST = _frozen([10194.00, 40088.00, 40088.00,
+                               116585.00, 116585.00,
+                               205483.00, 205483.00, 120494.00])
+
+# Table 6: VOT of Passengers (Pg. 16), [vehicle, road type]
+VOT = _frozen(np.array([
+    # SL    IL    2L     4L     6L     4E     6E     8E
+    [41.3, 41.3, 60.1, 60.5, 60.5, 60.5, 60.5, 60.5],           # Two Wheeler
+    [98.5, 98.5, 117.3, 178.5, 178.5, 178.5, 178.5, 178.5],     # Small Cars
+    [98.5, 98.5, 117.3, 258.0, 258.0, 258.0, 258.0, 258.0],     # Big Cars
+    [27.2, 27.2, 73.2, 73.2, 73.2, 73.2, 73.2, 73.2],           # Ordinary Buses
+    [0, 0, 81.6, 109.0, 109.0, 109.0, 109.0, 109.0],            # Deluxe Buses
+    [0, 0, 0, 0, 0, 0, 0, 0],                                   # LCV
+    [0, 0, 0, 0, 0, 0, 0, 0],                                   # MCV
+    [0, 0, 0, 0, 0, 0, 0, 0],                                   # HCV
+]))
+
+# Table 6: Average occupancy, indexed by VEHICLE_INDEX
+OCCUPANCY = _frozen([1.71, 3.23, 4.28, 30.0, 40.0, 2.5, 2.0, 1.5])
+
+# Wholesale price indices, one YearTable per series
+WPI_TABLES: Dict[str, YearTable] = {
+    # WPI: Medical Accessories for Human Injury Cost
+    TABLE_WPI_MEDICAL: _year_table({
+        KEY_FATAL: [132.5, 135.8, 139.5, 140.5, 142.5, 144.0],
+        KEY_MAJOR_INJURY: [132.5, 135.8, 139.5, 140.5, 142.5, 144.0],
+        KEY_MINOR_INJURY: [132.5, 135.8, 139.5, 140.5, 142.5, 144.0],
+    }),
+    # WPI: Travel Time (Table 6, Pg. 16)
+    TABLE_VOT: _year_table(_same_for_all_vehicles([121.2, 121.8, 135.0, 151.3, 151.3, 154.0])),
+    # WPI: Property Damage (Manufacture of parts and accessories for motor vehicles)
+    TABLE_WPI_PROPERTY_DAMAGE: _year_table(_same_for_all_vehicles([113.2, 115.5, 120.6, 128.5, 128.2, 129.0])),
+    # WPI: VOC: Fuel Costs (Engine Oil, Other Oil, Grease)
+    TABLE_WPI_FUEL: _year_table({
+        KEY_PETROL: [85.4, 74.2, 109.9, 159.8, 158.9, 154.3],
+        KEY_DIESEL: [94.4, 79.4, 114.7, 183.5, 174.2, 167.4],
+        KEY_ENGINE_OIL: [131.2, 134.0, 157.8, 174.7, 188.0, 190.2],
+        KEY_OTHER_OIL: [92.5, 78.1, 113.8, 168.2, 160.1, 156.8],
+        KEY_GREASE: [92.5, 78.1, 113.8, 168.2, 160.1, 156.8],
+    }),
+    # WPI: Tyre Cost (for each vehicle)
+    TABLE_WPI_TYRE: _year_table({
+        KEY_TWO_WHEELER: [104.0, 102.0, 105.9, 116.4, 119.8, 117.9],
+        KEY_SMALL_CARS: [99.2, 98.7, 102.8, 109.9, 111.5, 111.5],
+        KEY_BIG_CARS: [99.2, 98.7, 102.8, 109.9, 111.5, 111.5],
+        KEY_ORDINARY_BUS: [97.5, 96.1, 103.2, 110.5, 114.4, 114.1],
+        KEY_DELUXE_BUS: [97.5, 96.1, 103.2, 110.5, 114.4, 114.1],
+        KEY_LCV: [97.5, 96.1, 103.2, 110.5, 114.4, 114.1],
+        KEY_MCV: [97.5, 96.1, 103.2, 110.5, 114.4, 114.1],
+        KEY_HCV: [97.5, 96.1, 103.2, 110.5, 114.4, 114.1],
+    }),
+    # WPI: Spare Parts: New Price (Manufacture of parts and accessories for motor vehicles)
+    TABLE_WPI_SPARE_PARTS: _year_table(_same_for_all_vehicles([113.2, 115.5, 120.6, 128.5, 128.2, 129.0])),
+    # WPI: Fixed and Depreciation Costs: Manufacture of motor vehicles, trailers and semi-trailers
+    TABLE_WPI_FIXED_DEPRECIATION: _year_table(_same_for_all_vehicles([113.8, 116.9, 121.1, 127.1, 128.0, 129.6])),
+    # WPI: Commodity Holding Cost: Fuel & Power
+    TABLE_WPI_COMMODITY_HOLDING: _year_table(_same_for_all_vehicles([101.7, 93.3, 116.1, 155.2, 152.7, 150.4])),
+    # WPI: Passenger and Crew Costs
+    TABLE_WPI_PASSENGER_CREW: _year_table({
+        KEY_PASSENGER_COST: [138.58, 147.91, 155.33, 166.94, 176.38, 184.27],
+        KEY_CREW_COST: [118.07, 131.77, 145.91, 159.05, 160.28, 164.18],
+    }),
+}
+
+
+def _codes(index: Dict, keys, what: str) -> np.ndarray:
+    """Integer codes of one key or a sequence of keys."""
+    try:
+        if isinstance(keys, (str, int, np.integer)):
+            return np.array(index[keys])
+        return np.array([index[key] for key in keys], dtype=int)
+    except KeyError as e:
+        raise ValueError(f"Invalid {what}: {e}. Valid options: {list(index)}")
+
+
+def accident_costs(categories) -> np.ndarray:
+    """Economic cost (INR) of one or many accident categories."""
+    return ACCIDENT_COST[_codes(ACCIDENT_INDEX, categories, "accident category")]
+
+
+def vehicle_damage_costs(vehicles) -> np.ndarray:
+    """Economic cost (INR) of the damage to one or many vehicle types."""
+    return VEHICLE_DAMAGE_COST[_codes(VEHICLE_INDEX, vehicles, "vehicle type")]
+
+
+def vot_values(vehicles, road_types) -> np.ndarray:
+    """Value of travel time (INR/hour) for vehicle types and road types (broadcast against each other)."""
+    return VOT[_codes(VEHICLE_INDEX, vehicles, "vehicle type"), _codes(ROAD_INDEX, road_types, "road type")]
+
+
+def occupancies(vehicles) -> np.ndarray:
+    """Average occupancy (persons per vehicle) of one or many vehicle types."""
+    return OCCUPANCY[_codes(VEHICLE_INDEX, vehicles, "vehicle type")]
+
+
+def wpi_ratios(table: str, columns, current_years, base_year: int = BASE_YEAR) -> np.ndarray:
+    """
+    WPI ratio (current / base year) of one or many columns and years of a WPI table.
+
+    Args:
+        table: Key of WPI_TABLES (TABLE_WPI_MEDICAL, TABLE_VOT, ...)
+        columns: Column name or sequence of column names
+        current_years: Target year or sequence of years (broadcast against columns)
+        base_year: Reference year
+    """
+    try:
+        compiled = WPI_TABLES[table]
+    except KeyError:
+        raise ValueError(f"Invalid table: '{table}'. Valid options: {list(WPI_TABLES)}")
+    j = _codes(compiled.column_index, columns, "column")
+    current = _codes(YEAR_INDEX, current_years, "year")
+    base = _codes(YEAR_INDEX, base_year, "year")
+    return compiled.values[current, j] / compiled.values[base, j]
+
+
+# Layout of the nested WPI dictionary (IRC_SP_30.getWPI): vehicle-specific
+# categories hold one ratio per vehicle type, the other categories one ratio
+# per item (fuel, passenger/crew, injury), the same for every vehicle.
+WPI_VEHICLE_CATEGORIES = {
+    "propertyDamage": TABLE_WPI_PROPERTY_DAMAGE,
+    "tyreCost": TABLE_WPI_TYRE,
+    "spareParts": TABLE_WPI_SPARE_PARTS,
+    "fixedDepreciation": TABLE_WPI_FIXED_DEPRECIATION,
+    "commodityHoldingCost": TABLE_WPI_COMMODITY_HOLDING,
+    "votCost": TABLE_VOT,
+}
+WPI_ITEM_CATEGORIES = {
+    "fuelCost": TABLE_WPI_FUEL,
+    "passengerCrewCost": TABLE_WPI_PASSENGER_CREW,
+    "medicalCost": TABLE_WPI_MEDICAL,
+}
+# Categories of the WPI ratio tensor: the vehicle-specific categories, then every item
+WPI_CATEGORIES = tuple(WPI_VEHICLE_CATEGORIES) + tuple(
+    column for table in WPI_ITEM_CATEGORIES.values() for column in WPI_TABLES[table].columns)
+WPI_CATEGORY_INDEX = {category: i for i, category in enumerate(WPI_CATEGORIES)}
+_VEHICLE_COSTS = ("propertyDamage", "tyreCost", "spareParts", "fixedDepreciation")
+
+
+def _wpi_index_tensor() -> np.ndarray:
+    """Raw WPI values as a (category, vehicle, year) array."""
+    tensor = np.empty((len(WPI_CATEGORIES), len(VEHICLES), len(YEARS)))
+    for category, table in WPI_VEHICLE_CATEGORIES.items():
+        compiled = WPI_TABLES[table]
+        columns = [compiled.column_index[vehicle] for vehicle in VEHICLES]
+        tensor[WPI_CATEGORY_INDEX[category]] = compiled.values[:, columns].T
+    for table in WPI_ITEM_CATEGORIES.values():
+        compiled = WPI_TABLES[table]
+        for column in compiled.columns:
+            tensor[WPI_CATEGORY_INDEX[column]] = compiled.values[:, compiled.column_index[column]]
+    return tensor
+
+
+class WPIRatios(NamedTuple):
+    """
+    WPI ratios (year / base year) of every category, vehicle type and year.
+
+    values has shape (len(WPI_CATEGORIES), len(VEHICLES), len(YEARS)) and is
+    read-only; selecting a target year is an index into the last axis.
+    """
+    base_year: int
+    values: np.ndarray
+
+    def at(self, year: int) -> np.ndarray:
+        """(category, vehicle) ratios of one year, a view into values."""
+        return self.values[:, :, _codes(YEAR_INDEX, year, "year")]
+
+    def select(self, categories, vehicles, years) -> np.ndarray:
+        """Ratios of one or many categories, vehicle types and years (broadcast against each other)."""
+        return self.values[_codes(WPI_CATEGORY_INDEX, categories, "WPI category"),
+                           _codes(VEHICLE_INDEX, vehicles, "vehicle type"),
+                           _codes(YEAR_INDEX, years, "year")]
+
+    def as_dict(self, year: int) -> dict:
+        """
+        Nested dictionary of the ratios of one year, as returned by IRC_SP_30.getWPI.
+
+        Years outside the tables give None for every ratio.
+        """
+        if year in YEAR_INDEX:
+            rows = self.at(year).tolist()
+        else:
+            rows = [[None] * len(VEHICLES)] * len(WPI_CATEGORIES)
+
+        def per_vehicle(category):
+            return dict(zip(VEHICLES, rows[WPI_CATEGORY_INDEX[category]]))
+
+        def per_item(table):
+            return {column: rows[WPI_CATEGORY_INDEX[column]][0] for column in WPI_TABLES[table].columns}
+
+        return {"year": year, "WPI": {
+            "fuelCost": per_item(TABLE_WPI_FUEL),
+            "vehicleCost": {category: per_vehicle(category) for category in _VEHICLE_COSTS},
+            "commodityHoldingCost": per_vehicle("commodityHoldingCost"),
+            "passengerCrewCost": per_item(TABLE_WPI_PASSENGER_CREW),
+            "medicalCost": per_item(TABLE_WPI_MEDICAL),
+            "votCost": per_vehicle("votCost"),
+        }}
+
+
+# Raw index values shared by every WPIRatios, and the ratios already built per base year
+WPI_INDEX_TENSOR = _frozen(_wpi_index_tensor())
+_WPI_RATIOS: Dict[int, WPIRatios] = {}
+
+
+def wpi_ratio_tensor(base_year: int = BASE_YEAR) -> WPIRatios:
+    """
+    WPI ratios of all categories, vehicle types and years relative to base_year.
+
+    Built once per base year; later calls return the cached tensor.
+    """
+    ratios = _WPI_RATIOS.get(base_year)
+    if ratios is None:
+        base = _codes(YEAR_INDEX, base_year, "year")
+        ratios = WPIRatios(base_year, _frozen(WPI_INDEX_TENSOR / WPI_INDEX_TENSOR[:, :, base, np.newaxis]))
+        _WPI_RATIOS[base_year] = ratios
+    return ratios
+
+
 class IRC_SP_30:
-    def __init__(self):
-        """Initialize the dataframes with IRC SP-30 data."""
-        self._initialize_dataframes()
-    
-    def _initialize_dataframes(self):
-        """Create and populate all DataFrames with IRC SP-30 data."""
-        
-        # Table 8: Accident Type Costs (Pg. 17)
-        self.accident_type_costs = pd.DataFrame({
-            COL_ACCIDENT_CATEGORY: [KEY_FATAL, KEY_MAJOR_INJURY, KEY_MINOR_INJURY],
-            COL_COST_INR: [1325049.00, 432651.00, 46680.00]
-        }).set_index(COL_ACCIDENT_CATEGORY)
-        
-        # Table 9: Vehicle Damage Costs (Pg. 18)
-        self.vehicle_damage_costs = pd.DataFrame({
-            COL_TYPE_OF_VEHICLE: [KEY_TWO_WHEELER, KEY_SMALL_CARS, KEY_BIG_CARS, 
-                               KEY_ORDINARY_BUS, KEY_DELUXE_BUS, 
-                               KEY_LCV, KEY_MCV, KEY_HCV],
-            COL_COST_INR: [ 10194.00, 40088.00, 40088.00, 
-                            116585.00, 116585.00, 
-                            205483.00, 205483.00, 120494.00]
-        }).set_index(COL_TYPE_OF_VEHICLE)
-        
-        # Table 6: VOT of Passengers (Pg. 16)
-        self.vot_of_passengers = pd.DataFrame({
-            COL_TYPE_OF_VEHICLE: [KEY_TWO_WHEELER, KEY_SMALL_CARS, KEY_BIG_CARS, 
-                               KEY_ORDINARY_BUS, KEY_DELUXE_BUS, 
-                               KEY_LCV, KEY_MCV, KEY_HCV],
-            KEY_SINGLE_LANE_ROAD: [41.3, 98.5, 98.5, 27.2, 0, 0, 0, 0],
-            KEY_INTERMEDIATE_LANE_ROAD: [41.3, 98.5, 98.5, 27.2, 0, 0, 0, 0],
-            KEY_TWO_LANE_ROAD: [60.1, 117.3, 117.3, 73.2, 81.6, 0, 0, 0],
-            KEY_FOUR_LANE_DIVIDED_ROAD: [60.5, 178.5, 258.0, 73.2, 109.0, 0, 0, 0],
-            KEY_SIX_LANE_DIVIDED_ROAD: [60.5, 178.5, 258.0, 73.2, 109.0, 0, 0, 0],
-            KEY_FOUR_LANE_DIVIDED_EXPRESSWAY: [60.5, 178.5, 258.0, 73.2, 109.0, 0, 0, 0],
-            KEY_SIX_LANE_DIVIDED_EXPRESSWAY: [60.5, 178.5, 258.0, 73.2, 109.0, 0, 0, 0],
-            KEY_EIGHT_LANE_DIVIDED_URBAN_EXPRESSWAY: [60.5, 178.5, 258.0, 73.2, 109.0, 0, 0, 0],
-            COL_OCCUPANCY: [1.71, 3.23, 4.28, 30.0, 40.0, 2.5, 2.0, 1.5]
-        }).set_index(COL_TYPE_OF_VEHICLE)
-
-        # WPI: Medical Accessories for Human Injury Cost
-        self.wpi_medical_accessories = pd.DataFrame({
-            COL_YEAR: [2019, 2020, 2021, 2022, 2023, 2024],
-            KEY_FATAL: [132.5, 135.8, 139.5, 140.5, 142.5, 144.0],
-            KEY_MAJOR_INJURY: [132.5, 135.8, 139.5, 140.5, 142.5, 144.0],
-            KEY_MINOR_INJURY: [132.5, 135.8, 139.5, 140.5, 142.5, 144.0]
-        }).set_index(COL_YEAR)  
-        
-        # WPI: Travel Time (Table 6, Pg. 16)
-        self.wpi_vot = pd.DataFrame({
-            COL_YEAR: [2019, 2020, 2021, 2022, 2023, 2024],
-            KEY_SMALL_CARS: [121.2, 121.8, 135.0, 151.3, 151.3, 154.0],
-            KEY_BIG_CARS: [121.2, 121.8, 135.0, 151.3, 151.3, 154.0],
-            KEY_TWO_WHEELER: [121.2, 121.8, 135.0, 151.3, 151.3, 154.0],
-            KEY_ORDINARY_BUS: [121.2, 121.8, 135.0, 151.3, 151.3, 154.0],
-            KEY_DELUXE_BUS: [121.2, 121.8, 135.0, 151.3, 151.3, 154.0],
-            KEY_LCV: [121.2, 121.8, 135.0, 151.3, 151.3, 154.0],
-            KEY_HCV: [121.2, 121.8, 135.0, 151.3, 151.3, 154.0],
-            KEY_MCV: [121.2, 121.8, 135.0, 151.3, 151.3, 154.0]
-        }).set_index(COL_YEAR)
-        
-        # WPI: Property Damage (Manufacture of parts and accessories for motor vehicles)
-        self.wpi_property_damage = pd.DataFrame({
-            COL_YEAR: [2019, 2020, 2021, 2022, 2023, 2024],
-            KEY_SMALL_CARS: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_BIG_CARS: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_TWO_WHEELER: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_ORDINARY_BUS: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_DELUXE_BUS: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_LCV: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_HCV: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_MCV: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0]
-        }).set_index(COL_YEAR)
-        
-        # WPI: VOC: Fuel Costs (Engine Oil, Other Oil, Grease)
-        self.voc_fuel_costs = pd.DataFrame({
-            COL_YEAR: [2019, 2020, 2021, 2022, 2023, 2024],
-            KEY_PETROL: [85.4, 74.2, 109.9, 159.8, 158.9, 154.3],
-            KEY_DIESEL: [94.4, 79.4, 114.7, 183.5, 174.2, 167.4],
-            KEY_ENGINE_OIL: [131.2, 134.0, 157.8, 174.7, 188.0, 190.2],
-            KEY_OTHER_OIL: [92.5, 78.1, 113.8, 168.2, 160.1, 156.8],
-            KEY_GREASE: [92.5, 78.1, 113.8, 168.2, 160.1, 156.8]
-        }).set_index(COL_YEAR)
-        
-        # WPI: Tyre Cost (for each vehicle)
-        self.tyre_costs = pd.DataFrame({
-            COL_YEAR: [2019, 2020, 2021, 2022, 2023, 2024],
-            KEY_SMALL_CARS: [99.2, 98.7, 102.8, 109.9, 111.5, 111.5],
-            KEY_BIG_CARS: [99.2, 98.7, 102.8, 109.9, 111.5, 111.5],
-            KEY_TWO_WHEELER: [104.0, 102.0, 105.9, 116.4, 119.8, 117.9],
-            KEY_ORDINARY_BUS: [97.5, 96.1, 103.2, 110.5, 114.4, 114.1],
-            KEY_DELUXE_BUS: [97.5, 96.1, 103.2, 110.5, 114.4, 114.1],
-            KEY_LCV: [97.5, 96.1, 103.2, 110.5, 114.4, 114.1],
-            KEY_HCV: [97.5, 96.1, 103.2, 110.5, 114.4, 114.1],
-            KEY_MCV: [97.5, 96.1, 103.2, 110.5, 114.4, 114.1]
-        }).set_index(COL_YEAR)
-        
-        # WPI: Spare Parts: New Price (Manufacture of parts and accessories for motor vehicles)
-        self.spare_parts_costs = pd.DataFrame({
-            COL_YEAR: [2019, 2020, 2021, 2022, 2023, 2024],
-            KEY_SMALL_CARS: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_BIG_CARS: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_TWO_WHEELER: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_ORDINARY_BUS: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_DELUXE_BUS: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_LCV: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_HCV: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0],
-            KEY_MCV: [113.2, 115.5, 120.6, 128.5, 128.2, 129.0]
-        }).set_index(COL_YEAR)
-        
-        # WPI: Fixed and Depreciation Costs: Manufacture of motor vehicles, trailers and semi-trailers
-        self.fixed_depreciation_costs = pd.DataFrame({
-            COL_YEAR: [2019, 2020, 2021, 2022, 2023, 2024],
-            KEY_SMALL_CARS: [113.8, 116.9, 121.1, 127.1, 128.0, 129.6],
-            KEY_BIG_CARS: [113.8, 116.9, 121.1, 127.1, 128.0, 129.6],
-            KEY_TWO_WHEELER: [113.8, 116.9, 121.1, 127.1, 128.0, 129.6],
-            KEY_ORDINARY_BUS: [113.8, 116.9, 121.1, 127.1, 128.0, 129.6],
-            KEY_DELUXE_BUS: [113.8, 116.9, 121.1, 127.1, 128.0, 129.6],
-            KEY_LCV: [113.8, 116.9, 121.1, 127.1, 128.0, 129.6],
-            KEY_HCV: [113.8, 116.9, 121.1, 127.1, 128.0, 129.6],
-            KEY_MCV: [113.8, 116.9, 121.1, 127.1, 128.0, 129.6]
-        }).set_index(COL_YEAR)
-        
-        # WPI: Commodity Holding Cost: Fuel & Power
-        self.commodity_holding_cost = pd.DataFrame({
-            COL_YEAR: [2019, 2020, 2021, 2022, 2023, 2024],
-            KEY_SMALL_CARS: [101.7, 93.3, 116.1, 155.2, 152.7, 150.4],
-            KEY_BIG_CARS: [101.7, 93.3, 116.1, 155.2, 152.7, 150.4],
-            KEY_TWO_WHEELER: [101.7, 93.3, 116.1, 155.2, 152.7, 150.4],
-            KEY_ORDINARY_BUS: [101.7, 93.3, 116.1, 155.2, 152.7, 150.4],
-            KEY_DELUXE_BUS: [101.7, 93.3, 116.1, 155.2, 152.7, 150.4],
-            KEY_LCV: [101.7, 93.3, 116.1, 155.2, 152.7, 150.4],
-            KEY_HCV: [101.7, 93.3, 116.1, 155.2, 152.7, 150.4],
-            KEY_MCV: [101.7, 93.3, 116.1, 155.2, 152.7, 150.4]
-        }).set_index(COL_YEAR)
-        
-        # WPI: Passenger and Crew Costs
-        self.passenger_crew_costs = pd.DataFrame({
-            COL_YEAR: [2019, 2020, 2021, 2022, 2023, 2024],
-            KEY_PASSENGER_COST: [138.58, 147.91, 155.33, 166.94, 176.38, 184.27],
-            KEY_CREW_COST: [118.07, 131.77, 145.91, 159.05, 160.28, 164.18]
-        }).set_index(COL_YEAR)
-    
+    """
+    Lookups into the IRC SP-30 tables.
+
+    The tables are module level constants, so creating an instance is free and
+    all instances share the same data.
+    """
+
     # ==================== Get Methods ====================
-    
+
     def _get_accident_cost(self, category: str) -> float:
         """
         Get the economic cost for a specific accident category.
-        
+
         Args:
             category: 'Fatal', 'Major Injury', or 'Minor Injury'
-        
+
         Returns:
             Economic cost in INR
         """
         try:
-            return float(self.accident_type_costs.loc[category, COL_COST_INR])
+            return float(ACCIDENT_COST[ACCIDENT_INDEX[category]])
         except KeyError:
             raise ValueError(f"Invalid accident category: '{category}'. "
-                           f"Valid options: {list(self.accident_type_costs.index)}")
-    
+                           f"Valid options: {list(ACCIDENT_CATEGORIES)}")
+
     def _get_vehicle_damage_cost(self, vehicle_type: str) -> float:
         """
         Get the economic cost of vehicle damage.
-        
+
         Args:
             vehicle_type: e.g., 'Two Wheeler', 'Small Cars', 'LCV'
-        
+
         Returns:
             Economic cost in INR
         """
         try:
-            return float(self.vehicle_damage_costs.loc[vehicle_type, COL_COST_INR])
+            return float(VEHICLE_DAMAGE_COST[VEHICLE_INDEX[vehicle_type]])
         except KeyError:
             raise ValueError(f"Invalid vehicle type: '{vehicle_type}'. "
-                           f"Valid options: {list(self.vehicle_damage_costs.index)}")
-    
+                           f"Valid options: {list(VEHICLES)}")
+
     def _get_wpi(self, table: str, column: str, current_year: int, base_year: int) -> float:
         """
         Calculate WPI ratio between current and base year.
-        
+
         Args:
-            table: 'medical' or 'vot'
-            column: Column name (lowercase with underscores)
+            table: TABLE_WPI_MEDICAL or TABLE_VOT
+            column: Column name (accident category or vehicle type)
             current_year: Target year
             base_year: Reference year (default: 2019)
-        
+
         Returns:
             WPI ratio (current/base)
         """
-        # Select the appropriate DataFrame
-        if table == TABLE_WPI_MEDICAL:
-            df = self.wpi_medical_accessories
-        elif table == TABLE_VOT:
-            df = self.wpi_vot
-        else:
+        if table not in (TABLE_WPI_MEDICAL, TABLE_VOT):
             raise ValueError(f"Invalid table: '{table}'. Use {TABLE_WPI_MEDICAL} or {TABLE_VOT}")
-        
+        compiled = WPI_TABLES[table]
         try:
-            cur_value = df.loc[current_year, column]
-            base_value = df.loc[base_year, column]
-            return float(cur_value / base_value)
+            j = compiled.column_index[column]
+            return float(compiled.values[YEAR_INDEX[current_year], j] / compiled.values[YEAR_INDEX[base_year], j])
         except KeyError as e:
             raise ValueError(f"Year or column not found: {e}")
-    
+
     def _get_vot(self, vehicle_type: str, column: str) -> float:
         """
         Get Value of Travel Time for specific vehicle and road type.
-        
+
         Args:
             vehicle_type: e.g., 'Two Wheeler', 'Small Car', 'Big Car'
-            road_type: Road type (lowercase with underscores)
-        
+            column: Road type (e.g. KEY_TWO_LANE_ROAD)
+
         Returns:
             VOT value in INR per hour
         """
         try:
-            return float(self.vot_of_passengers.loc[vehicle_type, column])
+            return float(VOT[VEHICLE_INDEX[vehicle_type], ROAD_INDEX[column]])
         except KeyError:
             raise ValueError(f"Invalid vehicle type '{vehicle_type}' or "
                            f"column '{column}'")
-    
+
     def _get_occupancy(self, vehicle_type: str) -> float:
         """
         Get average occupancy for a vehicle type.
-        
+
         Args:
             vehicle_type: e.g., 'Two Wheeler', 'Small Car'
-        
+
         Returns:
             Average occupancy (persons per vehicle)
         """
         try:
-            return float(self.vot_of_passengers.loc[vehicle_type, COL_OCCUPANCY])
+            return float(OCCUPANCY[VEHICLE_INDEX[vehicle_type]])
         except KeyError:
-            raise ValueError(f"Invalid vehicle type: '{vehicle_type}'")  
-        
-    def getWPI(self, year: int):
+            raise ValueError(f"Invalid vehicle type: '{vehicle_type}'")
+
+    def getWPI(self, year: int, base_year: int = BASE_YEAR):
         """
-        Get the WPI of all relevant items for a given year, relative to BASE_YEAR.
+        Get the WPI of all relevant items for a given year, relative to base_year.
 
         Returns:
-            dict: Nested dictionary of WPI values (current_year / BASE_YEAR)
+            dict: Nested dictionary of WPI values (current_year / base_year),
+            None for a year outside the tables
         """
+        return wpi_ratio_tensor(base_year).as_dict(year)
+
+
+def as_dataframe(table: str):
+    """A WPI table as a pandas DataFrame indexed by year (for inspection; imports pandas)."""
+    import pandas as pd
+    compiled = WPI_TABLES[table]
+    return pd.DataFrame(compiled.values, index=pd.Index(YEARS, name=COL_YEAR), columns=compiled.columns)
 
-        wpi_dict = {"year": year, "WPI": {}}
-
-        def calc_ratio(df, col):
-            try:
-                return float(df.loc[year, col] / df.loc[BASE_YEAR, col])
-            except KeyError:
-                return None
-
-        # ------------------------------------------------
-        # 1. Fuel Costs
-        # ------------------------------------------------
-        wpi_dict["WPI"]["fuelCost"] = {
-            col: calc_ratio(self.voc_fuel_costs, col)
-            for col in self.voc_fuel_costs.columns
-        }
-
-        # ------------------------------------------------
-        # 2. Vehicle Costs – separated categories
-        # ------------------------------------------------
-        wpi_dict["WPI"]["vehicleCost"] = {
-            "propertyDamage": {
-                col: calc_ratio(self.wpi_property_damage, col)
-                for col in self.wpi_property_damage.columns
-            },
-            "tyreCost": {
-                col: calc_ratio(self.tyre_costs, col)
-                for col in self.tyre_costs.columns
-            },
-            "spareParts": {
-                col: calc_ratio(self.spare_parts_costs, col)
-                for col in self.spare_parts_costs.columns
-            },
-            "fixedDepreciation": {
-                col: calc_ratio(self.fixed_depreciation_costs, col)
-                for col in self.fixed_depreciation_costs.columns
-            }
-        }
-
-        # ------------------------------------------------
-        # 3. Commodity Holding Cost
-        # ------------------------------------------------
-        wpi_dict["WPI"]["commodityHoldingCost"] = {
-            col: calc_ratio(self.commodity_holding_cost, col)
-            for col in self.commodity_holding_cost.columns
-        }
-
-        # ------------------------------------------------
-        # 4. Passenger & Crew Costs
-        # ------------------------------------------------
-        wpi_dict["WPI"]["passengerCrewCost"] = {
-            col: calc_ratio(self.passenger_crew_costs, col)
-            for col in self.passenger_crew_costs.columns
-        }
-
-        # ------------------------------------------------
-        # 5. Medical Accessories (Fatal / Major / Minor)
-        # ------------------------------------------------
-        wpi_dict["WPI"]["medicalCost"] = {
-            col: calc_ratio(self.wpi_medical_accessories, col)
-            for col in self.wpi_medical_accessories.columns
-        }
-
-        # ------------------------------------------------
-        # 6. Travel Time (VOT)
-        # ------------------------------------------------
-        wpi_dict["WPI"]["votCost"] = {
-            col: calc_ratio(self.wpi_vot, col)
-            for col in self.wpi_vot.columns
-        }
-
-        return wpi_dict
 
 if __name__ == "__main__":
     irc_sp_30 = IRC_SP_30()
-    print(irc_sp_30.accident_type_costs)
-    print(irc_sp_30.vehicle_damage_costs)
-    print(irc_sp_30.wpi_medical_accessories)
-    print(irc_sp_30.wpi_vot)
-    print(irc_sp_30.vot_of_passengers)
+    print(dict(zip(ACCIDENT_CATEGORIES, ACCIDENT_COST)))
+    print(dict(zip(VEHICLES, VEHICLE_DAMAGE_COST)))
+    print(as_dataframe(TABLE_WPI_MEDICAL))
+    print(as_dataframe(TABLE_VOT))
+    print(vot_values(VEHICLES, KEY_TWO_LANE_ROAD))
     print(irc_sp_30.getWPI(2024)) # add this
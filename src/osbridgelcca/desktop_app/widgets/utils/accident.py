@@ -0,0 +1,83 @@
+from functools import lru_cache
+from typing import Mapping, NamedTuple, Tuple
+import numpy as np
+from .data import *
+from .IRC_SP_30 import accident_costs, vehicle_damage_costs, wpi_ratios
+
+# Accident costs during construction: the number of accidents on the rerouting
+# (the exposure) is computed once, and the costs of all injury categories and
+# vehicle types are dot products of the distributions with WPI adjusted unit
+# costs. Any argument may carry leading scenario axes.
+
+INJURY_CATEGORIES = (KEY_MINOR_INJURY, KEY_MAJOR_INJURY, KEY_FATAL)
+DAMAGE_VEHICLES = (KEY_TWO_WHEELER, KEY_SMALL_CARS, KEY_BIG_CARS,
+                   KEY_ORDINARY_BUS, KEY_DELUXE_BUS,
+                   KEY_LCV, KEY_HCV, KEY_MCV)
+
+
+class AccidentCosts(NamedTuple):
+    """Human injury and vehicle damage costs (INR), one value per scenario."""
+    human_injury: np.ndarray
+    vehicle_damage: np.ndarray
+
+    def total(self) -> np.ndarray:
+        return self.human_injury + self.vehicle_damage
+
+
+@lru_cache(maxsize=32)
+def accident_unit_costs(current_year: int, base_year: int = BASE_YEAR) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    WPI adjusted unit costs of one accident of every injury category and of the damage to every vehicle type.
+
+    Returns:
+        (costs in INJURY_CATEGORIES order, costs in DAMAGE_VEHICLES order), read-only
+    """
+    injury = accident_costs(INJURY_CATEGORIES) * wpi_ratios(TABLE_WPI_MEDICAL, INJURY_CATEGORIES,
+                                                            current_year, base_year)
+    damage = vehicle_damage_costs(DAMAGE_VEHICLES) * wpi_ratios(TABLE_VOT, DAMAGE_VEHICLES,
+                                                                current_year, base_year)
+    injury.flags.writeable = False
+    damage.flags.writeable = False
+    return injury, damage
+
+
+def accident_exposure(crash_rate, daily_traffic, rerouting_distance, days, work_zone_multiplier=1.0) -> np.ndarray:
+    """
+    Number of accidents on the rerouting over `days`.
+
+    Args:
+        crash_rate: Accidents per million vehicle-km
+        daily_traffic: Average daily traffic (vehicles)
+        rerouting_distance: Additional rerouting distance (km)
+        days: Working days of the period
+        work_zone_multiplier: Crash rate multiplier of the work zone
+    """
+    return (np.asarray(crash_rate, dtype=float) * daily_traffic * work_zone_multiplier
+            * rerouting_distance * 1e-6 * days)
+
+
+def distribution_vector(distribution: Mapping[str, float], keys) -> np.ndarray:
+    """Values of a distribution dictionary in `keys` order (0 for missing keys)."""
+    return np.array([distribution.get(key, 0.0) for key in keys], dtype=float)
+
+
+def evaluate_accident_costs(exposure, injury_distribution, vehicle_distribution,
+                            current_year: int, base_year: int = BASE_YEAR) -> AccidentCosts:
+    """
+    Accident costs of one or many scenarios.
+
+    Args:
+        exposure: Number of accidents, shape (...) (see accident_exposure)
+        injury_distribution: (..., 3) accidents per injury category in INJURY_CATEGORIES order,
+            as entered (multiplied with the exposure)
+        vehicle_distribution: (..., 8) damaged vehicles in DAMAGE_VEHICLES order, as entered
+        current_year: Year of the WPI adjustment
+        base_year: Reference year of the unit costs
+
+    Returns:
+        AccidentCosts with the broadcast scenario shape
+    """
+    injury_costs, damage_costs = accident_unit_costs(current_year, base_year)
+    exposure = np.asarray(exposure, dtype=float)
+    return AccidentCosts(exposure * (np.asarray(injury_distribution, dtype=float) @ injury_costs),
+                         exposure * (np.asarray(vehicle_distribution, dtype=float) @ damage_costs))
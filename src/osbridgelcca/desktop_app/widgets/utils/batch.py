@@ -0,0 +1,332 @@
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+from .data import *
+from .core.voc.cache import VOCCache
+from .database import DatabaseManager
+from .dependency_graph import INPUT_ATTRIBUTES
+from .ledger import CASH_FLOW_LINES
+from .monte_carlo import KEY_LIFE_CYCLE_COST
+from .storage import (BATCH_PROFILE, BATCH_PROJECTS_DIR, PROJECTS_DIR, StorageProfile, project_db_path,
+                      remove_database)
+
+# Headless evaluation of bridge portfolios. A project file is a JSON object
+# holding the UI data of one bridge (see osbridgelcca/examples/highway_bridge.json):
+#   "name": project name
+#   "financial_data", "traffic_data", ...: DatabaseManager UI data attributes
+#       (INPUT_ATTRIBUTES), merged over the defaults of DatabaseManager. The
+#       vehicle operation cost is evaluated on the alternate road of "traffic_data":
+#       "Alternate Road Carriageway" (see data.VOC_LANE_TYPES), "Road Roughness"
+#       (mm/km), "Road Rise" and "Road Fall" (m/km)
+#   "structure_works": work type -> rows, as passed to DatabaseManager.input_data_row
+#   "carbon_emission": records, as passed to DatabaseManager.insert_carbon_emission_data
+# A portfolio is a directory of project files or a JSONL stream (one project per line).
+
+KEY_STRUCTURE_WORKS = "structure_works"
+KEY_CARBON_EMISSION_RECORDS = "carbon_emission"
+PROJECT_KEYS = ["name", KEY_STRUCTURE_WORKS, KEY_CARBON_EMISSION_RECORDS] + list(INPUT_ATTRIBUTES)
+
+# Columns of the consolidated results, in order
+RESULT_COLUMNS = (["index", "project", "source"] + CASH_FLOW_LINES
+                  + [COST_TOTAL_ROAD_USER, KEY_LIFE_CYCLE_COST, "error"])
+
+Project = Tuple[int, str, Dict[str, Any]]
+
+# Vehicle model results shared by the projects evaluated in this process (one
+# cache per worker): projects on the same lane type and road condition evaluate them once
+VOC_CACHE = VOCCache()
+
+
+def _parse(text: str):
+    """Parsed JSON text; invalid JSON gives a ValueError, reported in the results of that project."""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        return ValueError(f"Invalid JSON: {e}")
+
+
+def _load_jsonl(lines: Iterable[str], label: str) -> Iterator[Tuple[str, Any]]:
+    for number, line in enumerate(lines, start=1):
+        if line.strip():
+            yield f"{label}:{number}", _parse(line)
+
+
+def iter_projects(source: str) -> Iterator[Project]:
+    """
+    Projects of a portfolio, read lazily.
+
+    Args:
+        source: Directory of *.json project files, a .jsonl file, a single .json
+                file, or "-" for a JSONL stream on stdin
+
+    Yields:
+        (index, source label, project) in input order; the project is a
+        ValueError if its JSON is invalid
+    """
+    if source == "-":
+        projects = _load_jsonl(sys.stdin, "<stdin>")
+    elif os.path.isdir(source):
+        files = sorted(name for name in os.listdir(source) if name.endswith(".json"))
+        projects = ((os.path.join(source, name), _load_json(os.path.join(source, name))) for name in files)
+    elif source.endswith(".jsonl"):
+        projects = _jsonl_file(source)
+    else:
+        projects = iter([(source, _load_json(source))])
+
+    for index, (label, project) in enumerate(projects):
+        yield index, label, project
+
+
+def _load_json(path: str):
+    with open(path, encoding="utf-8") as file:
+        return _parse(file.read())
+
+
+def _jsonl_file(path: str) -> Iterator[Tuple[str, Any]]:
+    with open(path, encoding="utf-8") as file:
+        yield from _load_jsonl(file, path)
+
+
+def _project_name(label: str, project) -> str:
+    name = project.get("name") if isinstance(project, dict) else None
+    return name or os.path.splitext(os.path.basename(label))[0]
+
+
+def load_into(manager: DatabaseManager, project: Mapping[str, Any]):
+    """
+    Enter the data of a project into a DatabaseManager.
+
+    Raises:
+        ValueError: If the project has unknown keys
+    """
+    if not isinstance(project, dict):
+        raise ValueError(f"A project must be a JSON object, got {type(project).__name__}")
+    unknown = [key for key in project if key not in PROJECT_KEYS]
+    if unknown:
+        raise ValueError(f"Invalid project keys: {unknown}. Valid options: {PROJECT_KEYS}")
+
+    for attribute in INPUT_ATTRIBUTES:
+        if attribute in project:
+            setattr(manager, attribute, {**getattr(manager, attribute), **project[attribute]})
+    for work_type, rows in project.get(KEY_STRUCTURE_WORKS, {}).items():
+        manager.input_data_row(work_type, rows)
+    if project.get(KEY_CARBON_EMISSION_RECORDS):
+        manager.insert_carbon_emission_data(project[KEY_CARBON_EMISSION_RECORDS])
+
+
+def check_projects_dir(projects_dir: str) -> str:
+    """
+    Folder of the databases of a batch run stored on disk.
+
+    A batch run replaces the database of every project it evaluates, so it
+    must not write into the folder of the saved projects.
+
+    Raises:
+        ValueError: If projects_dir is (or is inside) PROJECTS_DIR
+    """
+    folder = os.path.realpath(projects_dir)
+    saved = os.path.realpath(PROJECTS_DIR)
+    if os.path.commonpath([folder, saved]) == saved:
+        raise ValueError(f"Batch runs can not store their databases in the projects folder {PROJECTS_DIR}, "
+                         f"use a separate folder such as {BATCH_PROJECTS_DIR}")
+    return projects_dir
+
+
+def evaluate_project(index: int, label: str, project: Mapping[str, Any],
+                     profile: StorageProfile = BATCH_PROFILE,
+                     projects_dir: str = BATCH_PROJECTS_DIR) -> Dict[str, Any]:
+    """
+    Evaluate one project with the full cost engine.
+
+    Errors are reported in the "error" column instead of being raised, so one
+    faulty project does not stop a portfolio run. Cost lines whose input data
+    the project does not give are None. A profile storing the databases on
+    disk starts every project from a fresh database in projects_dir, which
+    must be apart from the saved projects (see check_projects_dir).
+
+    Returns:
+        Dictionary keyed by RESULT_COLUMNS
+    """
+    record = dict.fromkeys(RESULT_COLUMNS)
+    record.update(index=index, source=label)
+    manager = None
+    try:
+        record["project"] = _project_name(label, project)
+        if isinstance(project, Exception):
+            raise project
+        if not profile.in_memory:
+            remove_database(project_db_path(record["project"], check_projects_dir(projects_dir)))
+        # The engine reports every step on stdout
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = DatabaseManager.open_project(record["project"], projects_dir=projects_dir, profile=profile,
+                                                   voc_cache=VOC_CACHE)
+            load_into(manager, project)
+            table = manager.cash_flows()
+            road_user_cost = manager.total_road_user_cost()
+        record.update(table.line_npv())
+        record[COST_TOTAL_ROAD_USER] = road_user_cost
+        record[KEY_LIFE_CYCLE_COST] = table.npv()
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if manager is not None:
+            manager.close()
+    return record
+
+
+def _evaluate_chunk(chunk: List[Project], profile: StorageProfile, projects_dir: str) -> List[Dict[str, Any]]:
+    """Evaluate a chunk of projects. Runs in the worker processes."""
+    return [evaluate_project(index, label, project, profile, projects_dir) for index, label, project in chunk]
+
+
+def _chunks(projects: Iterable[Project], chunk_size: int) -> Iterator[List[Project]]:
+    chunk = []
+    for project in projects:
+        chunk.append(project)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class PortfolioRunner:
+    """
+    Evaluates a portfolio of projects across a process pool.
+
+    Projects are read lazily and sent to the workers in chunks; at most
+    max_pending chunks are in flight, so the memory use does not grow with
+    the size of the portfolio. Results are yielded as the chunks finish
+    (in completion order; the "index" column gives the input order).
+    """
+
+    def __init__(self, projects: Iterable[Project], max_workers: Optional[int] = None, chunk_size: int = 16,
+                 max_pending: Optional[int] = None, profile: StorageProfile = BATCH_PROFILE,
+                 projects_dir: str = BATCH_PROJECTS_DIR):
+        """
+        Args:
+            projects: (index, source label, project) tuples, e.g. from iter_projects()
+            max_workers: Number of worker processes; 1 evaluates the projects in this process
+            chunk_size: Number of projects evaluated together by one task
+            max_pending: Chunks submitted ahead of the finished ones (default: twice the workers)
+            profile: Storage of the project databases (default: throw-away in-memory databases)
+            projects_dir: Folder of the project databases when the profile stores them on disk,
+                          apart from the saved projects (see check_projects_dir)
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if not profile.in_memory:
+            check_projects_dir(projects_dir)
+        self.projects = projects
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or 2 * self.max_workers
+        self.profile = profile
+        self.projects_dir = projects_dir
+
+    def run(self) -> Iterator[Dict[str, Any]]:
+        """
+        Evaluate all projects.
+
+        Yields:
+            One result record per project (see evaluate_project)
+        """
+        chunks = _chunks(self.projects, self.chunk_size)
+
+        if self.max_workers == 1:
+            for chunk in chunks:
+                yield from _evaluate_chunk(chunk, self.profile, self.projects_dir)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = set()
+            for chunk in chunks:
+                pending.add(executor.submit(_evaluate_chunk, chunk, self.profile, self.projects_dir))
+                if len(pending) >= self.max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+
+class ResultWriter:
+    """
+    Writes result records to a .jsonl or .csv file as they arrive, flushing
+    after every record so an interrupted run keeps the finished projects.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self.errors = 0
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._csv = None
+        if path.endswith(".csv"):
+            self._csv = csv.DictWriter(self._file, fieldnames=RESULT_COLUMNS)
+            self._csv.writeheader()
+
+    def write(self, record: Mapping[str, Any]):
+        if self._csv is not None:
+            self._csv.writerow(record)
+        else:
+            self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.count += 1
+        self.errors += record.get("error") is not None
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def run_portfolio(source: str, output: str, **kwargs) -> Tuple[int, int]:
+    """
+    Evaluate a portfolio and write the consolidated results.
+
+    Args:
+        source: Portfolio (see iter_projects)
+        output: Results file, .jsonl or .csv
+        kwargs: PortfolioRunner arguments
+
+    Returns:
+        (projects evaluated, projects that failed)
+    """
+    with ResultWriter(output) as writer:
+        for record in PortfolioRunner(iter_projects(source), **kwargs).run():
+            writer.write(record)
+    return writer.count, writer.errors
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Evaluate the life-cycle costs of a portfolio of bridges.")
+    parser.add_argument("source", help="directory of .json project files, a .jsonl file, or - for stdin")
+    parser.add_argument("-o", "--output", default="portfolio_results.jsonl", help="results file (.jsonl or .csv)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("-c", "--chunk-size", type=int, default=16, help="projects per task")
+    args = parser.parse_args(argv)
+
+    count, errors = run_portfolio(args.source, args.output, max_workers=args.workers, chunk_size=args.chunk_size)
+    print(f"Evaluated {count} projects ({errors} failed), results in {args.output}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 from .voc import core
+from .voc.cache import VOCCache
 from .voc.congestion import core as congestion_core
 
 vc = 0.8854
@@ -108,9 +109,24 @@ vehicle_input = {
 
 def calc_voc(inputs: dict,
              all_wpi: dict,
-             vehicle_cost: float) -> dict:
+             vc: float,
+             cache: VOCCache = None) -> dict:
     """
-    return calculate_total_adjusted_costs
+    return calculate_total_adjusted_costs of the VOC of `inputs` at the volume to capacity ratio `vc`
     """
-    val = core.main(inputs, all_wpi)
-    return congestion_core.calculate_total_adjusted_costs(val, vehicle_cost, vehicle_input)
\ No newline at end of file
+    val = core.main(inputs, all_wpi, cache=cache)
+    return congestion_core.calculate_total_adjusted_costs(val, vc, inputs)
+
+def calc_voc_profile(inputs: dict,
+                     all_wpi: dict,
+                     counts,
+                     capacity: float,
+                     interval_hours: float = 1.0,
+                     cache: VOCCache = None) -> dict:
+    """
+    calculate_total_adjusted_costs over a traffic profile, with the V/C ratio of every interval
+    derived from its counts and the carriageway capacity (PCU/hour) instead of a single vc
+    """
+    val = core.main(inputs, all_wpi, cache=cache)
+    return congestion_core.calculate_profile_adjusted_costs(val, counts, capacity, inputs["lane_type"],
+                                                            interval_hours)
@@ -0,0 +1,100 @@
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+VOCCacheInfo = namedtuple("VOCCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class VOCCache:
+    """
+    LRU bounded cache of vehicle model results.
+
+    A vehicle model is a pure function of the vehicle type, lane and road
+    condition (RG, RS, FL, carriageway width, power weight ratio), and its
+    result does not depend on WPI. Inputs are normalized (rounded) before
+    the lookup and the model is evaluated on the normalized input, so every
+    bridge of a network with the same lane and road condition shares one
+    evaluation and the result does not depend on which bridge came first.
+    """
+
+    def __init__(self, maxsize: int = 1024, roughness_digits: int = 0, grade_digits: int = 2,
+                 width_digits: int = 2, pwr_digits: int = 2):
+        """
+        Args:
+            maxsize: Maximum number of results kept before the least recently
+                used one is evicted
+            roughness_digits: Decimals kept of the roughness RG (mm/km)
+            grade_digits: Decimals kept of the rise RS and fall FL (m/km)
+            width_digits: Decimals kept of the carriageway width (m)
+            pwr_digits: Decimals kept of the power weight ratio
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.roughness_digits = roughness_digits
+        self.grade_digits = grade_digits
+        self.width_digits = width_digits
+        self.pwr_digits = pwr_digits
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+
+    @staticmethod
+    def _round(value, digits: int):
+        return None if value is None else round(float(value), digits)
+
+    def normalize(self, model_input: Dict[str, Any]) -> Tuple[Hashable, Dict[str, Any]]:
+        """
+        Cache key and normalized copy of the input of one vehicle model (see core.model_input()).
+        """
+        RG = self._round(model_input["rg_roughness_factor"], self.roughness_digits)
+        RS = self._round(model_input.get("rs_rise_factor", 0), self.grade_digits)
+        FL = self._round(model_input.get("fl_fall_factor", 0), self.grade_digits)
+        W = self._round(model_input.get("carriageway_width"), self.width_digits)
+        pwr = self._round(model_input.get("power_weight_ratio_pwr"), self.pwr_digits)
+        key = (model_input["vehicle_type"], model_input["lane_type"], RG, RS, FL, W, pwr)
+
+        normalized = dict(model_input)
+        normalized.update({
+            "rg_roughness_factor": RG,
+            "rs_rise_factor": RS,
+            "fl_fall_factor": FL,
+            "rf_rise_and_fall_factor": RS + FL,
+            "carriageway_width": W,
+            "power_weight_ratio_pwr": pwr,
+        })
+        return key, normalized
+
+    def get(self, model_input: Dict[str, Any], compute_voc: Callable[[Dict[str, Any]], Any]):
+        """Return the result of compute_voc for the input, computing it on a miss."""
+        key, normalized = self.normalize(model_input)
+        try:
+            result = self._results[key]
+        except KeyError:
+            self.misses += 1
+            result = compute_voc(normalized)
+            self._results[key] = result
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+            return result
+
+        self.hits += 1
+        self._results.move_to_end(key)
+        return result
+
+    def cache_info(self) -> VOCCacheInfo:
+        """Hit/miss statistics, in the style of functools.lru_cache."""
+        return VOCCacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache (0.0 before the first lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Drop all cached results and reset the statistics."""
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._results)
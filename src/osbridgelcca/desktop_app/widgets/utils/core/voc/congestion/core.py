@@ -1,102 +1,266 @@
-import voc.congestion.formulas as cf
-import voc.congestion.input_validation as validate
+from typing import Iterable, Iterator, Mapping, NamedTuple, Union
+import numpy as np
+from . import formulas as cf
+from . import input_validation as validate
+from ..utils.constants import pcu
 
-def calculate_total_adjusted_costs(a, vc, vehicle_input, debug=False):
-    """
-    Calculate total adjusted costs (distance + time) with congestion factors applied.
-    Parameters:
-    a (dict): Base cost data containing 'distanceCost' and 'timeCost'.
-    vc (float): Volume-to-capacity ratio.
-    lane_type (str): Type of lane (e.g., "SL", "IL", "2L", "4L", "6L").
-    vehicle_input (dict): Vehicle input data containing vehicle counts.
-    debug (bool): If True, includes detailed breakdown of calculations.
-    """
-    lane_type =  vehicle_input["lane_type"]
-    validate.validate(a, vc, lane_type, vehicle_input, debug)
+# Rows of a traffic profile evaluated together (a year of hourly intervals)
+PROFILE_CHUNK_SIZE = 8760
 
-    cv = {
-        "distance_congestion_factors": cf.distance_congestion_factors(lane_type, vc=vc),
-        "time_congestion_factors": cf.time_congestion_factors(lane_type, vc=vc)
-    }
 
-    total_distance_cost = {'IT': 0, 'ET': 0}
-    total_time_cost = {'IT': 0, 'ET': 0}
+# --------------------------------------------------------
+# Aggregation kernel
+# --------------------------------------------------------
+# Base costs are (4, vehicle) arrays, rows in COST_ROWS order and vehicles in
+# cf.CONGESTION_VEHICLES order; leading axes (scenarios) broadcast.
+COST_ROWS = (("distance", "IT"), ("distance", "ET"), ("time", "IT"), ("time", "ET"))
 
-    breakdown = {}  # NEW dictionary for detailed debugging
 
-    vehicles = set(a['distanceCost'].keys()) & set(a['timeCost'].keys())
-    vehicles -= {'units', 'total'}
+def _base_costs(a: dict) -> np.ndarray:
+    """(4, vehicle) base costs of the output of voc.core.main (Rs/km per vehicle), 0 where missing."""
+    vehicles = (set(a['distanceCost'].keys()) & set(a['timeCost'].keys())) - {'units', 'total'}
+    costs = np.zeros((4, len(cf.CONGESTION_VEHICLES)))
+    for j, vehicle in enumerate(cf.CONGESTION_VEHICLES):
+        if vehicle in vehicles:
+            costs[:, j] = (a['distanceCost'][vehicle]['IT'], a['distanceCost'][vehicle]['ET'],
+                           a['timeCost'][vehicle]['IT'], a['timeCost'][vehicle]['ET'])
+    return costs
 
-    for vehicle in vehicles:
 
-        veh_count = vehicle_input["vehicle_info"].get(vehicle, 0)
+class AdjustedCosts(NamedTuple):
+    """
+    Congestion-adjusted fleet costs of one or many scenarios.
 
-        # Base costs
-        distance_it = a['distanceCost'][vehicle]['IT']
-        distance_et = a['distanceCost'][vehicle]['ET']
-        time_it = a['timeCost'][vehicle]['IT']
-        time_et = a['timeCost'][vehicle]['ET']
+    `totals` is the (..., 4) array of the totals in COST_ROWS order. The inputs
+    are kept so that the per-vehicle breakdown is only built when asked for.
+    """
+    totals: np.ndarray
+    costs: np.ndarray
+    counts: np.ndarray
+    distance_factors: np.ndarray
+    time_factors: np.ndarray
 
-        # Factors
-        cd = cv['distance_congestion_factors'].get(vehicle, 1)
-        ct = cv['time_congestion_factors'].get(vehicle, 1)
-        # pcu_factor = pcu.get(vehicle, 1)
+    def as_dict(self, index=()) -> dict:
+        """Totals of one scenario in the format of calculate_total_adjusted_costs."""
+        distance_it, distance_et, time_it, time_et = self.totals[index].tolist()
+        return {
+            "distance_total": {"IT": distance_it, "ET": distance_et},
+            "time_total": {"IT": time_it, "ET": time_et},
+            "total": {"IT": distance_it + time_it, "ET": distance_et + time_et},
+            "unit": "Rs/km"
+        }
 
-        # Adjusted costs per vehicle
-        adj_distance_it = distance_it * cd
-        adj_distance_et = distance_et * cd
-        adj_time_it = time_it * ct
-        adj_time_et = time_et * ct
+    def breakdown(self, index=(), vehicles=None) -> dict:
+        """
+        Detailed per-vehicle calculation of one scenario.
 
-        # Total cost including volume
-        total_distance_cost['IT'] += adj_distance_it * veh_count
-        total_distance_cost['ET'] += adj_distance_et * veh_count
-        total_time_cost['IT'] += adj_time_it * veh_count
-        total_time_cost['ET'] += adj_time_et * veh_count
+        Args:
+            index: Scenario (index into the leading axes)
+            vehicles: Vehicle types to include (default: all with base costs)
+        """
+        shape = self.totals.shape[:-1]
+        costs = np.broadcast_to(self.costs, shape + self.costs.shape[-2:])[index]
+        counts, cd, ct = (np.broadcast_to(array, shape + array.shape[-1:])[index]
+                          for array in (self.counts, self.distance_factors, self.time_factors))
+        if vehicles is None:
+            vehicles = [vt for j, vt in enumerate(cf.CONGESTION_VEHICLES) if costs[:, j].any()]
 
-        if debug:
-            # Save detailed breakdown
+        breakdown = {}
+        for vehicle in vehicles:
+            j = cf.CONGESTION_VEHICLES.index(vehicle)
+            distance_it, distance_et, time_it, time_et = costs[:, j].tolist()
+            veh_count, factor_d, factor_t = counts[j].item(), cd[j].item(), ct[j].item()
+            adjusted = {"distance": {"IT": distance_it * factor_d, "ET": distance_et * factor_d},
+                        "time": {"IT": time_it * factor_t, "ET": time_et * factor_t}}
+            total = {kind: {key: value * veh_count for key, value in costs_of.items()}
+                     for kind, costs_of in adjusted.items()}
             breakdown[vehicle] = {
                 "vehicle_count": veh_count,
                 "factors": {
-                    "distance_congestion_factor": cd,
-                    "time_congestion_factor": ct,
+                    "distance_congestion_factor": factor_d,
+                    "time_congestion_factor": factor_t,
                 },
                 "base_costs": {
                     "distance": {"IT": distance_it, "ET": distance_et},
                     "time": {"IT": time_it, "ET": time_et}
                 },
-                "adjusted_costs_per_vehicle": {
-                    "distance": {"IT": adj_distance_it, "ET": adj_distance_et},
-                    "time": {"IT": adj_time_it, "ET": adj_time_et}
-                },
-                "total_adjusted_costs": {
-                    "distance": {
-                        "IT": adj_distance_it * veh_count,
-                        "ET": adj_distance_et * veh_count
-                    },
-                    "time": {
-                        "IT": adj_time_it * veh_count,
-                        "ET": adj_time_et * veh_count
-                    }
-                },
-                "total": {   # <-- NEW FIELD
-                    "IT": (adj_distance_it * veh_count) + (adj_time_it * veh_count),
-                    "ET": (adj_distance_et * veh_count) + (adj_time_et * veh_count)
+                "adjusted_costs_per_vehicle": adjusted,
+                "total_adjusted_costs": total,
+                "total": {
+                    "IT": total["distance"]["IT"] + total["time"]["IT"],
+                    "ET": total["distance"]["ET"] + total["time"]["ET"]
                 }
             }
+        return breakdown
+
+
+def aggregate_adjusted_costs(costs, counts, distance_factors, time_factors) -> AdjustedCosts:
+    """
+    Fleet totals as a matrix product of the vehicle counts and the adjusted costs.
+
+    Args:
+        costs: (..., 4, vehicle) base costs (Rs/km per vehicle), see COST_ROWS
+        counts: (..., vehicle) vehicle counts
+        distance_factors: (..., vehicle) distance congestion factors
+        time_factors: (..., vehicle) time congestion factors
+
+    Returns:
+        AdjustedCosts with (..., 4) totals, the leading axes broadcast over all arguments
+    """
+    costs = np.asarray(costs, dtype=float)
+    counts = np.asarray(counts, dtype=float)
+    distance_factors = np.asarray(distance_factors, dtype=float)
+    time_factors = np.asarray(time_factors, dtype=float)
+
+    # Vehicle-kilometres weighted by their factors: (..., 2, vehicle), distance row then time row
+    weighted = np.stack(np.broadcast_arrays(counts * distance_factors, counts * time_factors), axis=-2)
+    # (..., 2, 2, vehicle) @ (..., 2, vehicle, 1): IT/ET costs of each row against its weights
+    totals = np.matmul(costs.reshape(costs.shape[:-2] + (2, 2, costs.shape[-1])), weighted[..., np.newaxis])
+    totals = totals.reshape(totals.shape[:-3] + (4,))
+    return AdjustedCosts(totals, costs, counts, distance_factors, time_factors)
+
+
+def vehicle_counts(vehicle_info: Mapping[str, float]) -> np.ndarray:
+    """Vehicle counts in cf.CONGESTION_VEHICLES order (0 for missing types)."""
+    return np.array([vehicle_info.get(vt, 0) for vt in cf.CONGESTION_VEHICLES], dtype=float)
+
+
+def calculate_scenario_adjusted_costs(a: dict, counts, vc, lane_type: str) -> AdjustedCosts:
+    """
+    Congestion-adjusted costs of many traffic scenarios on the same road.
+
+    Parameters:
+    a (dict): Base cost data containing 'distanceCost' and 'timeCost' (output of voc.core.main).
+    counts: (scenario, vehicle) vehicle counts in cf.CONGESTION_VEHICLES order.
+    vc: Volume-to-capacity ratio of every scenario, shape (scenario,) (or a single number).
+    lane_type (str): Type of lane (e.g., "SL", "IL", "2L", "4L", "6L").
+    """
+    counts = np.asarray(counts, dtype=float)
+    if np.any(counts < 0):
+        raise ValueError("Vehicle counts must be non-negative.")
+    return aggregate_adjusted_costs(_base_costs(a), counts,
+                                    cf.congestion_factors(cf.DISTANCE_CONGESTION, lane_type, vc),
+                                    cf.congestion_factors(cf.TIME_CONGESTION, lane_type, vc))
+
+
+def calculate_total_adjusted_costs(a, vc, vehicle_input, debug=False):
+    """
+    Calculate total adjusted costs (distance + time) with congestion factors applied.
+    Parameters:
+    a (dict): Base cost data containing 'distanceCost' and 'timeCost'.
+    vc (float): Volume-to-capacity ratio.
+    vehicle_input (dict): Vehicle input data containing vehicle counts and the lane type
+        (e.g., "SL", "IL", "2L", "4L", "6L").
+    debug (bool): If True, includes detailed breakdown of calculations.
+    """
+    lane_type =  vehicle_input["lane_type"]
+    validate.validate(a, vc, lane_type, vehicle_input, debug)
 
-    result = {
-        "distance_total": total_distance_cost,
-        "time_total": total_time_cost,
-        "total": {
-            "IT": total_distance_cost["IT"] + total_time_cost["IT"],
-            "ET": total_distance_cost["ET"] + total_time_cost["ET"]
-        },
-        "unit": "Rs/km"
-    }
+    adjusted = aggregate_adjusted_costs(_base_costs(a), vehicle_counts(vehicle_input["vehicle_info"]),
+                                        cf.congestion_factors(cf.DISTANCE_CONGESTION, lane_type, vc),
+                                        cf.congestion_factors(cf.TIME_CONGESTION, lane_type, vc))
+    result = adjusted.as_dict()
 
     if debug:
-        result["breakdown"] = breakdown
+        vehicles = (set(a['distanceCost'].keys()) & set(a['timeCost'].keys())) - {'units', 'total'}
+        result["breakdown"] = adjusted.breakdown(vehicles=[vt for vt in cf.CONGESTION_VEHICLES if vt in vehicles])
+
+    return result
+
+
+# --------------------------------------------------------
+# Traffic profile mode: one V/C ratio per interval
+# --------------------------------------------------------
+def profile_counts(counts: Union[Mapping[str, Iterable[float]], np.ndarray]) -> np.ndarray:
+    """
+    Vehicle counts per interval as an (interval, vehicle) array over cf.CONGESTION_VEHICLES.
+
+    Args:
+        counts: Vehicle type -> counts per interval (missing types count 0),
+            or an (interval, vehicle) array already in cf.CONGESTION_VEHICLES order
+    """
+    if isinstance(counts, Mapping):
+        invalid = [vt for vt in counts if vt not in cf.CONGESTION_VEHICLES]
+        if invalid:
+            raise ValueError(f"Invalid vehicle types in counts: {invalid}. Allowed: {list(cf.CONGESTION_VEHICLES)}")
+        columns = [np.asarray(counts.get(vt, 0.0), dtype=float) for vt in cf.CONGESTION_VEHICLES]
+        rows = np.broadcast_shapes(*(column.shape for column in columns))
+        array = np.stack([np.broadcast_to(column, rows) for column in columns], axis=-1)
+    else:
+        array = np.asarray(counts, dtype=float)
+    if array.ndim != 2 or array.shape[1] != len(cf.CONGESTION_VEHICLES):
+        raise ValueError(f"Counts must have shape (intervals, {len(cf.CONGESTION_VEHICLES)}), got {array.shape}")
+    if np.any(array < 0):
+        raise ValueError("Vehicle counts must be non-negative.")
+    return array
 
+
+def iter_profile_adjusted_costs(a: dict, blocks: Iterable, capacity: float, lane_type: str,
+                                interval_hours: float = 1.0) -> Iterator[dict]:
+    """
+    Congestion-adjusted costs of a traffic profile, streamed block by block.
+
+    The V/C ratio of every interval is its traffic in PCU (constants.pcu)
+    over the capacity of the interval; the congestion factors of each interval
+    are applied to its own counts.
+
+    Parameters:
+    a (dict): Base cost data containing 'distanceCost' and 'timeCost' (output of voc.core.main).
+    blocks: Iterable of count blocks in any format accepted by profile_counts(), in time order.
+    capacity (float): Carriageway capacity in PCU per hour.
+    lane_type (str): Type of lane (e.g., "SL", "IL", "2L", "4L", "6L").
+    interval_hours (float): Length of one interval, e.g. 1 for hourly or 0.25 for 15-minute counts.
+
+    Yields:
+    dict: Running totals after every block, in the format of calculate_total_adjusted_costs
+    plus the number of intervals and the highest V/C ratio so far.
+    """
+    if not isinstance(capacity, (int, float)) or capacity <= 0:
+        raise ValueError(f"'capacity' must be a positive number. Provided: {capacity}")
+    if not isinstance(interval_hours, (int, float)) or interval_hours <= 0:
+        raise ValueError(f"'interval_hours' must be a positive number. Provided: {interval_hours}")
+
+    costs = _base_costs(a)
+    pcu_factors = np.array([pcu.get(vt, 1) for vt in cf.CONGESTION_VEHICLES], dtype=float)
+    totals = np.zeros(4)
+    intervals = 0
+    max_vc = 0.0
+
+    for block in blocks:
+        counts = profile_counts(block)
+        for start in range(0, counts.shape[0], PROFILE_CHUNK_SIZE):
+            chunk = counts[start:start + PROFILE_CHUNK_SIZE]
+            vc = chunk @ pcu_factors / (capacity * interval_hours)
+            cd = cf.congestion_factors(cf.DISTANCE_CONGESTION, lane_type, vc)
+            ct = cf.congestion_factors(cf.TIME_CONGESTION, lane_type, vc)
+            # Vehicle-kilometres per vehicle type weighted by the factors of their interval
+            distance_volume = np.einsum("tv,tv->v", chunk, cd)
+            time_volume = np.einsum("tv,tv->v", chunk, ct)
+            totals[0:2] += costs[0:2] @ distance_volume
+            totals[2:4] += costs[2:4] @ time_volume
+            intervals += chunk.shape[0]
+            if vc.size:
+                max_vc = max(max_vc, float(vc.max()))
+
+        distance_it, distance_et, time_it, time_et = totals.tolist()
+        yield {
+            "distance_total": {"IT": distance_it, "ET": distance_et},
+            "time_total": {"IT": time_it, "ET": time_et},
+            "total": {"IT": distance_it + time_it, "ET": distance_et + time_et},
+            "unit": "Rs/km",
+            "intervals": intervals,
+            "max_vc": max_vc,
+        }
+
+
+def calculate_profile_adjusted_costs(a: dict, counts, capacity: float, lane_type: str,
+                                     interval_hours: float = 1.0) -> dict:
+    """
+    Total congestion-adjusted costs over a traffic profile (e.g. the intervals of a detour period).
+
+    Parameters are those of iter_profile_adjusted_costs, with all counts given at once.
+    """
+    result = None
+    for result in iter_profile_adjusted_costs(a, [counts], capacity, lane_type, interval_hours):
+        pass
     return result
@@ -1,164 +1,189 @@
-def _cap_between_one_and_two(results: dict) -> dict:
-    return {
-        k: (1 if (x := v) < 1 else 2 if x > 2 else x)
-        if isinstance(v, (int, float))
-        else (_ for _ in ()).throw(ValueError(f"Non-numeric value for '{k}': {v}"))
-        for k, v in results.items()
-    }
+import numpy as np
+from ..utils.constants import vehicle_type_list
 
-# --------------------------------------------------------
-# Table 10 – Time-Related Congestion Factors
-# --------------------------------------------------------
-def time_congestion_factors(lane_type: str, vc: float) -> dict:
-    if type(vc) not in [int, float]:
-        raise ValueError(f"Volume to capacity ratio 'vc' must be a number, got {type(vc)} instead.")
+# Congestion factors are polynomials of the volume to capacity ratio 'vc',
+# stored as (lane, vehicle, degree) coefficient arrays, highest degree first
+# (np.polyval order). Factors are capped between 1 and 2.
 
-    if lane_type == "SL":
-        results = {
-            "small_cars": 0.747 + 1.458 * vc,
-            "big_cars": 0.747 + 1.458 * vc,
-            "two_wheelers": 0.911 + 0.807 * vc,
-            "buses": 0.838 + 1.307 * vc,
-            "lcv": 0.880 + 1.200 * vc,
-            "hcv": 0.858 + 1.101 * vc,
-            "mcv": 0.858 + 1.101 * vc
-        }
-
-    elif lane_type == "IL":
-        results = {
-            "small_cars": 0.930 + 1.025 * vc,
-            "big_cars": 0.930 + 1.025 * vc,
-            "two_wheelers": 0.776 + 0.728 * vc,
-            "buses": 0.942 + 0.670 * vc,
-            "lcv": 1.012 + 0.863 * vc,
-            "hcv": 0.920 + 1.033 * vc,
-            "mcv": 0.920 + 1.033 * vc
-        }
-
-    elif lane_type == "2L":
-        results = {
-            "small_cars": 1.087 + 0.483 * vc,
-            "big_cars": 1.087 + 0.483 * vc,
-            "two_wheelers": 0.804 + 0.865 * vc,
-            "buses": 0.864 + 0.543 * vc,
-            "lcv": 0.925 + 0.573 * vc,
-            "hcv": 0.878 + 0.561 * vc,
-            "mcv": 0.878 + 0.561 * vc
-        }
-
-    elif lane_type == "4L":
-        results = {
-            "small_cars": 0.4834*(vc**2) + 0.4095*vc + 0.99,
-            "big_cars": 0.4834*(vc**2) + 0.4095*vc + 0.99,
-            "two_wheelers": 1.1063*vc + 0.99,
-            "buses": 1.534*(vc**2) - 0.2301*vc + 0.99,
-            "lcv": 0.8441*(vc**2) + 0.4337*vc + 0.99,
-            "hcv": 1.1036*(vc**2) + 0.4124*vc + 0.99,
-            "mcv": 0.3709*(vc**2) + 0.4604*vc + 0.99
-        }
-
-    elif lane_type == "6L":
-        results = {
-            "small_cars": 2.1947*(vc**2) - 0.3352*vc + 1,
-            "big_cars": 2.1947*(vc**2) - 0.3352*vc + 1,
-            "two_wheelers": 0.8998*(vc**2) + 0.9407*vc + 1,
-            "buses": 0.9412*(vc**2) - 0.1881*vc + 1,
-            "lcv": 0.8441*(vc**2) + 0.4337*vc + 0.99,
-            "hcv": 1.593*(vc**2) - 0.0523*vc + 1,
-            "mcv": 1.0234*vc + 1
-        }
-
-    elif lane_type in ["8L", "EW"]:
-        results = {
-            "small_cars": -0.2441*(vc**2) + 0.9003*vc + 0.99,
-            "big_cars": -0.2441*(vc**2) + 0.9003*vc + 0.99,
-            "two_wheelers": 0.3973*vc + 1,
-            "buses": -0.0092*(vc**2) + 0.4559*vc + 1,
-            "lcv": -0.1476*(vc**2) + 0.5986*vc + 0.99,
-            "hcv": 0.2143*(vc**2) + 0.457*vc + 1,
-            "mcv": -0.373*(vc**2) + 0.7575*vc + 1
-        }
-
-    else:
-        raise ValueError("Unknown lane type. Use 'SL','IL','2L','4L','6L','8L'.")
+CONGESTION_LANES = ("SL", "IL", "2L", "4L", "6L", "8L", "EW")
+CONGESTION_LANE_INDEX = {lane: i for i, lane in enumerate(CONGESTION_LANES)}
+CONGESTION_VEHICLES = tuple(vehicle_type_list)
 
-    return _cap_between_one_and_two(results)
+MIN_FACTOR = 1
+MAX_FACTOR = 2
+
+
+def _coefficients(table: dict) -> np.ndarray:
+    """(lane, vehicle, 3) array of a table given as lane -> vehicle -> (vc^2, vc, constant)."""
+    array = np.array([[table[lane][vt] for vt in CONGESTION_VEHICLES] for lane in CONGESTION_LANES], dtype=float)
+    array.flags.writeable = False
+    return array
 
 
+# --------------------------------------------------------
+# Table 10 – Time-Related Congestion Factors
+# --------------------------------------------------------
+_TIME_8L = {
+    "small_cars": (-0.2441, 0.9003, 0.99),
+    "big_cars": (-0.2441, 0.9003, 0.99),
+    "two_wheelers": (0, 0.3973, 1),
+    "buses": (-0.0092, 0.4559, 1),
+    "lcv": (-0.1476, 0.5986, 0.99),
+    "hcv": (0.2143, 0.457, 1),
+    "mcv": (-0.373, 0.7575, 1)
+}
+TIME_CONGESTION = _coefficients({
+    "SL": {
+        "small_cars": (0, 1.458, 0.747),
+        "big_cars": (0, 1.458, 0.747),
+        "two_wheelers": (0, 0.807, 0.911),
+        "buses": (0, 1.307, 0.838),
+        "lcv": (0, 1.200, 0.880),
+        "hcv": (0, 1.101, 0.858),
+        "mcv": (0, 1.101, 0.858)
+    },
+    "IL": {
+        "small_cars": (0, 1.025, 0.930),
+        "big_cars": (0, 1.025, 0.930),
+        "two_wheelers": (0, 0.728, 0.776),
+        "buses": (0, 0.670, 0.942),
+        "lcv": (0, 0.863, 1.012),
+        "hcv": (0, 1.033, 0.920),
+        "mcv": (0, 1.033, 0.920)
+    },
+    "2L": {
+        "small_cars": (0, 0.483, 1.087),
+        "big_cars": (0, 0.483, 1.087),
+        "two_wheelers": (0, 0.865, 0.804),
+        "buses": (0, 0.543, 0.864),
+        "lcv": (0, 0.573, 0.925),
+        "hcv": (0, 0.561, 0.878),
+        "mcv": (0, 0.561, 0.878)
+    },
+    "4L": {
+        "small_cars": (0.4834, 0.4095, 0.99),
+        "big_cars": (0.4834, 0.4095, 0.99),
+        "two_wheelers": (0, 1.1063, 0.99),
+        "buses": (1.534, -0.2301, 0.99),
+        "lcv": (0.8441, 0.4337, 0.99),
+        "hcv": (1.1036, 0.4124, 0.99),
+        "mcv": (0.3709, 0.4604, 0.99)
+    },
+    "6L": {
+        "small_cars": (2.1947, -0.3352, 1),
+        "big_cars": (2.1947, -0.3352, 1),
+        "two_wheelers": (0.8998, 0.9407, 1),
+        "buses": (0.9412, -0.1881, 1),
+        "lcv": (0.8441, 0.4337, 0.99),
+        "hcv": (1.593, -0.0523, 1),
+        "mcv": (0, 1.0234, 1)
+    },
+    "8L": _TIME_8L,
+    "EW": _TIME_8L,
+})
+
 # --------------------------------------------------------
 # Table 11 – Distance-Related Congestion Factors
 # --------------------------------------------------------
-def distance_congestion_factors(lane_type: str, vc: float) -> dict:
-    if type(vc) not in [int, float]:
-        raise ValueError(f"'vc' must be numeric, got {type(vc)}")
-
-    if lane_type == "SL":
-        results = {
-            "small_cars": 0.924 + 0.680 * vc,
-            "big_cars": 0.924 + 0.680 * vc,
-            "two_wheelers": 0.990 + 0.830 * vc,
-            "buses": 1.000 + 1.000 * vc,
-            "lcv": 1.00 + 0.90 * vc,
-            "hcv": 1.179 + 0.757 * vc,
-            "mcv": 1.179 + 0.757 * vc
-        }
-
-    elif lane_type == "IL":
-        results = {
-            "small_cars": 0.924 + 0.635 * vc,
-            "big_cars": 0.924 + 0.635 * vc,
-            "two_wheelers": 0.942 + 0.118 * vc,
-            "buses": 0.800 + 1.200 * vc,
-            "lcv": 0.90 + 1.00 * vc,
-            "hcv": 1.104 + 0.755 * vc,
-            "mcv": 1.104 + 0.755 * vc
-        }
-
-    elif lane_type == "2L":
-        results = {
-            "small_cars": 0.893 + 0.259 * vc,
-            "big_cars": 0.893 + 0.259 * vc,
-            "two_wheelers": 0.917 + 0.112 * vc,
-            "buses": 0.800 + 1.10 * vc,
-            "lcv": 0.90 + 1.00 * vc,
-            "hcv": 0.925 + 0.482 * vc,
-            "mcv": 0.900 + 1.40 * vc
-        }
-
-    elif lane_type == "4L":
-        results = {
-            "small_cars": 2.4405*(vc**2) - 2.8919*vc + 1.8939,
-            "big_cars": 3.713*(vc**2) - 4.2811*vc + 2.2173,
-            "two_wheelers": 4.9774*(vc**2) - 4.8846*vc + 2.1831,
-            "buses": 3.713*(vc**2) - 4.2811*vc + 2.2173,
-            "lcv": 2.2518*(vc**2) - 1.2471*vc + 1.1348,
-            "hcv": 2.8147*(vc**2) - 1.5589*vc + 1.4185,
-            "mcv": 3.6591*(vc**2) - 2.0266*vc + 1.8441
-        }
-
-    elif lane_type == "6L":
-        results = {
-            "small_cars": 2.8163*(vc**2) - 3.1278*vc + 1.9629,
-            "big_cars": 4.3108*(vc**2) - 4.6276*vc + 2.3129,
-            "two_wheelers": 5.6528*(vc**2) - 4.5691*vc + 1.9083,
-            "buses": 4.3108*(vc**2) - 4.6276*vc + 2.3129,
-            "lcv": 14.990*(vc**2) - 12.014*vc + 3.2242,
-            "hcv": 18.737*(vc**2) - 15.017*vc + 4.0302,
-            "mcv": 24.3581*(vc**2) - 19.522*vc + 5.2393
-        }
-
-    elif lane_type in ["8L", "EW"]:
-        results = {
-            "small_cars": 0.5239*(vc**2) - 0.9289*vc + 1.4847,
-            "big_cars": 0.7734*(vc**2) - 1.3037*vc + 1.596,
-            "two_wheelers": 2.4879*(vc**2) - 3.9095*vc + 2.6253,
-            "buses": 0.7734*(vc**2) - 1.3037*vc + 1.596,
-            "lcv": 0.7707*(vc**2) - 0.7214*vc + 1.0232,
-            "hcv": 0.9634*(vc**2) - 0.9018*vc + 1.279,
-            "mcv": 1.2524*(vc**2) - 1.1723*vc + 1.6627
-        }
-
-    else:
+_DISTANCE_8L = {
+    "small_cars": (0.5239, -0.9289, 1.4847),
+    "big_cars": (0.7734, -1.3037, 1.596),
+    "two_wheelers": (2.4879, -3.9095, 2.6253),
+    "buses": (0.7734, -1.3037, 1.596),
+    "lcv": (0.7707, -0.7214, 1.0232),
+    "hcv": (0.9634, -0.9018, 1.279),
+    "mcv": (1.2524, -1.1723, 1.6627)
+}
+DISTANCE_CONGESTION = _coefficients({
+    "SL": {
+        "small_cars": (0, 0.680, 0.924),
+        "big_cars": (0, 0.680, 0.924),
+        "two_wheelers": (0, 0.830, 0.990),
+        "buses": (0, 1.000, 1.000),
+        "lcv": (0, 0.90, 1.00),
+        "hcv": (0, 0.757, 1.179),
+        "mcv": (0, 0.757, 1.179)
+    },
+    "IL": {
+        "small_cars": (0, 0.635, 0.924),
+        "big_cars": (0, 0.635, 0.924),
+        "two_wheelers": (0, 0.118, 0.942),
+        "buses": (0, 1.200, 0.800),
+        "lcv": (0, 1.00, 0.90),
+        "hcv": (0, 0.755, 1.104),
+        "mcv": (0, 0.755, 1.104)
+    },
+    "2L": {
+        "small_cars": (0, 0.259, 0.893),
+        "big_cars": (0, 0.259, 0.893),
+        "two_wheelers": (0, 0.112, 0.917),
+        "buses": (0, 1.10, 0.800),
+        "lcv": (0, 1.00, 0.90),
+        "hcv": (0, 0.482, 0.925),
+        "mcv": (0, 1.40, 0.900)
+    },
+    "4L": {
+        "small_cars": (2.4405, -2.8919, 1.8939),
+        "big_cars": (3.713, -4.2811, 2.2173),
+        "two_wheelers": (4.9774, -4.8846, 2.1831),
+        "buses": (3.713, -4.2811, 2.2173),
+        "lcv": (2.2518, -1.2471, 1.1348),
+        "hcv": (2.8147, -1.5589, 1.4185),
+        "mcv": (3.6591, -2.0266, 1.8441)
+    },
+    "6L": {
+        "small_cars": (2.8163, -3.1278, 1.9629),
+        "big_cars": (4.3108, -4.6276, 2.3129),
+        "two_wheelers": (5.6528, -4.5691, 1.9083),
+        "buses": (4.3108, -4.6276, 2.3129),
+        "lcv": (14.990, -12.014, 3.2242),
+        "hcv": (18.737, -15.017, 4.0302),
+        "mcv": (24.3581, -19.522, 5.2393)
+    },
+    "8L": _DISTANCE_8L,
+    "EW": _DISTANCE_8L,
+})
+
+
+def congestion_factors(coefficients: np.ndarray, lane_type: str, vc) -> np.ndarray:
+    """
+    Congestion factors of every vehicle type for one or many V/C ratios.
+
+    Args:
+        coefficients: TIME_CONGESTION or DISTANCE_CONGESTION
+        lane_type: One of CONGESTION_LANES
+        vc: Volume to capacity ratio, a number or an array of any shape
+
+    Returns:
+        Array of shape vc.shape + (len(CONGESTION_VEHICLES),), capped between 1 and 2
+    """
+    lane = CONGESTION_LANE_INDEX.get(lane_type)
+    if lane is None:
         raise ValueError("Unknown lane type. Use 'SL','IL','2L','4L','6L','8L'.")
+    if isinstance(vc, (bool, str)):
+        raise ValueError(f"Volume to capacity ratio 'vc' must be a number, got {type(vc)} instead.")
+    try:
+        vc = np.asarray(vc, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError(f"Volume to capacity ratio 'vc' must be a number, got {type(vc)} instead.")
+
+    # np.polyval over the degree axis: (degree, vehicle) coefficients against (..., 1) ratios
+    factors = np.polyval(coefficients[lane].T, vc[..., np.newaxis])
+    return np.clip(factors, MIN_FACTOR, MAX_FACTOR)
+
+
+def _by_vehicle(factors: np.ndarray) -> dict:
+    """Vehicle type -> factor (a float, or an array for an array of ratios)."""
+    if factors.ndim == 1:
+        return dict(zip(CONGESTION_VEHICLES, factors.tolist()))
+    return {vt: factors[..., j] for j, vt in enumerate(CONGESTION_VEHICLES)}
+
+
+def time_congestion_factors(lane_type: str, vc) -> dict:
+    """Table 10 factors by vehicle type; vc may be a number or an array."""
+    return _by_vehicle(congestion_factors(TIME_CONGESTION, lane_type, vc))
+
 
-    return _cap_between_one_and_two(results)
+def distance_congestion_factors(lane_type: str, vc) -> dict:
+    """Table 11 factors by vehicle type; vc may be a number or an array."""
+    return _by_vehicle(congestion_factors(DISTANCE_CONGESTION, lane_type, vc))
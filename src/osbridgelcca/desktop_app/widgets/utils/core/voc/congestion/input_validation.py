@@ -1,4 +1,4 @@
-from voc.utils import carriage_way_standards
+from ..utils import carriage_way_standards
 
 def validate(a, vc, lane_type, vehicle_input, debug=False):
     errors = []
@@ -63,9 +63,9 @@ def validate(a, vc, lane_type, vehicle_input, debug=False):
             elif not isinstance(pwr, (int, float)) or pwr <= 0:
                 errors.append(f"power_weight_ratio_pwr must be numeric and > 0. Provided: {pwr}")
 
-        # Check carriageway_width
+        # Check carriageway_width (standard lanes fall back on their standard width)
         width = vehicle_input.get("carriageway_width")
-        if width is None or not isinstance(width, (int, float)) or width <= 0:
+        if (width is not None or lane_type == "EW") and (not isinstance(width, (int, float)) or width <= 0):
             errors.append(f"'carriageway_width' must be positive number. Provided: {width}")
 
     # -----------------------------
@@ -1,70 +1,135 @@
-from .utils.input_validation import validate_input
-from .vehicle_types import big_cars, buses, hcv, lcv, mcv, small_cars, two_wheeler
+import importlib
+from collections.abc import Mapping
+from .utils.input_validation import prepare_input
 from .utils import post_processor as pp
-import sys
-
-# Map vehicle_info keys to their model modules
-MODEL_MAP = {
-    "big_cars": big_cars,
-    "small_cars": small_cars,
-    "two_wheelers": two_wheeler,
-    "buses": buses,
-    "hcv": hcv,
-    "lcv": lcv,
-    "mcv": mcv,
+
+# Map vehicle_info keys to the names of their model modules in vehicle_types/
+MODEL_MODULES = {
+    "big_cars": "big_cars",
+    "small_cars": "small_cars",
+    "two_wheelers": "two_wheeler",
+    "buses": "buses",
+    "hcv": "hcv",
+    "lcv": "lcv",
+    "mcv": "mcv",
 }
 
-def main(vehicle_input, wpi, debug = False):
+
+class LazyModelMap(Mapping):
+    """
+    Vehicle type -> model module, importing each module on first access.
+
+    Only the models of vehicle types with a nonzero count are ever loaded,
+    which keeps the import of the VOC engine cheap for workers.
+    """
+
+    def __init__(self, modules):
+        self._modules = dict(modules)
+        self._loaded = {}
+
+    def __getitem__(self, vt):
+        try:
+            return self._loaded[vt]
+        except KeyError:
+            module = importlib.import_module(f".vehicle_types.{self._modules[vt]}", __package__)
+            self._loaded[vt] = module
+            return module
+
+    def __iter__(self):
+        return iter(self._modules)
+
+    def __len__(self):
+        return len(self._modules)
+
+    def loaded(self):
+        """Vehicle types whose model has been loaded."""
+        return list(self._loaded)
+
+
+MODEL_MAP = LazyModelMap(MODEL_MODULES)
+
+
+def model_input(vehicle_input, vt):
+    """
+    Input of one vehicle model, in the format expected by compute_voc().
+
+    Parameters:
+    vehicle_input (dict): Validated input data of the whole fleet.
+    vt (str): Vehicle type (key of vehicle_info).
+    """
+    input_for_model = {
+        **{k: v for k, v in vehicle_input.items() if k != "vehicle_info"},
+        "vehicle_type": vt,
+        "rf_rise_and_fall_factor": vehicle_input.get("fl_fall_factor", 0)
+                                   + vehicle_input.get("rs_rise_factor", 0)
+    }
+
+    # Adapt power_weight_ratio_pwr if it's a dict
+    if isinstance(vehicle_input.get("power_weight_ratio_pwr"), dict):
+        input_for_model["power_weight_ratio_pwr"] = vehicle_input["power_weight_ratio_pwr"].get(vt, 0)
+
+    return input_for_model
+
+
+def run_models(vehicle_input, cache=None):
+    """
+    Execute the vehicle model of every vehicle type with count > 0.
+
+    Parameters:
+    vehicle_input (dict): Validated input data of the whole fleet.
+    cache (VOCCache): Optional cache to look the model results up in.
+
+    Returns:
+    dict: Vehicle type -> output of build_voc_output() (or an error entry if no model exists).
+    """
+    results = {}
+    for vt, count in vehicle_input.get("vehicle_info", {}).items():
+        if count > 0:
+            model_module = MODEL_MAP.get(vt)
+            if model_module is None:
+                results[vt] = {"status": "error",
+                               "message": f"No model available for '{vt}'."}
+            elif cache is not None:
+                results[vt] = cache.get(model_input(vehicle_input, vt), model_module.compute_voc)
+            else:
+                results[vt] = model_module.compute_voc(model_input(vehicle_input, vt))
+    return results
+
+
+def main(vehicle_input, wpi, debug = False, cache=None, trusted=False, trace=None):
     """
     Validates input and executes the correct vehicle models for all vehicles with count > 0.
-    Adapts input to match the old format expected by model_module.test().
+
+    The pipeline runs in four stages: validate -> model -> post-process -> aggregate.
+    Post-processing (WPI adjustment) runs once over the whole fleet, after all
+    vehicle models, so its cost grows linearly with the number of vehicle types.
 
     Parameters:
     vehicle_input (dict): Input data containing vehicle counts and other parameters.
     wpi (dict): Wholesale Price Index data for cost adjustments.
-    debug (bool): If True, includes detailed breakdown of calculations. Files generated in the `debug` folder.
+    debug (bool): If True, traces the detailed breakdown of calculations to debug/<run>/trace.jsonl
+        (one run directory per process, written in the background). Ignored when a trace is given.
+    cache (VOCCache): Optional cache of vehicle model results, shared between calls with the
+        same lane and road condition (e.g. the bridges of a network). Results are WPI independent.
+    trusted (bool): Skip input validation, for batch callers that validated the inputs upstream.
+    trace (TraceSink): Optional sink receiving the model outputs, WPI adjusted values and summary
+        (e.g. a JSONLTraceSink writing them in the background). Nothing is traced without a sink.
+
+    Raises:
+    VOCInputError: (a ValueError) if the input is invalid. The input is never modified.
     """
 
     # --------------------
     # 1. Validate input
     # --------------------
+    vehicle_input = prepare_input(vehicle_input, trusted)
 
     # --------------------
-    # 1. Validate input
+    # 2. Vehicle model execution
     # --------------------
-    try:
-        validate_input(vehicle_input)
-    except ValueError as e:
-        print("Input validation failed:\n", str(e))
-        sys.exit(1)  # Terminate the program with an error code
-
+    results = run_models(vehicle_input, cache)
 
     # --------------------
-    # 2. Vehicle model execution
+    # 3. WPI post-processing of the whole fleet and 4. aggregation
     # --------------------
-    vehicle_info = vehicle_input.get("vehicle_info", {})
-    results = {}
-
-    for vt, count in vehicle_info.items():
-        if count > 0:
-            model_module = MODEL_MAP.get(vt)
-            if model_module is None:
-                results[vt] = {"status": "error",
-                            "message": f"No model available for '{vt}'."}
-            else:
-                # Keep input_for_model same structure as before
-                input_for_model = {
-                    **{k: v for k, v in vehicle_input.items() if k != "vehicle_info"},
-                    "vehicle_type": vt,
-                    "rf_rise_and_fall_factor": vehicle_input.get("fl_fall_factor", 0)
-                                            + vehicle_input.get("rs_rise_factor", 0)
-                }
-
-                # Adapt power_weight_ratio_pwr if it's a dict
-                if isinstance(vehicle_input.get("power_weight_ratio_pwr"), dict):
-                    input_for_model["power_weight_ratio_pwr"] = vehicle_input["power_weight_ratio_pwr"].get(vt, 0)
-
-                results[vt] = model_module.compute_voc(input_for_model)
-                summaryOfVOC = pp.post_process(results, wpi, debug)
-
-    return summaryOfVOC
+    return pp.post_process(results, wpi, debug, trace)
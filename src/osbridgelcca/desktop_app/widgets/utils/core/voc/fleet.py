@@ -0,0 +1,329 @@
+from typing import Dict, Mapping, Sequence, Union
+import numpy as np
+from ..IRC_standards.IRCSP30_2019 import vehicle_costs
+from .utils.carriage_way_standards import CarriagewayStandards
+from .utils.constants import vehicle_type_list
+from .utils.output_builder import VOCResult
+
+# Fleet VOC model: the formulas of the modules in vehicle_types/ written once,
+# with the coefficients of every vehicle class in tables. All vehicle classes
+# and any number of road points are evaluated in one NumPy computation.
+#
+# Axes: FLEET_VEHICLES (last axis of the result) and LANE_TYPES.
+
+FLEET_VEHICLES = tuple(vehicle_type_list)
+LANE_TYPES = tuple(CarriagewayStandards.list_types()[0])
+LANE_INDEX = {lane: i for i, lane in enumerate(LANE_TYPES)}
+
+# Roughness is measured from 2000 mm/km in the speed formulas of these lanes
+RG_OFFSET = np.array([2000.0 if lane in ("SL", "IL", "2L") else 0.0 for lane in LANE_TYPES])
+
+# Standard carriageway width of every lane (NaN for 'EW', which needs a custom width)
+STANDARD_WIDTH = np.array([np.nan if width is None else width
+                           for width in (CarriagewayStandards.get_width(lane)[0] for lane in LANE_TYPES)])
+
+# Speed (kmph): const + rf * RF + rg * (RG - RG_OFFSET) + w * W, one row per lane in LANE_TYPES order
+SPEED = {
+    "small_cars": [(66.44, -0.6922, -0.002874, 0.0), (73.16, -0.7298, -0.002231, 0.0),
+                   (81.19, -0.7892, -0.001891, 0.0), (100.625, -0.394, -0.00330, 0.0),
+                   (101.065, -0.386, -0.00323, 0.0), (103.517, -0.386, -0.00323, 0.0),
+                   (93.71, -0.386, -0.00323, 0.701)],
+    "big_cars": [(67.04, -0.6984, -0.002956, 0.0), (73.82, -0.7364, -0.002251, 0.0),
+                 (81.92, -0.7963, -0.001915, 0.0), (100.625, -0.394, -0.00330, 0.0),
+                 (104.159, -0.398, -0.00333, 0.0), (107.743, -0.402, -0.00337, 0.0),
+                 (97.53, -0.402, -0.00337, 0.729)],
+    "two_wheelers": [(52.91, -0.6922, -0.002874, 0.0), (58.86, -0.7298, -0.002231, 0.0),
+                     (59.71, -0.7892, -0.001891, 0.0), (78.57, -0.7235, -0.001729, 0.0),
+                     (81.35, -0.7235, -0.001729, 0.0), (82.73, -0.7235, -0.001729, 0.0),
+                     (77.19, -0.7235, -0.001729, 0.396)],
+    "buses": [(47.25, -0.3698, -0.00165, 0.0), (52.65, -0.4031, -0.00123, 0.0),
+              (54.23, -0.4111, -0.00098, 0.0), (75.43, -0.214, -0.00198, 0.0),
+              (77.58, -0.214, -0.00198, 0.0), (79.73, -0.214, -0.00198, 0.0),
+              (71.13, -0.214, -0.00198, 0.614)],
+    "lcv": [(49.87, -0.4447, -0.00088, 0.0), (53.70, -0.4788, -0.00095, 0.0),
+            (57.41, -0.5119, -0.00102, 0.0), (74.897, -0.163, -0.0031, 0.0),
+            (77.036, -0.163, -0.0031, 0.0), (79.174, -0.163, -0.0031, 0.0),
+            (70.620, -0.163, -0.0031, 0.611)],
+    "hcv": [(48.29, -0.4306, -0.00086, 0.0), (53.12, -0.4736, -0.00094, 0.0),
+            (56.52, -0.5040, -0.00100, 0.0), (75.15, -0.6487, -0.001285, 0.0),
+            (77.17, -0.6487, -0.001285, 0.0), (79.19, -0.6487, -0.001285, 0.0),
+            (71.11, -0.6487, -0.001285, 0.577)],
+    "mcv": [(38.27, -0.3412, -0.00068, 0.0), (42.01, -0.3753, -0.00074, 0.0),
+            (44.79, -0.3994, -0.00079, 0.0), (74.16, -0.6405, -0.00128, 0.0),
+            (76.60, -0.6405, -0.00128, 0.0), (79.03, -0.6405, -0.00128, 0.0),
+            (69.29, -0.6405, -0.00128, 0.696)],
+}
+
+# Fuel (liters per 1000 km): c0 + c1 / V + c2 * V^2 + rg * RG + rs * RS + fl * FL + pwr * PWR
+_NO_FUEL = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+PETROL = {
+    "small_cars": (30, 844.085, 0.003, 0.001, 0.3414, -0.2225, 0.0),
+    "big_cars": (30, 844.085, 0.003, 0.001, 0.3414, -0.2225, 0.0),
+    "two_wheelers": (2.704, 439.656, 0.00349, 0.000157, 0.3642, -0.2709, 0.0),
+    "buses": _NO_FUEL, "lcv": _NO_FUEL, "hcv": _NO_FUEL, "mcv": _NO_FUEL,
+}
+DIESEL = {
+    "small_cars": (35, 983.503, 0.003, 0.002, 0.339, -0.4785, 0.0),
+    "big_cars": (35, 983.503, 0.003, 0.002, 0.339, -0.4785, 0.0),
+    "two_wheelers": _NO_FUEL,
+    "buses": (34.23, 4054.42, 0.02149, 0.001246, 3.4557, -1.8454, 0.0),
+    "lcv": (22.504, 1708.244, 0.02591, 0.001612, 5.6863, -0.8744, 0.0),
+    "hcv": (50, 8049.955, 0.012, 0.005, 4.565, -4.904, -7.285),
+    "mcv": (90, 14489.919, 0.0216, 0.01, 8.217, -8.8272, -13.113),
+}
+
+# Spare parts (fraction of the new vehicle price per 1000 km), either
+# linear: (a + b * (RG - 2000)) * 1e-5
+# or exponential: exp(c0 + rf * RF + rg * RG + w / W), c0 differs for ET and IT
+SPARE_PARTS_LINEAR = {
+    "small_cars": (0.0, 0.0075), "big_cars": (0.0, 0.0045), "two_wheelers": (-7.879, 0.024),
+}
+SPARE_PARTS_EXP = {  # (c0 ET, c0 IT, rf, rg, w)
+    "buses": (-9.7871, -10.1126, 0.007373, 0.0000723, 1.925),
+    "lcv": (-10.5615, -10.5615, 0.0, 0.000141, 3.493),
+    "hcv": (-9.492638, -9.492638, 0.0, 0.0001413, 3.493),
+    "mcv": (-9.492638, -9.492638, 0.0, 0.0001413, 3.493),
+}
+# Maintenance labour per unit of spare parts (ET)
+MAINTENANCE_LABOUR = {
+    "small_cars": 1.79934, "big_cars": 1.79934, "two_wheelers": 0.5498, "buses": 1.1781,
+    "lcv": 0.85773, "hcv": 0.7912, "mcv": 0.7912,
+}
+
+# Tyre life (km/tyre): c0 + rf * RF + rg * RG + rgw * RG / W + w * W
+TYRE_LIFE = {
+    "small_cars": (68771, -147.9, 0.0, -26.72, 0.0),
+    "big_cars": (68771, -147.9, 0.0, -26.72, 0.0),
+    "two_wheelers": (47340, -101.8, 0.0, -18.39, 0.0),
+    "buses": (38519, -389.52, -1.32, 0.0, 983.829),
+    "lcv": (22382, -375.3, -1.037, 0.0, 3817),
+    "hcv": (24662, -413.6, -1.142, 0.0, 4205),
+    "mcv": (23726, -398, -1.0099, 0.0, 4046),
+}
+# Engine oil (liters per 1000 km): c0 + rf * RF + rgw * RG / W
+ENGINE_OIL = {
+    "small_cars": (1.8807, 0.036615, 0.000578),
+    "big_cars": (1.8807, 0.036615, 0.000578),
+    "two_wheelers": (0.405, 0.007899, 0.000125),
+    "buses": (0.4303, 0.001494, 0.0007885),
+    "lcv": (0.80679, 0.019496, 0.0001297),
+    "hcv": (1.0277, 0.02495, 0.0001782),
+    "mcv": (1.3826, 0.03348, 0.002319),
+}
+# Other oil (liters per 10000 km): c0 + rf * RF + rg * RG + rgw * RG / W + w * W
+OTHER_OIL = {
+    "small_cars": (1.631, 0.05167, 0.0, 0.001867, 0.0),
+    "big_cars": (1.631, 0.05167, 0.0, 0.001867, 0.0),
+    "two_wheelers": (0.0, 0.0, 0.0, 0.0, 0.0),
+    "buses": (3.3201, 0.002889, 0.0008217, 0.0, -0.3295),
+    "lcv": (2.0415, 0.0, 0.0001058, 0.0, 0.0),
+    "hcv": (5.1037, 0.0, 0.0002646, 0.0, 0.0),
+    "mcv": (5.1037, 0.0, 0.0002646, 0.0, 0.0),
+}
+# Grease (liters per 10000 km): c0 + rf * RF + rg * RG + w * W
+GREASE = {
+    "small_cars": (2.816, 0.2007, 0.0, 0.0),
+    "big_cars": (2.816, 0.2007, 0.0, 0.0),
+    "two_wheelers": (0.0, 0.0, 0.0, 0.0),
+    "buses": (4.992, 0.03376, 0.0, 0.3634),
+    "lcv": (0.3661, 0.0283, 0.000251, 0.0),
+    "hcv": (0.9153, 0.0707, 0.000627, 0.0),
+    "mcv": (0.9153, 0.0707, 0.000627, 0.0),
+}
+
+# Utilisation: c0 + v * V
+UTILISATION = {
+    "small_cars": (0.0, 6.7127), "big_cars": (0.0, 6.7378), "two_wheelers": (0.0, 2.119),
+    "buses": (22.7134, 12.2569), "lcv": (28.807, 2.1836), "hcv": (55.6719, 4.22), "mcv": (77.7233, 5.8915),
+}
+# Time related costs divided by the utilisation: (fixed ET, fixed IT, depreciation ET, depreciation IT)
+FIXED_DEPRECIATION = {
+    "small_cars": (395.65, 400.61, 42.83, 76.68),
+    "big_cars": (395.65, 400.61, 42.83, 76.68),
+    "two_wheelers": (24.32, 24.86, 4.26, 5.85),
+    "buses": (772.89, 1415.09, 221.00, 355.71),
+    "lcv": (723.80, 829.56, 120.90, 173.51),
+    "hcv": (924.28, 1056.82, 154.84, 256.80),
+    "mcv": (1238.28, 1479.30, 238.54, 425.84),
+}
+# Passenger time cost per lane (LANE_TYPES order): cars and two wheelers divide by the
+# speed, buses by the utilisation
+_NO_LANE_COST = (0.0,) * 7
+PASSENGER_TIME_PER_SPEED = {
+    "small_cars": (244.07, 244.07, 328.06, 498.65, 498.65, 498.65, 721.73),
+    "big_cars": (244.07, 244.07, 328.06, 721.73, 721.73, 721.73, 721.73),
+    "two_wheelers": (49.28, 49.28, 70.29, 70.77, 70.77, 70.77, 70.77),
+    "buses": _NO_LANE_COST, "lcv": _NO_LANE_COST, "hcv": _NO_LANE_COST, "mcv": _NO_LANE_COST,
+}
+PASSENGER_TIME_PER_UTILISATION = {
+    "small_cars": _NO_LANE_COST, "big_cars": _NO_LANE_COST, "two_wheelers": _NO_LANE_COST,
+    "buses": (7297.63, 7297.63, 15509.80, 23721.98, 23721.98, 23721.98, 28385.28),
+    "lcv": _NO_LANE_COST, "hcv": _NO_LANE_COST, "mcv": _NO_LANE_COST,
+}
+# Crew cost divided by the utilisation
+CREW = {"small_cars": 0.0, "big_cars": 0.0, "two_wheelers": 0.0, "buses": 3775.3,
+        "lcv": 900, "hcv": 1500, "mcv": 1800}
+# Commodity holding cost per lane divided by the utilisation. MCVs are not
+# typically used on 'SL' and 'IL' roads; their cost is 0 there.
+COMMODITY_HOLDING = {
+    "small_cars": _NO_LANE_COST, "big_cars": _NO_LANE_COST, "two_wheelers": _NO_LANE_COST,
+    "buses": _NO_LANE_COST,
+    "lcv": (64.71, 64.71, 71.35, 149.12, 149.12, 149.12, 149.12),
+    "hcv": (182.79, 182.79, 218.75, 1084.14, 1084.14, 1084.14, 1084.14),
+    "mcv": (0.0, 0.0, 409.28, 1707.37, 1707.37, 1707.37, 1707.37),
+}
+
+# Fields of the result: the numeric fields of VOCResult, in the same units
+FLEET_VOC_FIELDS = VOCResult._fields[2:]
+FLEET_VOC_DTYPE = np.dtype([(name, float) for name in FLEET_VOC_FIELDS])
+
+
+def _table(coefficients: Mapping[str, Sequence[float]]) -> np.ndarray:
+    """Coefficient table as an array with one row per vehicle of FLEET_VEHICLES."""
+    array = np.array([coefficients[vt] for vt in FLEET_VEHICLES], dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+_SPEED_BY_LANE = _table(SPEED).transpose(1, 0, 2)          # (lane, vehicle, 4)
+_PETROL = _table(PETROL)                                    # (vehicle, 7)
+_DIESEL = _table(DIESEL)
+_SPARE_PARTS_IS_EXP = np.array([vt in SPARE_PARTS_EXP for vt in FLEET_VEHICLES])
+_SPARE_PARTS_LINEAR = _table({vt: SPARE_PARTS_LINEAR.get(vt, (0.0, 0.0)) for vt in FLEET_VEHICLES})
+_SPARE_PARTS_EXP = _table({vt: SPARE_PARTS_EXP.get(vt, (0.0,) * 5) for vt in FLEET_VEHICLES})
+_NEW_PRICE = _table({vt: (vehicle_costs[vt]["ET"], vehicle_costs[vt]["IT"]) for vt in FLEET_VEHICLES})
+_MAINTENANCE_LABOUR = _table(MAINTENANCE_LABOUR)
+_TYRE_LIFE = _table(TYRE_LIFE)
+_ENGINE_OIL = _table(ENGINE_OIL)
+_OTHER_OIL = _table(OTHER_OIL)
+_GREASE = _table(GREASE)
+_UTILISATION = _table(UTILISATION)
+_FIXED_DEPRECIATION = _table(FIXED_DEPRECIATION)
+_PASSENGER_TIME_PER_SPEED = _table(PASSENGER_TIME_PER_SPEED)  # (vehicle, lane)
+_PASSENGER_TIME_PER_UTILISATION = _table(PASSENGER_TIME_PER_UTILISATION)
+_CREW = _table(CREW)
+_COMMODITY_HOLDING = _table(COMMODITY_HOLDING)
+
+
+def lane_codes(lanes) -> np.ndarray:
+    """Integer codes (LANE_INDEX) of one lane type or an array of lane types."""
+    lanes = np.asarray(lanes)
+    unique, inverse = np.unique(lanes, return_inverse=True)
+    try:
+        codes = np.array([LANE_INDEX[lane] for lane in unique.tolist()], dtype=int)
+    except KeyError as e:
+        raise ValueError(f"Invalid lane type: {e}. Valid options: {list(LANE_TYPES)}")
+    return codes[inverse].reshape(lanes.shape)
+
+
+def _pwr_per_vehicle(pwr) -> np.ndarray:
+    """Power to weight ratio of every vehicle as a (vehicle,) or (..., vehicle) array."""
+    if isinstance(pwr, Mapping):
+        return np.stack([np.asarray(pwr.get(vt, 0.0), dtype=float) for vt in FLEET_VEHICLES], axis=-1)
+    return np.asarray(pwr, dtype=float)[..., np.newaxis]
+
+
+def fleet_voc(RG, lane: Union[str, Sequence[str]] = "2L", RS=0.0, FL=0.0, RF=None, W=None,
+              pwr: Union[float, Dict[str, float]] = None) -> np.ndarray:
+    """
+    Vehicle operating cost inputs of all vehicle classes at one or many road points.
+
+    All arguments are broadcast against each other; the result has their
+    broadcast shape plus a last axis over FLEET_VEHICLES.
+
+    Args:
+        RG: Roughness (mm/km)
+        lane: Lane type(s), see LANE_TYPES
+        RS: Rise (m/km)
+        FL: Fall (m/km)
+        RF: Rise and fall (m/km); RS + FL when not given
+        W: Carriageway width (m), used for 'EW' lanes only; the other lanes use their standard width
+        pwr: Power to weight ratio of HCVs and MCVs, a number or a dict by vehicle type
+
+    Returns:
+        Structured array of dtype FLEET_VOC_DTYPE, values as in VOCResult (negative values
+        clipped to 0, spare parts and maintenance labour in Rs/km)
+
+    Raises:
+        ValueError: For unknown lane types, 'EW' points without a positive width, or a missing pwr
+    """
+    if pwr is None:
+        raise ValueError("Power to weight ratio (pwr) must be provided for HCV and MCV vehicles.")
+    if RF is None:
+        RF = np.add(FL, RS)
+
+    lane_code = lane_codes(lane)
+    width = STANDARD_WIDTH[lane_code]
+    if W is not None:
+        width = np.where(np.isnan(width), W, width)
+    if not np.all(width > 0):
+        raise ValueError("For Expressway type, 'carriageway_width' must be a positive number (custom width required).")
+
+    RG, RS, FL, RF, width, lane_code = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (RG, RS, FL, RF, width)), lane_code)
+    shape = RG.shape
+    # Inputs as (..., 1) columns broadcast against the (vehicle,) coefficients
+    RG, RS, FL, RF, W = (x[..., np.newaxis] for x in (RG, RS, FL, RF, width))
+    PWR = _pwr_per_vehicle(pwr)
+
+    # Speed
+    speed = _SPEED_BY_LANE[lane_code]  # (..., vehicle, 4)
+    rg_offset = RG_OFFSET[lane_code][..., np.newaxis]
+    V = speed[..., 0] + speed[..., 1] * RF + speed[..., 2] * (RG - rg_offset) + speed[..., 3] * W
+
+    def fuel(c):
+        return (c[:, 0] + c[:, 1] / V + c[:, 2] * V ** 2 + c[:, 3] * RG + c[:, 4] * RS + c[:, 5] * FL
+                + c[:, 6] * PWR)
+
+    # Spare parts and maintenance labour
+    linear = (_SPARE_PARTS_LINEAR[:, 0] + _SPARE_PARTS_LINEAR[:, 1] * (RG - 2000)) * 1e-5
+    e = _SPARE_PARTS_EXP
+    exponent = e[:, 2] * RF + e[:, 3] * RG + e[:, 4] / W
+    SP_ET = np.where(_SPARE_PARTS_IS_EXP, np.exp(e[:, 0] + exponent), linear) * _NEW_PRICE[:, 0]
+    SP_IT = np.where(_SPARE_PARTS_IS_EXP, np.exp(e[:, 1] + exponent), linear) * _NEW_PRICE[:, 1]
+    ML = _MAINTENANCE_LABOUR * SP_ET
+
+    t, eo, o, g = _TYRE_LIFE, _ENGINE_OIL, _OTHER_OIL, _GREASE
+    TL = t[:, 0] + t[:, 1] * RF + t[:, 2] * RG + t[:, 3] * (RG / W) + t[:, 4] * W
+    EOL = eo[:, 0] + eo[:, 1] * RF + eo[:, 2] * (RG / W)
+    OL = o[:, 0] + o[:, 1] * RF + o[:, 2] * RG + o[:, 3] * (RG / W) + o[:, 4] * W
+    G = g[:, 0] + g[:, 1] * RF + g[:, 2] * RG + g[:, 3] * W
+
+    # Time related
+    UPD = _UTILISATION[:, 0] + _UTILISATION[:, 1] * V
+    lane_column = lane_code[..., np.newaxis]
+    vehicle_row = np.arange(len(FLEET_VEHICLES))
+    PT = (_PASSENGER_TIME_PER_SPEED[vehicle_row, lane_column] / V
+          + _PASSENGER_TIME_PER_UTILISATION[vehicle_row, lane_column] / UPD)
+    CHC = _COMMODITY_HOLDING[vehicle_row, lane_column] / UPD
+
+    values = {
+        "velocity": V,
+        "petrol": fuel(_PETROL),
+        "diesel": fuel(_DIESEL),
+        "spare_parts_ET": SP_ET / 100,
+        "spare_parts_IT": SP_IT / 100,
+        "maintenance_labour": ML / 100,
+        "tyre_life": TL,
+        "engine_oil": EOL,
+        "other_oil": OL,
+        "grease": G,
+        "fixed_cost_ET": _FIXED_DEPRECIATION[:, 0] / UPD,
+        "fixed_cost_IT": _FIXED_DEPRECIATION[:, 1] / UPD,
+        "depreciation_cost_ET": _FIXED_DEPRECIATION[:, 2] / UPD,
+        "depreciation_cost_IT": _FIXED_DEPRECIATION[:, 3] / UPD,
+        "passenger_time_cost": PT,
+        "crew_cost": _CREW / UPD,
+        "commodity_holding_cost": CHC,
+        "utilisation": UPD,
+    }
+
+    result = np.empty(shape + (len(FLEET_VEHICLES),), dtype=FLEET_VOC_DTYPE)
+    for name in FLEET_VOC_FIELDS:
+        result[name] = np.maximum(values[name], 0)
+    return result
+
+
+def voc_results(result: np.ndarray, lane: str) -> Dict[str, VOCResult]:
+    """VOCResult of every vehicle at one road point of a fleet_voc() result (a row over FLEET_VEHICLES)."""
+    return {vt: VOCResult(vt, lane, *result[j].item()) for j, vt in enumerate(FLEET_VEHICLES)}
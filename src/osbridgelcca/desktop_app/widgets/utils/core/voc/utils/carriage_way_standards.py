@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from types import MappingProxyType
-from typing import Optional, Tuple, List, Union
+from typing import ClassVar, Optional, Tuple, List, Union
 
 @dataclass(frozen=True)
 class CarriagewayStandards:
@@ -12,7 +12,7 @@ class CarriagewayStandards:
     - get_width(type_name, custom_width=None): Retrieves width for a given type, with type checks.
     """
 
-    _STANDARD_WIDTHS: MappingProxyType = MappingProxyType({
+    _STANDARD_WIDTHS: ClassVar[MappingProxyType] = MappingProxyType({
         "SL": 3.75,
         "IL": 5.50,
         "2L": 7.00,
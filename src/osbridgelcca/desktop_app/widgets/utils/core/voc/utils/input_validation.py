@@ -1,106 +1,159 @@
-from utils import carriage_way_standards
-from utils import constants
+from functools import lru_cache
+from typing import List, NamedTuple, Tuple
+from . import carriage_way_standards
+from . import constants
 
-def validate_input(vehicle_input):
+# -----------------------------
+# Schema, built once
+# -----------------------------
+LANE_TYPES, _ = carriage_way_standards.CarriagewayStandards.list_types()
+STANDARD_WIDTHS = {lane: carriage_way_standards.CarriagewayStandards.get_width(lane)[0] for lane in LANE_TYPES}
+NUMERIC_FIELDS = ("rg_roughness_factor", "fl_fall_factor", "rs_rise_factor")
+PWR_VEHICLES = ("mcv", "hcv")
+
+
+class InputError(NamedTuple):
+    """One validation error: the offending field of the vehicle input and a message."""
+    field: str
+    message: str
+
+
+class VOCInputError(ValueError):
+    """
+    Invalid vehicle input. `errors` holds every InputError found; the message
+    is their messages, one per line.
+    """
+
+    def __init__(self, errors: List[InputError]):
+        self.errors = tuple(errors)
+        super().__init__("\n".join(error.message for error in self.errors))
+
+
+@lru_cache(maxsize=64)
+def _vehicle_info_errors(vehicle_types: Tuple[str, ...]) -> Tuple[InputError, ...]:
+    """Errors of the set of vehicle types of vehicle_info, cached per input shape."""
+    errors = []
+    missing_keys = [vtype for vtype in constants.vehicle_type_list if vtype not in vehicle_types]
+    if missing_keys:
+        errors.append(InputError(
+            "vehicle_info", f"Missing vehicle types in vehicle_info: {missing_keys}. All must be present."))
+
+    invalid_keys = [vtype for vtype in vehicle_types if vtype not in constants.vehicle_type_list]
+    if invalid_keys:
+        errors.append(InputError(
+            "vehicle_info",
+            f"Invalid vehicle types in vehicle_info: {invalid_keys}. Allowed: {constants.vehicle_type_list}"))
+    return tuple(errors)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float))
+
+
+def check_input(vehicle_input) -> List[InputError]:
+    """
+    All errors of a vehicle input, without raising and without modifying the input.
+
+    Returns:
+        List of InputError, empty if the input is valid
+    """
     errors = []
 
+    if not isinstance(vehicle_input, dict):
+        return [InputError("vehicle_input", "vehicle_input must be a dictionary.")]
+
     # -----------------------------
     # Validate lane_type using carriagewayStandards
     # -----------------------------
-    available_types, _ = carriage_way_standards.CarriagewayStandards.list_types()
     lane_type = vehicle_input.get("lane_type")
 
     if not isinstance(lane_type, str):
-        errors.append("lane_type must be a string.")
-    else:
-        if lane_type not in available_types:
-            errors.append(
-                f"lane_type '{lane_type}' is invalid. Allowed: {available_types}"
-            )
+        errors.append(InputError("lane_type", "lane_type must be a string."))
+    elif lane_type not in STANDARD_WIDTHS:
+        errors.append(InputError("lane_type", f"lane_type '{lane_type}' is invalid. Allowed: {LANE_TYPES}"))
 
     # -----------------------------
     # Validate carriageway width logic
     # -----------------------------
     if lane_type == "EW":
         custom_width = vehicle_input.get("carriageway_width")
-        if custom_width is None or not isinstance(custom_width, (int, float)) or custom_width <= 0:
-            errors.append(
-                "For Expressway type, 'carriageway_width' must be a positive number (custom width required)."
-            )
-    else:
-        standard_width, msg = carriage_way_standards.CarriagewayStandards.get_width(lane_type)
-        if standard_width is None:
-            errors.append(f"Could not retrieve standard width: {msg}")
-        else:
-            vehicle_input["carriageway_width"] = standard_width
+        if custom_width is None or not _is_number(custom_width) or custom_width <= 0:
+            errors.append(InputError(
+                "carriageway_width",
+                "For Expressway type, 'carriageway_width' must be a positive number (custom width required)."))
 
     # -----------------------------
     # Validate numeric fields
     # -----------------------------
-    numeric_fields = [
-        "rg_roughness_factor",
-        "fl_fall_factor",
-        "rs_rise_factor"
-    ]
-
-    for field in numeric_fields:
-        value = vehicle_input.get(field)
-        if not isinstance(value, (int, float)):
-            errors.append(f"{field} must be a number (int or float).")
+    for field in NUMERIC_FIELDS:
+        if not _is_number(vehicle_input.get(field)):
+            errors.append(InputError(field, f"{field} must be a number (int or float)."))
 
     # -----------------------------
     # Validate vehicle_info
     # -----------------------------
     vehicle_info = vehicle_input.get("vehicle_info")
     if not isinstance(vehicle_info, dict):
-        errors.append("vehicle_info must be a dictionary.")
-    else:
-        missing_keys = [vtype for vtype in constants.vehicle_type_list if vtype not in vehicle_info]
-        if missing_keys:
-            errors.append(
-                f"Missing vehicle types in vehicle_info: {missing_keys}. All must be present."
-            )
-
-        invalid_keys = [vtype for vtype in vehicle_info if vtype not in constants.vehicle_type_list]
-        if invalid_keys:
-            errors.append(
-                f"Invalid vehicle types in vehicle_info: {invalid_keys}. Allowed: {constants.vehicle_type_list}"
-            )
-
-        for vtype, count in vehicle_info.items():
-            if not isinstance(count, (int, float)) or count < 0:
-                errors.append(f"Count for '{vtype}' must be a non-negative number.")
-
-        # -----------------------------
-        # Validate power_weight_ratio_pwr for HCV, MCV
-        # -----------------------------
-        mcv_count = vehicle_info.get("mcv", 0)
-        hcv_count = vehicle_info.get("hcv", 0)
-
-    if mcv_count > 0 or hcv_count > 0:
+        errors.append(InputError("vehicle_info", "vehicle_info must be a dictionary."))
+        return errors
+
+    errors.extend(_vehicle_info_errors(tuple(vehicle_info)))
+
+    for vtype, count in vehicle_info.items():
+        if not _is_number(count) or count < 0:
+            errors.append(InputError("vehicle_info", f"Count for '{vtype}' must be a non-negative number."))
+
+    # -----------------------------
+    # Validate power_weight_ratio_pwr for HCV, MCV
+    # -----------------------------
+    needs_pwr = [vt for vt in PWR_VEHICLES if _is_number(vehicle_info.get(vt, 0)) and vehicle_info.get(vt, 0) > 0]
+    if needs_pwr:
         pwr = vehicle_input.get("power_weight_ratio_pwr")
         if pwr is None:
-            errors.append(
-                "power_weight_ratio_pwr must be provided if LCV, HCV, or MCV count > 0."
-            )
+            errors.append(InputError(
+                "power_weight_ratio_pwr", "power_weight_ratio_pwr must be provided if LCV, HCV, or MCV count > 0."))
         elif isinstance(pwr, dict):
             # Check all relevant vehicle types have a numeric value > 0
-            for vt in ["mcv", "hcv"]:
-                if vehicle_info.get(vt, 0) > 0:
-                    if vt not in pwr or not isinstance(pwr[vt], (int, float)) or pwr[vt] <= 0:
-                        errors.append(
-                            f"power_weight_ratio_pwr for '{vt}' is required, must be a numeric value greater than 0, but the provided value is {value}."
-                        )
-        elif not isinstance(pwr, (int, float)) or pwr <= 0:
-            errors.append(
-                f"power_weight_ratio_pwr must be numeric (int/float) and > 0, or a dictionary keyed by vehicle type with values > 0."
-            )
+            for vt in needs_pwr:
+                value = pwr.get(vt)
+                if not _is_number(value) or value <= 0:
+                    errors.append(InputError(
+                        "power_weight_ratio_pwr",
+                        f"power_weight_ratio_pwr for '{vt}' is required, must be a numeric value greater than 0, "
+                        f"but the provided value is {value}."))
+        elif not _is_number(pwr) or pwr <= 0:
+            errors.append(InputError(
+                "power_weight_ratio_pwr",
+                "power_weight_ratio_pwr must be numeric (int/float) and > 0, "
+                "or a dictionary keyed by vehicle type with values > 0."))
 
+    return errors
 
-    # -----------------------------
-    # Return or raise errors
-    # -----------------------------
+
+def validate_input(vehicle_input):
+    """
+    Raise VOCInputError (a ValueError) listing every error of the input. The input is not modified.
+    """
+    errors = check_input(vehicle_input)
     if errors:
-        raise ValueError("\n".join(errors))
+        raise VOCInputError(errors)
+
+    return True
+
+
+def prepare_input(vehicle_input, trusted=False):
+    """
+    Vehicle input ready for the models: validated, with the standard carriageway width of its
+    lane filled in (in a copy, the input itself is not modified).
+
+    Parameters:
+    vehicle_input (dict): Input data containing vehicle counts and other parameters (not modified).
+    trusted (bool): Skip validation, for batch callers that validated the inputs upstream.
+    """
+    if not trusted:
+        validate_input(vehicle_input)
 
-    return True
\ No newline at end of file
+    standard_width = STANDARD_WIDTHS.get(vehicle_input["lane_type"])
+    if standard_width is None:
+        return vehicle_input
+    return {**vehicle_input, "carriageway_width": standard_width}
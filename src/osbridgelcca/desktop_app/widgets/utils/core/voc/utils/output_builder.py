@@ -1,6 +1,113 @@
-from typing import Dict, Any
+from typing import Dict, Any, NamedTuple
 
-def build_voc_output(
+
+class VOCResult(NamedTuple):
+    """
+    Output of one vehicle model, without WPI adjustments.
+
+    Values are stored flat; their units and iHTC flags are the same for every
+    result and are kept once in UNITS and IHTC. to_dict() builds the nested
+    dictionary returned by build_voc_output() when it is needed (JSON, debug files).
+    """
+    vehicle_type: str
+    lane_type: str
+    velocity: float                 # kmph
+    petrol: float                   # liters per 1000 km
+    diesel: float                   # liters per 1000 km
+    spare_parts_ET: float           # Rs/km
+    spare_parts_IT: float           # Rs/km
+    maintenance_labour: float       # Rs/km
+    tyre_life: float                # km/tyre
+    engine_oil: float               # liters per 1000 km
+    other_oil: float                # liters per 10000 km
+    grease: float                   # liters per 10000 km
+    fixed_cost_ET: float            # Rs/km
+    fixed_cost_IT: float            # Rs/km
+    depreciation_cost_ET: float     # Rs/km
+    depreciation_cost_IT: float     # Rs/km
+    passenger_time_cost: float      # Rs/km
+    crew_cost: float                # Rs/km
+    commodity_holding_cost: float   # Rs/km
+    utilisation: float
+
+    # Entry of the nested dictionary -> (unit, iHTC)
+    UNITS = {
+        "velocity": ("kmph", None),
+        "fuel_consumption": ("liters per 1000 km", False),
+        "spare_parts": ("Rs/km", True),
+        "maintenance_labour": ("Rs/km", False),
+        "tyre_life": ("km/tyre", False),
+        "engine_oil": ("liters per 1000 km", False),
+        "other_oil": ("liters per 10000 km", False),
+        "grease": ("liters per 10000 km", False),
+        "fixed_cost": ("Rs/km", True),
+        "depreciation_cost": ("Rs/km", True),
+        "passenger_time_cost": ("Rs/km", False),
+        "crew_cost": ("Rs/km", False),
+        "commodity_holding_cost": ("Rs/km", False),
+        "utilisation": (None, False),
+    }
+    NOTE = "All Values mentioned here are without WPI adjustments!"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The result in the nested format of build_voc_output()."""
+
+        def value(name, x):
+            unit, iHTC = VOCResult.UNITS[name]
+            return {"value": x, "unit": unit, "iHTC": iHTC}
+
+        def et_it(name, et, it):
+            unit, iHTC = VOCResult.UNITS[name]
+            return {"ET": et, "IT": it, "unit": unit, "iHTC": iHTC}
+
+        fuel_unit, fuel_iHTC = VOCResult.UNITS["fuel_consumption"]
+        return {
+            "vehicle_type": self.vehicle_type,
+            "lane_type": self.lane_type,
+            "velocity": {"value": self.velocity, "unit": VOCResult.UNITS["velocity"][0]},
+            "VOC_summary": {
+                "distance_related": {
+                    "fuel_consumption": {"petrol": self.petrol, "diesel": self.diesel,
+                                         "unit": fuel_unit, "iHTC": fuel_iHTC},
+                    "spare_parts": et_it("spare_parts", self.spare_parts_ET, self.spare_parts_IT),
+                    "maintenance_labour": value("maintenance_labour", self.maintenance_labour),
+                    "tyre_life": value("tyre_life", self.tyre_life),
+                    "engine_oil": value("engine_oil", self.engine_oil),
+                    "other_oil": value("other_oil", self.other_oil),
+                    "grease": value("grease", self.grease),
+                },
+                "time_related": {
+                    "fixed_cost": et_it("fixed_cost", self.fixed_cost_ET, self.fixed_cost_IT),
+                    "depreciation_cost": et_it("depreciation_cost", self.depreciation_cost_ET,
+                                               self.depreciation_cost_IT),
+                    "passenger_time_cost": value("passenger_time_cost", self.passenger_time_cost),
+                    "crew_cost": value("crew_cost", self.crew_cost),
+                    "commodity_holding_cost": value("commodity_holding_cost", self.commodity_holding_cost),
+                },
+                "utilisation": {"value": self.utilisation, "iHTC": VOCResult.UNITS["utilisation"][1]},
+                "note": VOCResult.NOTE
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, output: Dict[str, Any]) -> "VOCResult":
+        """Inverse of to_dict(), for outputs built with build_voc_output()."""
+        distance = output["VOC_summary"]["distance_related"]
+        time = output["VOC_summary"]["time_related"]
+        return cls(
+            output["vehicle_type"], output["lane_type"], output["velocity"]["value"],
+            distance["fuel_consumption"]["petrol"], distance["fuel_consumption"]["diesel"],
+            distance["spare_parts"]["ET"], distance["spare_parts"]["IT"], distance["maintenance_labour"]["value"],
+            distance["tyre_life"]["value"], distance["engine_oil"]["value"], distance["other_oil"]["value"],
+            distance["grease"]["value"],
+            time["fixed_cost"]["ET"], time["fixed_cost"]["IT"],
+            time["depreciation_cost"]["ET"], time["depreciation_cost"]["IT"],
+            time["passenger_time_cost"]["value"], time["crew_cost"]["value"], time["commodity_holding_cost"]["value"],
+            output["VOC_summary"]["utilisation"]["value"],
+        )
+
+
+def build_voc_result(
     vt: str,
     lane: str,
     velocity: float,
@@ -21,94 +128,45 @@ def build_voc_output(
     crew: float,
     CHC: float,
     UPD: float
-) -> Dict[str, Any]:
- 
+) -> VOCResult:
+    """VOCResult of the raw model values (negative values are set to 0, SP and ML converted to Rs/km)."""
+
     def nn(x):
         # Helper to ensure non-negative values
         return max(x, 0)
-    
-    return {
-        "vehicle_type": vt,
-        "lane_type": lane,
-        "velocity": {
-            "value": nn(velocity),
-            "unit": "kmph"
-        },
-        "VOC_summary": {
-            "distance_related": {
-                "fuel_consumption": {
-                    "petrol": nn(petrol),
-                    "diesel": nn(diesel),
-                    "unit": "liters per 1000 km",
-                    "iHTC": False
-                },
-                "spare_parts": {
-                    "ET": nn(SP_ET)/100,
-                    "IT": nn(SP_IT)/100,
-                    "unit": "Rs/km",
-                    "iHTC": True
-                },
-                "maintenance_labour": {
-                    "value": nn(ML)/100,
-                    "unit": "Rs/km",
-                    "iHTC": False
-                },
-                "tyre_life": {
-                    "value": nn(TL),
-                    "unit": "km/tyre",
-                    "iHTC": False
-                },
-                "engine_oil": {
-                    "value": nn(EOL),
-                    "unit": "liters per 1000 km",
-                    "iHTC": False
-                },
-                "other_oil": {
-                    "value": nn(OL),
-                    "unit": "liters per 10000 km",
-                    "iHTC": False
-                },
-                "grease": {
-                    "value": nn(G),
-                    "unit": "liters per 10000 km",
-                    "iHTC": False
-                },
-            },
 
-            "time_related": {
-                "fixed_cost": {
-                    "ET": nn(FXC_ET),
-                    "IT": nn(FXC_IT),
-                    "unit": "Rs/km",
-                    "iHTC": True
-                },
-                "depreciation_cost": {
-                    "ET": nn(DC_ET),
-                    "IT": nn(DC_IT),
-                    "unit": "Rs/km",
-                    "iHTC": True
-                },
-                "passenger_time_cost": {
-                    "value": nn(PT),
-                    "unit": "Rs/km",
-                    "iHTC": False
-                },
-                "crew_cost": {
-                    "value": nn(crew),
-                    "unit": "Rs/km",
-                    "iHTC": False
-                },
-                "commodity_holding_cost": {
-                    "value": nn(CHC),
-                    "unit": "Rs/km",
-                    "iHTC": False
-                },
-            },
+    return VOCResult(
+        vt, lane, nn(velocity),
+        nn(petrol), nn(diesel),
+        nn(SP_ET) / 100, nn(SP_IT) / 100, nn(ML) / 100,
+        nn(TL), nn(EOL), nn(OL), nn(G),
+        nn(FXC_ET), nn(FXC_IT), nn(DC_ET), nn(DC_IT),
+        nn(PT), nn(crew), nn(CHC), nn(UPD)
+    )
 
-            "utilisation": {
-                "value": nn(UPD),
-                "iHTC": False
-            },
-            "note": "All Values mentioned here are without WPI adjustments!"
-        }
-    }
+
+def build_voc_output(
+    vt: str,
+    lane: str,
+    velocity: float,
+    petrol: float,
+    diesel: float,
+    SP_ET: float,
+    SP_IT: float,
+    ML: float,
+    TL: float,
+    EOL: float,
+    OL: float,
+    G: float,
+    FXC_ET: float,
+    FXC_IT: float,
+    DC_ET: float,
+    DC_IT: float,
+    PT: float,
+    crew: float,
+    CHC: float,
+    UPD: float
+) -> Dict[str, Any]:
+    """Nested dictionary of the raw model values, see build_voc_result() and VOCResult.to_dict()."""
+    return build_voc_result(vt, lane, velocity, petrol, diesel, SP_ET, SP_IT, ML, TL, EOL, OL, G,
+                            FXC_ET, FXC_IT, DC_ET, DC_IT, PT, crew, CHC, UPD).to_dict()
@@ -1,71 +1,93 @@
-import IRC_standards.IRCSP30_2019 as tableC1
-from voc.utils.constants import vehicle_type_list, petrolToDieselRatio
-import json
-import os
-from typing import Any, Dict, Union
+from ...IRC_standards import IRCSP30_2019 as tableC1
+from .constants import vehicle_type_list, petrolToDieselRatio
+from .output_builder import VOCResult
+from .trace import TraceSink, debug_sink, write_trace
+from typing import Any, Dict, NamedTuple, Tuple, Union
 
 
-def calculate_total_cost(data: Dict[str, Any]) -> Dict[str, Any]:
+# Cost components of adjust_for_wpi, in the order of the (IT, ET) pairs of every vehicle
+DISTANCE_COMPONENTS = ("tyreCost", "fuelCost", "engine_oil", "other_oil", "grease", "spare_parts",
+                       "maintenance_labour")
+TIME_COMPONENTS = ("fixed_cost", "depreciation_cost", "passenger_time_cost", "crew_cost", "commodity_holding_cost")
+# Components without an IT/ET split (iHTC False): the pair holds their value twice
+VALUE_COMPONENTS = frozenset(("maintenance_labour", "passenger_time_cost", "crew_cost", "commodity_holding_cost"))
+
+CostPairs = Tuple[Tuple[float, float], ...]
+
+
+def _entry(name: str, cost: Tuple[float, float]) -> Dict[str, Any]:
+    if name in VALUE_COMPONENTS:
+        return {"value": cost[0], "unit": "Rs/km", "iHTC": False}
+    return {"IT": cost[0], "ET": cost[1], "unit": "Rs/km", "iHTC": True}
+
+
+def _sum_pairs(costs: CostPairs) -> Tuple[float, float]:
+    IT, ET = 0.0, 0.0
+    for cost_IT, cost_ET in costs:
+        IT += cost_IT
+        ET += cost_ET
+    return IT, ET
+
+
+class WPIAdjustedCosts(NamedTuple):
+    """
+    WPI adjusted costs of the fleet, without the nested dictionaries.
+
+    Every vehicle type holds the (IT, ET) pairs of its cost components, in the
+    order of DISTANCE_COMPONENTS and TIME_COMPONENTS. to_dict() builds the
+    nested dictionary (units, iHTC flags, total time cost) for the debug files
+    and traces.
+    """
+    distanceCost: Dict[str, CostPairs]
+    timeCost: Dict[str, CostPairs]
+
+    def to_dict(self) -> Dict[str, Any]:
+        adjusted: Dict[str, Any] = {"distanceCost": {}, "timeCost": {}}
+        for cost_type, components in (("distanceCost", DISTANCE_COMPONENTS), ("timeCost", TIME_COMPONENTS)):
+            for vt, costs in getattr(self, cost_type).items():
+                adjusted[cost_type][vt] = {name: _entry(name, cost) for name, cost in zip(components, costs)}
+        for vt, costs in self.timeCost.items():
+            total_IT, total_ET = _sum_pairs(costs)
+            adjusted["timeCost"][vt]["total_time_cost"] = {"IT": total_IT, "ET": total_ET, "unit": "Rs/km",
+                                                           "iHTC": True}
+        return adjusted
+
+
+def calculate_total_cost(data: WPIAdjustedCosts) -> Dict[str, Any]:
     """
     Calculate total cost for both distanceCost and timeCost in the data.
-    Updates totals based on IT/ET or value fields.
+    Sums the (IT, ET) pairs of every vehicle (see adjust_for_wpi).
     Returns a dictionary with both totals and vehicle-specific totals.
     """
     total_cost: Dict[str, Any] = {}
 
-    for cost_type in ["distanceCost", "timeCost"]:
-        if cost_type not in data:
-            continue
-
-        total_cost[cost_type] = {"total": {"IT": 0.0, "ET": 0.0}}
-
-        for vehicle_type, components in data[cost_type].items():
-            if vehicle_type == "total":
-                continue
-
-            total_cost[cost_type][vehicle_type] = {"IT": 0.0, "ET": 0.0}
-
-            for comp_name, comp_values in components.items():
-                if comp_name.startswith("total_"):
-                    continue
-
-                if isinstance(comp_values, dict):
-                    if comp_values.get('iHTC', False):
-                        total_cost[cost_type]["total"]["IT"] += comp_values.get("IT", 0)
-                        total_cost[cost_type]["total"]["ET"] += comp_values.get("ET", 0)
-                        total_cost[cost_type][vehicle_type]["IT"] += comp_values.get("IT", 0)
-                        total_cost[cost_type][vehicle_type]["ET"] += comp_values.get("ET", 0)
-                    else:
-                        value = comp_values.get("value", 0)
-                        total_cost[cost_type]["total"]["IT"] += value
-                        total_cost[cost_type]["total"]["ET"] += value
-                        total_cost[cost_type][vehicle_type]["IT"] += value
-                        total_cost[cost_type][vehicle_type]["ET"] += value
-                elif isinstance(comp_values, (int, float)):
-                    total_cost[cost_type]["total"]["IT"] += comp_values
-                    total_cost[cost_type]["total"]["ET"] += comp_values
-                    total_cost[cost_type][vehicle_type]["IT"] += comp_values
-                    total_cost[cost_type][vehicle_type]["ET"] += comp_values
-                else:
-                    continue
+    for cost_type in WPIAdjustedCosts._fields:
+        totals = {"IT": 0.0, "ET": 0.0}
+        total_cost[cost_type] = {"total": totals}
 
+        vehicle_totals = {vt: _sum_pairs(costs) for vt, costs in getattr(data, cost_type).items()}
+        for vt, (vehicle_IT, vehicle_ET) in vehicle_totals.items():
+            total_cost[cost_type][vt] = {"IT": vehicle_IT, "ET": vehicle_ET}
+        totals["IT"], totals["ET"] = _sum_pairs(tuple(vehicle_totals.values()))
         total_cost[cost_type]["units"] = "Rs/km/veh"
 
     return total_cost
 
 
+# VOC vehicle keys -> vehicle names used in the WPI dictionary
+WPI_VEHICLE_NAMES = {
+    "small_cars": "Small Cars",
+    "big_cars": "Big Cars",
+    "two_wheelers": "Two Wheeler",
+    "buses": "Ordinary Buses",
+    "lcv": "LCV",
+    "hcv": "HCV",
+    "mcv": "MCV"
+}
+
+
 def getWPI(category, vehicle_type, wpi):
-    mapping = {
-        "small_cars": "Small Cars",
-        "big_cars": "Big Cars",
-        "two_wheelers": "Two Wheeler",
-        "buses": "Ordinary Buses",
-        "lcv": "LCV",
-        "hcv": "HCV",
-        "mcv": "MCV"
-    }
-
-    vt = mapping.get(vehicle_type)
+    vt = WPI_VEHICLE_NAMES.get(vehicle_type)
     if vt is None:
         raise ValueError(f"Invalid vehicle type: {vehicle_type}")
 
@@ -98,220 +120,131 @@ def per_km_cost(liters_per_unit: float, price_IT: float, price_ET: float, factor
     return IT, ET
 
 
-def apply_wpi(cost: Dict[str, float], wpi_val: Union[float, Dict[str, Any], None]) -> dict[str, float | str | bool]:
-    # normalize wpi_val to a numeric multiplier
-    multiplier: float = 1.0
+def wpi_multiplier(wpi_val: Union[float, Dict[str, Any], None]) -> float:
+    """WPI value as a numeric multiplier: a number, or the IT/value (else first numeric) entry of a dict."""
     if isinstance(wpi_val, (int, float)):
-        multiplier = float(wpi_val)
-    elif isinstance(wpi_val, dict):
+        return float(wpi_val)
+    if isinstance(wpi_val, dict):
         # prefer common numeric keys
         if "IT" in wpi_val and isinstance(wpi_val["IT"], (int, float)):
-            multiplier = float(wpi_val["IT"])
-        elif "value" in wpi_val and isinstance(wpi_val["value"], (int, float)):
-            multiplier = float(wpi_val["value"])
-        else:
-            # try to pick any numeric value from the dict
-            for v in wpi_val.values():
-                if isinstance(v, (int, float)):
-                    multiplier = float(v)
-                    break
-
-    return {
-        "IT": cost["IT"] * multiplier,
-        "ET": cost["ET"] * multiplier,
-        "unit": "Rs/km",
-        "iHTC": True
-    }
+            return float(wpi_val["IT"])
+        if "value" in wpi_val and isinstance(wpi_val["value"], (int, float)):
+            return float(wpi_val["value"])
+        # try to pick any numeric value from the dict
+        for v in wpi_val.values():
+            if isinstance(v, (int, float)):
+                return float(v)
+    return 1.0
 
 
-# ----------------- Main function -----------------
-
-def post_process(outputFromVocOutputBuilder: Dict[str, Any], wpi: Dict[str, Any], debug: bool = False) -> Dict[str, Any]:
-    wpiAdjustedValues: Dict[str, Any] = {"distanceCost": {}, "timeCost": {}}
+def apply_wpi(IT: float, ET: float, wpi_val: Union[float, Dict[str, Any], None]) -> Tuple[float, float]:
+    """(IT, ET) cost pair scaled by a WPI value (see wpi_multiplier)."""
+    multiplier = wpi_multiplier(wpi_val)
+    return IT * multiplier, ET * multiplier
 
-    for vt in vehicle_type_list:
-        if vt in outputFromVocOutputBuilder:
-            wpiAdjustedValues["distanceCost"][vt] = {}
 
-    # ---------------- TYRE COST ----------------
-    for vt in vehicle_type_list:
-        vdata = outputFromVocOutputBuilder.get(vt)
-        if not vdata or "VOC_summary" not in vdata:
-            continue
+# ----------------- Main function -----------------
 
-        tyre_life_km = vdata["VOC_summary"]["distance_related"]["tyre_life"]["value"]
-        tyre_info = tableC1.new_tyres_costs[vt]
+def as_voc_result(vdata: Any) -> Union[VOCResult, None]:
+    """VOCResult of one vehicle model output (legacy nested dictionaries are converted), None for error entries."""
+    if isinstance(vdata, dict):
+        return VOCResult.from_dict(vdata) if "VOC_summary" in vdata else None
+    return vdata
 
-        IT, ET = tyre_info["IT"], tyre_info["ET"]
-        num_tyres = tyre_info["num_of_wheels"]
 
-        tyre_cost_per_km_wt = IT * num_tyres / tyre_life_km
-        tyre_cost_per_km_wot = ET * num_tyres / tyre_life_km
+def adjust_for_wpi(outputFromVocOutputBuilder: Dict[str, Any], wpi: Dict[str, Any]) -> WPIAdjustedCosts:
+    """
+    Convert the vehicle model outputs to costs and apply the WPI, in one pass over the fleet.
 
-        vdata["VOC_summary"]["distance_related"]["tyre_life"]["tyre_cost_rs_per_km"] = {
-            "num_tyres": num_tyres,
-            "IT": tyre_cost_per_km_wt,
-            "ET": tyre_cost_per_km_wot,
-            "unit": "Rs/km",
-            "iHTC": True
-        }
+    Args:
+        outputFromVocOutputBuilder: Vehicle type -> VOCResult (or the nested dictionary of build_voc_output())
+        wpi: WPI dictionary, see IRC_SP_30.getWPI()
 
-        wpi_val = getWPI("tyreCost", vt, wpi)
-        wpiAdjustedValues["distanceCost"][vt]["tyreCost"] = apply_wpi(
-            {"IT": tyre_cost_per_km_wt, "ET": tyre_cost_per_km_wot}, wpi_val
-        )
+    Returns:
+        WPIAdjustedCosts with the (IT, ET) pairs of every vehicle type (input of calculate_total_cost)
+    """
+    distanceCost: Dict[str, CostPairs] = {}
+    timeCost: Dict[str, CostPairs] = {}
 
-    # ---------------- FUEL, OILS, GREASE ----------------
     for vt in vehicle_type_list:
-        vdata = outputFromVocOutputBuilder.get(vt)
-        if not vdata or "VOC_summary" not in vdata:
+        result = as_voc_result(outputFromVocOutputBuilder.get(vt))
+        if result is None:
             continue
 
-        dist = vdata["VOC_summary"]["distance_related"]
-        wpiAdjustedValues["distanceCost"].setdefault(vt, {})
-
-        # Fuel
-        fuel = dist.get("fuel_consumption")
-        if fuel:
-            wpi_block = getWPI("fuelCost", vt, wpi)
-
-            petrol_cost = {"IT": 0, "ET": 0}
-            diesel_cost = {"IT": 0, "ET": 0}
-
-            if fuel.get("petrol", 0) > 0:
-                liters_1000 = fuel["petrol"]
-                pw = tableC1.petroleum_products_costs["petrol"]["IT"]
-                pe = tableC1.petroleum_products_costs["petrol"]["ET"]
-                petrol_cost["IT"], petrol_cost["ET"] = per_km_cost(liters_1000, pw, pe) # type: ignore
-                fuel["petrol_cost_rs_per_km"] = {
-                    **petrol_cost, "unit": "Rs/km", "WPI": wpi_block.get("Petrol"), "iHTC": False
-                }
-
-            if fuel.get("diesel", 0) > 0:
-                liters_1000 = fuel["diesel"]
-                dw = tableC1.petroleum_products_costs["diesel"]["IT"]
-                de = tableC1.petroleum_products_costs["diesel"]["ET"]
-                diesel_cost["IT"], diesel_cost["ET"] = per_km_cost(liters_1000, dw, de) # type: ignore
-                fuel["diesel_cost_rs_per_km"] = {
-                    **diesel_cost, "unit": "Rs/km", "WPI": wpi_block.get("Diesel"), "iHTC": False
-                }
-
-            ratio = petrolToDieselRatio.get(vt, {"petrol": 0, "diesel": 0})
-            wt = ratio["petrol"] * petrol_cost["IT"] + ratio["diesel"] * diesel_cost["IT"]
-            wot = ratio["petrol"] * petrol_cost["ET"] + ratio["diesel"] * diesel_cost["ET"]
-
-            fuel["fuel_cost_rs_per_km_final"] = {"IT": wt, "ET": wot, "unit": "Rs/km", "iHTC": False}
-            wpiAdjustedValues["distanceCost"][vt]["fuelCost"] = {
-                "IT": ratio["petrol"] * petrol_cost["IT"] * wpi_block.get("Petrol") +
-                      ratio["diesel"] * diesel_cost["IT"] * wpi_block.get("Diesel"),
-                "ET": ratio["petrol"] * petrol_cost["ET"] * wpi_block.get("Petrol") +
-                      ratio["diesel"] * diesel_cost["ET"] * wpi_block.get("Diesel"),
-                "unit": "Rs/km",
-                "iHTC": True
-            }
+        # ---------------- TYRE COST ----------------
+        tyre_info = tableC1.new_tyres_costs[vt]
+        num_tyres = tyre_info["num_of_wheels"]
+        tyre = apply_wpi(tyre_info["IT"] * num_tyres / result.tyre_life, tyre_info["ET"] * num_tyres / result.tyre_life,
+                         getWPI("tyreCost", vt, wpi))
+
+        # ---------------- FUEL, OILS, GREASE ----------------
+        fuel_wpi = getWPI("fuelCost", vt, wpi)
+        petrol_IT, petrol_ET = 0, 0
+        diesel_IT, diesel_ET = 0, 0
+        if result.petrol > 0:
+            petrol_IT, petrol_ET = per_km_cost(result.petrol, tableC1.petroleum_products_costs["petrol"]["IT"],
+                                               tableC1.petroleum_products_costs["petrol"]["ET"])
+        if result.diesel > 0:
+            diesel_IT, diesel_ET = per_km_cost(result.diesel, tableC1.petroleum_products_costs["diesel"]["IT"],
+                                               tableC1.petroleum_products_costs["diesel"]["ET"])
+
+        ratio = petrolToDieselRatio.get(vt, {"petrol": 0, "diesel": 0})
+        distance = [
+            tyre,
+            (ratio["petrol"] * petrol_IT * fuel_wpi.get("Petrol") +
+             ratio["diesel"] * diesel_IT * fuel_wpi.get("Diesel"),
+             ratio["petrol"] * petrol_ET * fuel_wpi.get("Petrol") +
+             ratio["diesel"] * diesel_ET * fuel_wpi.get("Diesel")),
+        ]
 
         # Engine oil, other oil, grease
-        for oil_name in ["engine_oil", "other_oil", "grease"]:
-            if oil_name in dist:
-                liters = dist[oil_name]["value"]
-                factor = 1000 if oil_name == "engine_oil" else 10000
-                pw = tableC1.petroleum_products_costs[oil_name]["IT"]
-                pe = tableC1.petroleum_products_costs[oil_name]["ET"]
-                IT, ET = per_km_cost(liters, pw, pe, factor)
-
-                wpi_val = getWPI("fuelCost", vt, wpi)
-                if isinstance(wpi_val, dict):
-                    wpi_val = wpi_val.get(oil_name.replace("_", " ").title())
-                else:
-                    wpi_val = 1.0
-
-                dist[oil_name][f"{oil_name}_cost_rs_per_km"] = {"IT": IT, "ET": ET, "unit": "Rs/km", "WPI": wpi_val, "iHTC": True}
-                wpiAdjustedValues["distanceCost"][vt][oil_name] = apply_wpi({"IT": IT, "ET": ET}, wpi_val)
+        for oil_name, liters, factor in (("engine_oil", result.engine_oil, 1000),
+                                         ("other_oil", result.other_oil, 10000),
+                                         ("grease", result.grease, 10000)):
+            IT, ET = per_km_cost(liters, tableC1.petroleum_products_costs[oil_name]["IT"],
+                                 tableC1.petroleum_products_costs[oil_name]["ET"], factor)
+            distance.append(apply_wpi(IT, ET, fuel_wpi.get(oil_name.replace("_", " ").title())))
 
         # Spare parts and maintenance labour
-        if "spare_parts" in dist:
-            wpi_val = getWPI("spareParts", vt, wpi)
-            dist["spare_parts"]["WPI"] = wpi_val
-            wpiAdjustedValues["distanceCost"][vt]["spare_parts"] = {
-                "IT": dist["spare_parts"]["IT"] * wpi_val,
-                "ET": dist["spare_parts"]["ET"] * wpi_val,
-                "unit": "Rs/km",
-                "iHTC": True
-            }
-
-        if "maintenance_labour" in dist:
-            wpi_val = getWPI("spareParts", vt, wpi)
-            dist["maintenance_labour"]["WPI"] = wpi_val
-            wpiAdjustedValues["distanceCost"][vt]["maintenance_labour"] = {
-                "value": dist["maintenance_labour"]["value"] * wpi_val,
-                "unit": "Rs/km",
-                "iHTC": False
-            }
+        spare_parts_wpi = getWPI("spareParts", vt, wpi)
+        labour = result.maintenance_labour * spare_parts_wpi
+        distance.append((result.spare_parts_IT * spare_parts_wpi, result.spare_parts_ET * spare_parts_wpi))
+        distance.append((labour, labour))
+        distanceCost[vt] = tuple(distance)
 
         # ---------------- TIME COST ----------------
-        if "time_related" not in vdata["VOC_summary"]:
-            continue
-
-        time_block = vdata["VOC_summary"]["time_related"]
-        wpiAdjustedValues["timeCost"][vt] = {}
-
         # Fixed and depreciation cost
-        for key in ["fixed_cost", "depreciation_cost"]:
-            if key in time_block:
-                wpi_val = getWPI("fixedDepreciation", vt, wpi)
-                time_block[key]["WPI"] = wpi_val
-                wpiAdjustedValues["timeCost"][vt][key] = {
-                    "IT": time_block[key]["IT"] * wpi_val,
-                    "ET": time_block[key]["ET"] * wpi_val,
-                    "unit": time_block[key]["unit"],
-                    "iHTC": time_block[key]["iHTC"]
-                }
-
+        fixed_wpi = getWPI("fixedDepreciation", vt, wpi)
         # Passenger and crew cost
-        for key, sub_key in [("passenger_time_cost", "Passenger Cost"), ("crew_cost", "Crew Cost")]:
-            if key in time_block:
-                wpi_val = getWPI("passengerCrewCost", vt, wpi).get(sub_key)
-                time_block[key]["WPI"] = wpi_val
-                wpiAdjustedValues["timeCost"][vt][key] = {
-                    "value": time_block[key]["value"] * wpi_val,
-                    "unit": time_block[key]["unit"],
-                    "iHTC": time_block[key]["iHTC"]
-                }
-
+        passenger_crew_wpi = getWPI("passengerCrewCost", vt, wpi)
+        passenger = result.passenger_time_cost * passenger_crew_wpi.get("Passenger Cost")
+        crew = result.crew_cost * passenger_crew_wpi.get("Crew Cost")
         # Commodity holding cost
-        if "commodity_holding_cost" in time_block:
-            wpi_val = getWPI("commodityHoldingCost", vt, wpi)
-            time_block["commodity_holding_cost"]["WPI"] = wpi_val
-            wpiAdjustedValues["timeCost"][vt]["commodity_holding_cost"] = {
-                "value": time_block["commodity_holding_cost"]["value"] * wpi_val,
-                "unit": "Rs/km",
-                "iHTC": time_block["commodity_holding_cost"]["iHTC"]
-            }
-
-        # Total time cost
-        total_IT, total_ET = 0, 0
-        for cost in wpiAdjustedValues["timeCost"][vt].values():
-            if "IT" in cost:
-                total_IT += cost["IT"]
-            if "ET" in cost:
-                total_ET += cost["ET"]
-            if "value" in cost:
-                total_IT += cost["value"]
-                total_ET += cost["value"]
-
-        wpiAdjustedValues["timeCost"][vt]["total_time_cost"] = {
-            "IT": total_IT,
-            "ET": total_ET,
-            "unit": "Rs/km",
-            "iHTC": True
-        }
+        commodity = result.commodity_holding_cost * getWPI("commodityHoldingCost", vt, wpi)
+        timeCost[vt] = ((result.fixed_cost_IT * fixed_wpi, result.fixed_cost_ET * fixed_wpi),
+                        (result.depreciation_cost_IT * fixed_wpi, result.depreciation_cost_ET * fixed_wpi),
+                        (passenger, passenger),
+                        (crew, crew),
+                        (commodity, commodity))
+
+    return WPIAdjustedCosts(distanceCost, timeCost)
 
+
+def post_process(outputFromVocOutputBuilder: Dict[str, Any], wpi: Dict[str, Any], debug: bool = False,
+                 trace: TraceSink = None) -> Dict[str, Any]:
+    """
+    WPI adjustment followed by aggregation (calculate_total_cost) of all vehicle model outputs.
+
+    trace sends the model outputs, WPI adjusted values and summary to a trace sink;
+    debug without a trace uses the debug sink of the process (see trace.debug_sink).
+    """
+    wpiAdjustedValues = adjust_for_wpi(outputFromVocOutputBuilder, wpi)
     summaryOfVOC = calculate_total_cost(wpiAdjustedValues)
 
-    if debug:
-        os.makedirs("debug", exist_ok=True)
-        json.dump(outputFromVocOutputBuilder, open("debug/outputFromVocOutputBuilder.json", "w"), indent=4)
-        json.dump(wpiAdjustedValues, open("debug/wpiAdjustedValues.json", "w"), indent=4)
-        json.dump(summaryOfVOC, open("debug/summaryOfVOC.json", "w"), indent=4)
+    if debug and trace is None:
+        trace = debug_sink()
+    if trace is not None:
+        write_trace(trace, {"model_outputs": outputFromVocOutputBuilder, "wpi_adjusted": wpiAdjustedValues,
+                            "summary": summaryOfVOC})
 
     return summaryOfVOC
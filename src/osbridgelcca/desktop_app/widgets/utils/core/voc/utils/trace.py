@@ -0,0 +1,150 @@
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Trace sinks receive the intermediate results of voc.core.main (model outputs,
+# WPI adjusted values, summary) for audits. A sink is passed to core.main as
+# `trace`; with no sink nothing is built or written.
+
+
+def _jsonable(stage: str, data: Any) -> Any:
+    """Data of a stage in JSON form (model outputs may be VOCResult tuples, WPI adjusted values WPIAdjustedCosts)."""
+    if stage == "model_outputs":
+        return {vt: (vdata.to_dict() if hasattr(vdata, "to_dict") else vdata) for vt, vdata in data.items()}
+    if stage == "wpi_adjusted" and hasattr(data, "to_dict"):
+        return data.to_dict()
+    return data
+
+
+class TraceSink:
+    """Base trace sink: discards every record."""
+
+    def emit(self, stage: str, data: Any, call: Optional[int] = None):
+        """Record the data of one pipeline stage."""
+
+    def new_call(self) -> int:
+        """Identifier of the next core.main call traced by this sink."""
+        return 0
+
+    def flush(self):
+        """Wait until every emitted record is written."""
+
+    def close(self):
+        """Flush and release the sink."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class JSONLTraceSink(TraceSink):
+    """
+    Writes records as compact JSON Lines from a background thread.
+
+    Every sink writes to its own run directory, <root>/<run_id>/trace.jsonl.
+    emit() only queues the record: serialization and I/O happen on the writer
+    thread. Records are dropped (and counted in `dropped`) when the queue is
+    full or when the file has reached max_bytes, so tracing never blocks or
+    fills the disk. Records hold references to the emitted data until they
+    are written; the data must not be modified in the meantime.
+    """
+
+    def __init__(self, root: str = "debug", run_id: Optional[str] = None,
+                 max_bytes: int = 64 * 1024 * 1024, max_queue: int = 1024):
+        """
+        Args:
+            root: Directory holding the run directories
+            run_id: Name of the run directory (default: time stamp and process id)
+            max_bytes: Size cap of the trace file
+            max_queue: Records waiting to be written before new ones are dropped
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.run_id = run_id or f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.directory = os.path.join(root, self.run_id)
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, "trace.jsonl")
+        self.max_bytes = max_bytes
+        self.dropped = 0
+        self._calls = 0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self.written_bytes = self._file.tell()
+        self._thread = threading.Thread(target=self._write_records, name=f"voc-trace-{self.run_id}", daemon=True)
+        self._thread.start()
+
+    def new_call(self) -> int:
+        with self._lock:
+            self._calls += 1
+            return self._calls
+
+    def emit(self, stage: str, data: Any, call: Optional[int] = None):
+        try:
+            self._queue.put_nowait((stage, data, call))
+        except queue.Full:
+            self.dropped += 1
+
+    def _write_records(self):
+        while True:
+            record = self._queue.get()
+            try:
+                if record is None:
+                    return
+                self._write(*record)
+            except (TypeError, ValueError, OSError):
+                # A record that cannot be written must not stop the writer
+                self.dropped += 1
+            finally:
+                self._queue.task_done()
+
+    def _write(self, stage: str, data: Any, call: Optional[int]):
+        line = json.dumps({"run": self.run_id, "call": call, "stage": stage, "data": _jsonable(stage, data)},
+                          separators=(",", ":"), default=str) + "\n"
+        size = len(line.encode("utf-8"))
+        if self.written_bytes + size > self.max_bytes:
+            self.dropped += 1
+            return
+        self._file.write(line)
+        self.written_bytes += size
+
+    def flush(self):
+        self._queue.join()
+        self._file.flush()
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if not self._file.closed:
+            self._file.close()
+
+
+def write_trace(trace: TraceSink, stages: Dict[str, Any]):
+    """Emit the data of several stages as one traced call."""
+    call = trace.new_call()
+    for stage, data in stages.items():
+        trace.emit(stage, data, call)
+
+
+_debug_sink: Optional[JSONLTraceSink] = None
+_debug_lock = threading.Lock()
+
+
+def debug_sink() -> JSONLTraceSink:
+    """
+    Sink of the runs with debug=True: one JSONLTraceSink per process, in its
+    own run directory under debug/, created on first use and closed at exit.
+    """
+    global _debug_sink
+    with _debug_lock:
+        if _debug_sink is None:
+            _debug_sink = JSONLTraceSink(root="debug")
+            atexit.register(_debug_sink.close)
+        return _debug_sink
@@ -1,15 +1,15 @@
 from typing import Dict, Any, TypedDict
-import IRC_standards.IRCSP30_2019
-from voc.utils.output_builder import build_voc_output
-from voc.utils.pre_processor import VehicleInput, extract_vehicle_inputs
+from ...IRC_standards import IRCSP30_2019
+from ..utils.output_builder import VOCResult, build_voc_result
+from ..utils.pre_processor import VehicleInput, extract_vehicle_inputs
 import math
 
 Vehicle = "buses"
 
 
-def compute_voc(vehicle_input: VehicleInput) -> Dict[str, Any]:
+def compute_voc(vehicle_input: VehicleInput) -> VOCResult:
     vt, W, RG, FL, RS, lane, RF = extract_vehicle_inputs(vehicle_input)
-    NP: Dict[str, int] = IRC_standards.IRCSP30_2019.vehicle_costs[Vehicle]
+    NP: Dict[str, int] = IRCSP30_2019.vehicle_costs[Vehicle]
 
     if vt == Vehicle:
         # -----------------------------
@@ -94,7 +94,7 @@ def compute_voc(vehicle_input: VehicleInput) -> Dict[str, Any]:
         # -----------------------------
         # BUILD FINAL OUTPUT
         # -----------------------------
-        return build_voc_output(
+        return build_voc_result(
             vt=vt, lane=lane,
             velocity=V,
             petrol=petrol, diesel=diesel,
@@ -3,6 +3,7 @@ import os
 import sqlite3
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
+from .pwf import PWFCache, present_worth_factor, single_payment_pwf
 
 class CostComponent(ABC):
     """Abstract Base Class for different cost components in Life Cycle Cost Analysis."""
@@ -60,8 +61,9 @@ class TimeCost:
 class RoutineInspectionCost:
     """Annual cost of inspections for structural integrity."""
 
-    def __init__(self):
+    def __init__(self, pwf_cache: Optional[PWFCache] = None):
         self.present_worth_factor = 1.00
+        self.pwf_cache = pwf_cache
 
     def calculate_cost(self, inflation_rate:float,
                              init_construction_cost:float,
@@ -70,16 +72,15 @@ class RoutineInspectionCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        print(type(frequency),type(design_life))
-        
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life, cache=self.pwf_cache)
         return init_construction_cost * self.present_worth_factor * cost
 
 class PeriodicMaintenanceCost:
     """Includes expenses for routine maintenance activities."""
 
-    def __init__(self):
+    def __init__(self, pwf_cache: Optional[PWFCache] = None):
         self.present_worth_factor = 1.00
+        self.pwf_cache = pwf_cache
 
     def calculate_cost(self, inflation_rate:float,
                              init_construction_cost:float,
@@ -88,13 +89,14 @@ class PeriodicMaintenanceCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life, cache=self.pwf_cache)
         return init_construction_cost * self.present_worth_factor * cost
 
 class MajorInspectionCost:
 
-    def __init__(self):
+    def __init__(self, pwf_cache: Optional[PWFCache] = None):
         self.present_worth_factor = 1.00
+        self.pwf_cache = pwf_cache
 
     def calculate_cost(self, inflation_rate:float,
                              init_construction_cost:float,
@@ -103,13 +105,14 @@ class MajorInspectionCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life, cache=self.pwf_cache)
         return init_construction_cost * self.present_worth_factor * cost
 
 class MajorRepairCost:
 
-    def __init__(self):
+    def __init__(self, pwf_cache: Optional[PWFCache] = None):
         self.present_worth_factor = 1.00
+        self.pwf_cache = pwf_cache
 
     def calculate_cost(self, inflation_rate:float,
                              init_construction_cost:float,
@@ -118,13 +121,14 @@ class MajorRepairCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life, cache=self.pwf_cache)
         return init_construction_cost * self.present_worth_factor * cost
     
 class BearingAndExpansionJointReplacementCost:
 
-    def __init__(self):
+    def __init__(self, pwf_cache: Optional[PWFCache] = None):
         self.present_worth_factor = 1.00
+        self.pwf_cache = pwf_cache
 
     def calculate_cost(self, inflation_rate:float,
                              total_superstructure_cost:float,
@@ -133,14 +137,15 @@ class BearingAndExpansionJointReplacementCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life, cache=self.pwf_cache)
         return total_superstructure_cost * self.present_worth_factor * cost
 
 class PeriodicMaintenanceCarbonCost:
     """Calculates emissions from maintenance activities."""
 
-    def __init__(self):
+    def __init__(self, pwf_cache: Optional[PWFCache] = None):
         self.present_worth_factor = 1.00
+        self.pwf_cache = pwf_cache
 
     def calculate_cost(self, inflation_rate:float,
                              total_carbon_emission_cost:float,
@@ -149,13 +154,14 @@ class PeriodicMaintenanceCarbonCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life, cache=self.pwf_cache)
         return total_carbon_emission_cost * self.present_worth_factor * cost
 
 class MajorRepairRelCarbonEmissionCost:
 
-    def __init__(self):
+    def __init__(self, pwf_cache: Optional[PWFCache] = None):
         self.present_worth_factor = 1.00
+        self.pwf_cache = pwf_cache
 
     def calculate_cost(self, inflation_rate:float,
                              total_carbon_emission_cost:float,
@@ -164,13 +170,14 @@ class MajorRepairRelCarbonEmissionCost:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(frequency, design_life, frequency))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, frequency, design_life, cache=self.pwf_cache)
         return total_carbon_emission_cost * self.present_worth_factor * cost
 
 class CarbonEmissionDueToRerouting:
 
-    def __init__(self):
+    def __init__(self, pwf_cache: Optional[PWFCache] = None):
         self.present_worth_factor = 1.00
+        self.pwf_cache = pwf_cache
 
     def calculate_cost(self, additional_rerouting_dist:float,
                              duration_major_repair:float,
@@ -183,7 +190,7 @@ class CarbonEmissionDueToRerouting:
                              discount_rate:float,
                              design_life:float) -> float:
         
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(repair_freq, design_life, repair_freq))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, repair_freq, design_life, cache=self.pwf_cache)
         return total_traffic * duration_major_repair * working_days_month * scc * co2_emission_per_km * self.present_worth_factor * additional_rerouting_dist
 
 class DemolitionCost:
@@ -198,7 +205,7 @@ class DemolitionCost:
                              inflation_rate:float,
                              discount_rate:float) -> float:
 
-        self.present_worth_factor = ((1 + inflation_rate) / (1 + discount_rate)) ** analysis_period                   
+        self.present_worth_factor = single_payment_pwf(inflation_rate, discount_rate, analysis_period)                   
         return init_constr_cost * self.present_worth_factor * demolition_disposal_cost
 
 class DemolitionCarbonCost:
@@ -212,13 +219,14 @@ class DemolitionCarbonCost:
                              inflation_rate:float,
                              discount_rate:float) -> float:
                              
-        self.present_worth_factor = ((1 + inflation_rate) / (1 + discount_rate)) ** analysis_period                   
+        self.present_worth_factor = single_payment_pwf(inflation_rate, discount_rate, analysis_period)                   
         return init_carbon_emission_cost * self.present_worth_factor * demolition_disposal_cost
 
 class DemolitionCarbonReroutingCost:
 
-    def __init__(self):
+    def __init__(self, pwf_cache: Optional[PWFCache] = None):
         self.present_worth_factor = 1.00
+        self.pwf_cache = pwf_cache
 
     def calculate_cost(self, additional_rerouting_dist:float,
                              init_constr_cost:float,
@@ -231,14 +239,15 @@ class DemolitionCarbonReroutingCost:
                              inflation_rate:float,
                              discount_rate:float) -> float:
 
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(analysis_period, design_life, analysis_period))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, analysis_period, design_life, cache=self.pwf_cache)
         return init_constr_cost * self.present_worth_factor * demolition_disposal_time * working_days_month * scc * co2_emission_per_km * additional_rerouting_dist
 
 class RecyclingCost:
     """Accounts for material salvage and repurposing costs."""
 
-    def __init__(self):
+    def __init__(self, pwf_cache: Optional[PWFCache] = None):
         self.present_worth_factor = 1.00
+        self.pwf_cache = pwf_cache
 
     def calculate_cost(self, total_material_cost:float,
                              material_scrap_rate:float,
@@ -248,7 +257,7 @@ class RecyclingCost:
                              inflation_rate:float,
                              discount_rate:float) -> float:
 
-        self.present_worth_factor = sum(((1 + inflation_rate) / (1 + discount_rate)) ** period for period in range(analysis_period, design_life, analysis_period))
+        self.present_worth_factor = present_worth_factor(inflation_rate, discount_rate, analysis_period, design_life, cache=self.pwf_cache)
         return material_scrap_rate * material_recyclability * total_material_cost * self.present_worth_factor
 
 class RoadUserCost(CostComponent):
@@ -283,7 +292,7 @@ class RepairAndRehabilitationCost(CostComponent):
     """Covers major structural repairs and retrofitting."""
 
     def __init__(self, repair_cost_rate, construction_cost=0, discount_rate=0, period=1, design_life=1):
-        pwf = 1 / ((1 + discount_rate) ** (period))
+        pwf = single_payment_pwf(0.0, discount_rate, period)
         cost = repair_cost_rate * construction_cost * pwf
         super().__init__(amount=cost, category="Economic", is_initial=False, is_recurring=True, present_worth_factor=pwf)
 
@@ -294,8 +303,9 @@ class RepairAndRehabilitationCost(CostComponent):
 class ReconstructionCost(CostComponent):
     """Accounts for partial or complete reconstruction of the bridge due to structural failures or obsolescence."""
 
-    def __init__(self, demolition_cost, reconstruction_cost, reconstruction_carbon_cost, reconstruction_time_cost, reconstruction_roaduser_cost, reconstruction_rerouting_carbon_cost, design_life, discount_rate):
-        pwf = 1 / ((1 + discount_rate) ** design_life)
+    def __init__(self, demolition_cost, reconstruction_cost, reconstruction_carbon_cost, reconstruction_time_cost, reconstruction_roaduser_cost, reconstruction_rerouting_carbon_cost, design_life, discount_rate, present_worth_factor=None):
+        # present_worth_factor: factor of several reconstructions (see lifecycle.LifecycleSchedule), default one after design_life
+        pwf = single_payment_pwf(0.0, discount_rate, design_life) if present_worth_factor is None else present_worth_factor
         cost = (demolition_cost + reconstruction_cost + reconstruction_carbon_cost + reconstruction_time_cost + reconstruction_roaduser_cost + reconstruction_rerouting_carbon_cost) * pwf 
         super().__init__(amount=cost, category="Economic", is_initial=False, is_recurring=False, present_worth_factor=pwf)
 
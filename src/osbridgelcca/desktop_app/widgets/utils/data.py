@@ -1,11 +1,20 @@
 # WPI Calculation
 BASE_YEAR = 2019
+# Year the costs are priced in (latest year of the WPI tables)
+PRICE_YEAR = 2024
 KEY_PASSENGER_COST = "Passenger Cost"
 KEY_CREW_COST = "Crew Cost"
 
 # Keys for database
 TABLE_WPI_MEDICAL = "wpi_medical_accessories"
 TABLE_VOT = "wpi_vot"
+TABLE_WPI_PROPERTY_DAMAGE = "wpi_property_damage"
+TABLE_WPI_FUEL = "voc_fuel_costs"
+TABLE_WPI_TYRE = "tyre_costs"
+TABLE_WPI_SPARE_PARTS = "spare_parts_costs"
+TABLE_WPI_FIXED_DEPRECIATION = "fixed_depreciation_costs"
+TABLE_WPI_COMMODITY_HOLDING = "commodity_holding_cost"
+TABLE_WPI_PASSENGER_CREW = "passenger_crew_costs"
 COL_ACCIDENT_CATEGORY = "Category_of_Accident"
 COL_COST_INR = "Economic_Cost_INR"
 COL_TYPE_OF_VEHICLE = "Type_of_Vehicle"
@@ -63,6 +72,32 @@ KEY_DELUXE_BUS = "Deluxe Buses"
 KEY_LCV = "LCV"
 KEY_HCV = "HCV"
 KEY_MCV = "MCV"
+
+# Vehicle categories of the traffic data -> vehicle types of the VOC engine (core/voc)
+VOC_VEHICLE_TYPES = {
+    KEY_TWO_WHEELER: "two_wheelers",
+    KEY_SMALL_CARS: "small_cars",
+    KEY_BIG_CARS: "big_cars",
+    KEY_ORDINARY_BUS: "buses",
+    KEY_DELUXE_BUS: "buses",
+    KEY_LCV: "lcv",
+    KEY_HCV: "hcv",
+    KEY_MCV: "mcv",
+}
+
+# Alternate road carriageway (traffic data) -> lane type of the VOC model (IRC SP 30).
+# Expressways use the standard widths of their number of lanes.
+VOC_LANE_TYPES = {
+    KEY_SINGLE_LANE_ROAD: "SL",
+    KEY_INTERMEDIATE_LANE_ROAD: "IL",
+    KEY_TWO_LANE_ROAD: "2L",
+    KEY_FOUR_LANE_DIVIDED_ROAD: "4L",
+    KEY_SIX_LANE_DIVIDED_ROAD: "6L",
+    KEY_FOUR_LANE_DIVIDED_EXPRESSWAY: "4L",
+    KEY_SIX_LANE_DIVIDED_EXPRESSWAY: "6L",
+    KEY_EIGHT_LANE_DIVIDED_URBAN_EXPRESSWAY: "8L",
+}
+
 KEY_MINOR_INJURY = "Minor Injury"
 KEY_MAJOR_INJURY = "Major Injury"
 KEY_FATAL = "Fatal"
@@ -98,6 +133,7 @@ COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION = "Periodic Maintenance Carbon Emissi
 COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION = "Major Repair Related Carbon Emisson Cost"
 COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR = "Carbon Emission due to rerouting during Major Repairs"
 COST_CARBON_EMISSION_RR_DURING_REPLACEMENT = "Carbon Emission due to rerouting during Replacement"
+COST_BEARING_EXP_JOINT_REPLACEMENT = "Replacement cost of Bearing and Expansion Joints"
 COST_DEMOLITION_DISPOSAL_CARBON = "Demolition and Disposal related Carbon Emission"
 COST_DEMOLITION_DISPOSAL_CARBON_REROUTING = "Carbon Emission due to Rerouting during Demolition and Disposal"
 COST_TOTAL_ROUTINE_INSPECTION = "Total Routine Inspection Cost"
@@ -148,6 +184,16 @@ KEY_STEEL_REBAR_RECYLABILITY = "Steel Rebar Recylability"
 KEY_PS_TENDONS_SCRAP_RATE = "Pre Stressed Tendons Scrap Rate"
 KEY_PS_TENDONS_RECYLABILITY = "Pre Stressed Tendons Recylability"
 
+# Recycled materials: (type_material, scrap rate key, recyclability key)
+RECYCLED_MATERIALS = [
+    ("Steel Rebar", KEY_STEEL_REBAR_SCRAP_RATE, KEY_STEEL_REBAR_RECYLABILITY),
+    ("Structural Steel", KEY_STRUCT_STEEL_SCRAP_RATE, KEY_STRUCT_STEEL_RECYLABILITY),
+    ("Tendons", KEY_PS_TENDONS_SCRAP_RATE, KEY_PS_TENDONS_RECYLABILITY),
+]
+
+# Multiplier applied to every bill of quantities amount (1.0 = quantities as entered)
+KEY_MATERIAL_QUANTITY_FACTOR = "Material Quantity Factor"
+
 # Bridge and Traffic Data
 KEY_ALTER_ROAD_CARRIAGEWAY = "Alternate Road Carriageway"
 KEY_ADDIT_REROUTING_DISTANCE = "Additional Rerouting Distance"
@@ -1,5 +1,9 @@
+import os
 import sqlite3
+import time
+from collections import namedtuple
 from typing import List, Dict, Tuple
+import numpy as np
 from .cost_component import ( BearingAndExpansionJointReplacementCost, CarbonEmissionDueToRerouting, DemolitionCarbonCost, DemolitionCarbonReroutingCost,
                                 InitialConstructionCost, MajorInspectionCost, MajorRepairCost,
                                 MajorRepairRelCarbonEmissionCost, TimeCost, RoadUserCost,
@@ -10,27 +14,67 @@ from .cost_component import ( BearingAndExpansionJointReplacementCost, CarbonEmi
 )
 from .data import *
 from .IRC_SP_30 import IRC_SP_30
+from .accident import (DAMAGE_VEHICLES, INJURY_CATEGORIES, AccidentCosts, accident_exposure, distribution_vector,
+                       evaluate_accident_costs)
+from .pwf import PWFCache
+from .ledger import (CASH_FLOW_LINES, CASH_FLOW_SCHEDULES, INITIAL, CashFlowLedger, CashFlowLine, CashFlowTable,
+                     analysis_horizon)
+from .lifecycle import RECONSTRUCTION, LifecycleCosts, lifecycle_schedule, lifecycle_timing
+from .vot import vehicle_counts, vot_per_day
+from .sweep import SweepResult, evaluate_scenarios, snapshot_inputs
+from .monte_carlo import MonteCarloEngine
+from .dependency_graph import INPUT_ATTRIBUTES, DependencyGraph
+from .storage import DEFAULT_PROFILE, PROJECTS_DIR, StorageProfile, migrate, project_db_path, remove_database
 
-# from .core.main import calc_voc
+from .core.main import calc_voc, vc as VOLUME_CAPACITY_RATIO
+from .core.voc.cache import VOCCache
+
+# Statistics of the last structure works save (see DatabaseManager.last_ingest_stats)
+IngestStats = namedtuple("IngestStats", ["rows", "deleted", "seconds", "rows_per_second"])
+
+# Maximum number of comp_ids bound in one DELETE ... IN (...) statement
+# (SQLite limits the number of host parameters per statement)
+DELETE_CHUNK_SIZE = 500
+
+# End-of-life lines priced by DatabaseManager._end_of_life_payment() in lifecycle costs
+END_OF_LIFE_PAYMENTS = (COST_DEMOLITION_DISPOSAL_CARBON_REROUTING, COST_RECYCLING)
 
 
 class DatabaseManager:
     """Database manager for Structure Works Data"""
     
-    def __init__(self, db_path: str = "widgets/utils/structure_works.db", recreate: bool = True):
+    def __init__(self, db_path: str = "widgets/utils/structure_works.db", recreate: bool = False,
+                 pwf_cache: PWFCache = None, profile: StorageProfile = DEFAULT_PROFILE,
+                 voc_cache: VOCCache = None):
         """
         Initialize database connection and create tables if they don't exist
         
         Args:
             db_path: Path to the database file
-            recreate: If True, delete existing database and create fresh. If False, use existing database.
+            recreate: If True, delete existing database and create fresh. If False, use existing database
+                      (migrated to the current schema version).
+            pwf_cache: Present worth factor cache. Pass a shared cache to reuse factors
+                       across managers evaluating the same financial profile.
+            profile: SQLite settings (journal mode, synchronous, mmap, cache size,
+                     foreign keys, in-memory). See storage.StorageProfile.
+            voc_cache: Vehicle model cache of the road user cost. Pass a shared cache to
+                       reuse the vehicle models across managers with the same road condition.
         """
 
         # Instantiate IRC_SP_30
         self.irc_sp_30 = IRC_SP_30()
 
+        # Present worth factors shared by all recurring cost components
+        self.pwf_cache = pwf_cache if pwf_cache is not None else PWFCache()
+        # Vehicle model results of the VOC, see core.voc.cache.VOCCache
+        self.voc_cache = voc_cache if voc_cache is not None else VOCCache()
+
         self.db_path = db_path
         self.conn = None
+        self.last_ingest_stats = None
+        # Cached SUM(quantity*rate) per (work type, material), see get_material_cost_totals()
+        self._material_cost_totals = None
+        self.profile = profile
         self.create_database(recreate=recreate)
 
         # Data from UI
@@ -59,9 +103,9 @@ class DatabaseManager:
             KEY_ALTER_ROAD_CARRIAGEWAY: "Two Lane Roads", # String
             KEY_ADDIT_REROUTING_DISTANCE: 6.0,
             KEY_ADDIT_TRAVEL_TIME: 1.5, # hours
-            KEY_ROAD_ROUGHNESS: 3000, # String
-            KEY_ROAD_RISE: 2000, # String
-            KEY_ROAD_FALL: 1000, # String
+            KEY_ROAD_ROUGHNESS: 2000, # mm/km, string from the UI
+            KEY_ROAD_RISE: 0, # m/km, string from the UI
+            KEY_ROAD_FALL: 0, # m/km, string from the UI
             KEY_ROAD_TYPE: "Urban Road", # String
             KEY_CRASH_RATE: 30.0
         }
@@ -91,6 +135,8 @@ class DatabaseManager:
             KEY_DIESEL: 0.7
         }
         self.WORK_ZONE_MULTIPLIER = 1.0
+        # Year of the WPI adjustment of the road user costs
+        self.PRICE_YEAR = PRICE_YEAR
 
         # Total Costs
         self.results = {
@@ -106,6 +152,8 @@ class DatabaseManager:
             COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION: None,
             COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION: None,
             COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR: None,
+            COST_BEARING_EXP_JOINT_REPLACEMENT: None,
+            COST_CARBON_EMISSION_RR_DURING_REPLACEMENT: None,
             COST_DEMOLITION_DISPOSAL: None,
             COST_DEMOLITION_DISPOSAL_CARBON: None,
             COST_DEMOLITION_DISPOSAL_CARBON_REROUTING: None,
@@ -126,90 +174,54 @@ class DatabaseManager:
         self.DURATION_REPLACEMENT = 2/self.WORKING_DAYS_IN_MONTH
         # Duration of Demolition and Disposal (Month)
         self.DURATION_DEMOLITION_DISPOSAL = 2
+        # Power weight ratio of the VOC model (MCV, HCV)
+        self.VOC_POWER_WEIGHT_RATIO = {"mcv": 8, "hcv": 7.22}
+
+        # Which results are out of date with respect to their inputs.
+        # Results that have never been computed start dirty.
+        self.dependencies = DependencyGraph()
+        self.dependencies.dirty.update(key for key in self.dependencies.nodes if self.results.get(key) is None)
+        # Yearly payments of the clean results, dropped with their result (see cash_flows())
+        self.ledger = CashFlowLedger()
+        # A reopened project already has structure works: its totals must come from the database
+        if self.conn.execute("SELECT EXISTS (SELECT 1 FROM struct_works_data)").fetchone()[0]:
+            self.invalidate(KEY_STRUCTURE_WORKS_DATA, KEY_CARBON_EMISSION)
+
+    @classmethod
+    def open_project(cls, project_name: str, projects_dir: str = PROJECTS_DIR, **kwargs) -> "DatabaseManager":
+        """
+        Open (or create) the persistent database of a project.
+
+        Args:
+            project_name: Name of the project, used as the database file name
+            projects_dir: Folder holding the project databases
+            kwargs: Other DatabaseManager arguments (pwf_cache, profile, voc_cache)
+        """
+        return cls(db_path=project_db_path(project_name, projects_dir), recreate=False, **kwargs)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Assigning new UI data (e.g. from a widget's collect_data) invalidates the results reading it
+        group = INPUT_ATTRIBUTES.get(name)
+        if group is not None and "dependencies" in self.__dict__:
+            self.invalidate(group)
     
-    def create_database(self, recreate: bool = True):
+    def create_database(self, recreate: bool = False):
         """
-        Create database tables with proper schema
+        Open the database with the storage profile and migrate it to the current schema
         
         Args:
             recreate: If True, delete existing database and create fresh
         """
-        import os
-        
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        
         # Delete existing database if recreate is True
-        if recreate and os.path.exists(self.db_path):
-            os.remove(self.db_path)
+        if recreate and not self.profile.in_memory and os.path.exists(self.db_path):
+            remove_database(self.db_path)
             print(f"Deleted existing database: {self.db_path}")
         
-        self.conn = sqlite3.connect(self.db_path)
-        cursor = self.conn.cursor()
-        
-        # Create struct_works_data table first with comp_id as PRIMARY KEY
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS struct_works_data (
-                comp_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                type TEXT NOT NULL CHECK(type IN (
-                    'Foundation', 
-                    'Sub-Structure', 
-                    'Super-Structure', 
-                    'Miscellaneous'
-                )),
-                component_type TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Create component table with comp_id as FOREIGN KEY
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS component (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                comp_id INTEGER NOT NULL,
-                type_material TEXT NOT NULL,
-                grade TEXT NOT NULL,
-                quantity REAL NOT NULL DEFAULT 0,
-                unit TEXT NOT NULL,
-                rate REAL NOT NULL DEFAULT 0.0,
-                rate_data_source TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (comp_id) REFERENCES struct_works_data(comp_id) ON DELETE CASCADE
-            )
-        ''')
-
-        # Create financial_data table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS financial_data (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                real_discount_rate REAL NOT NULL,
-                interest_rate REAL NOT NULL,
-                investment_ratio REAL NOT NULL,
-                duration_of_study INTEGER NOT NULL,
-                time_of_project INTEGER NOT NULL,       
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                       
-            )
-        ''')
-
-        cursor.execute('''
-             CREATE TABLE IF NOT EXISTS carbon_emission(
-                type_material TEXT NOT NULL,
-                grade TEXT NOT NULL,
-                quantity REAL NOT NULL DEFAULT 0,
-                unit TEXT NOT NULL,
-                emission_factor REAL NOT NULL,
-                embodied REAL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                PRIMARY KEY (type_material, grade, unit)
-            )
-        ''')
-        
-        self.conn.commit()
+        self.conn = self.profile.connect(self.db_path)
+        applied = migrate(self.conn)
+        if applied:
+            print(f"Applied {applied} schema migration(s) to {self.db_path}")
     
     def insert_structure_work(self, work_type: str, component_type: str) -> int:
         """
@@ -263,7 +275,8 @@ class DatabaseManager:
     
     def input_data_row(self, work_type: str, rows_data: List[Dict]) -> List[int]:
         """
-        Input complete data row with structure work and multiple components
+        Input complete data row with structure work and multiple components,
+        in a single transaction (see replace_structure_work_rows)
         
         Args:
             work_type: Type of structure work (Foundation, Sub-Structure, etc.)
@@ -289,42 +302,15 @@ class DatabaseManager:
                 ...
             ]
         """
-        if not rows_data:
-            raise ValueError("rows_data cannot be empty")
-        
-        created_comp_ids: List[int] = []
-        for row in rows_data:
-            # Get component type from first row
-            component_type = row[0].get(KEY_COMPONENT, "Unknown")
-
-            # Create structure work entry - this generates comp_id
-            comp_id = self.insert_structure_work(work_type, component_type)
-            created_comp_ids.append(comp_id)
-
-            # Insert all component rows with the generated comp_id
-            for row_dict in row:
-                type_material = row_dict.get(KEY_TYPE, "")
-                grade = row_dict.get(KEY_GRADE, "")
-                quantity = float(row_dict.get(KEY_QUANTITY, 0))
-                unit = row_dict.get(KEY_UNIT_M3, "")
-                rate = float(row_dict.get(KEY_RATE, 0.0))
-                rate_data_source = row_dict.get(KEY_RATE_DATA_SOURCE, "")
-                
-                self.insert_component(
-                    comp_id=comp_id,
-                    type_material=type_material,
-                    grade=grade,
-                    quantity=quantity,
-                    unit=unit,
-                    rate=rate,
-                    rate_data_source=rate_data_source
-                )
-        
-        return created_comp_ids
+        return self.replace_structure_work_rows(work_type, rows_data, old_comp_ids=[])
 
     def replace_structure_work_rows(self, work_type: str, rows_data: List[Dict], old_comp_ids: List[int]) -> List[int]:
         """
         Delete existing structure work rows by comp_id and insert new rows.
+
+        The deletes and inserts run in a single transaction (one commit), the
+        components are written with executemany, and the throughput of the save
+        is kept in last_ingest_stats.
         
         Args:
             work_type: Type of structure work (Foundation, Sub-Structure, etc.)
@@ -334,24 +320,97 @@ class DatabaseManager:
         Returns:
             List[int]: Newly created comp_id values for the inserted data
         """
-        if old_comp_ids:
-            for comp_id in old_comp_ids:
-                self.delete_structure_work(comp_id)
-                self.delete_component(comp_id)
-        
-        return self.input_data_row(work_type, rows_data)
+        if not rows_data:
+            raise ValueError("rows_data cannot be empty")
+
+        start = time.perf_counter()
+        # One transaction for the whole save: committed once, rolled back on any error
+        with self.conn:
+            cursor = self.conn.cursor()
+            if old_comp_ids:
+                self._delete_structure_works(cursor, old_comp_ids)
+            created_comp_ids, n_components = self._insert_structure_work_rows(cursor, work_type, rows_data)
+        seconds = time.perf_counter() - start
+
+        self.last_ingest_stats = IngestStats(
+            rows=n_components,
+            deleted=len(old_comp_ids or []),
+            seconds=seconds,
+            rows_per_second=n_components / seconds if seconds > 0 else float("inf")
+        )
+        print(f"Saved {n_components} {work_type} rows in {seconds:.3f} s "
+              f"({self.last_ingest_stats.rows_per_second:.0f} rows/s)")
+
+        self.invalidate(KEY_STRUCTURE_WORKS_DATA)
+        return created_comp_ids
+
+    def _insert_structure_work_rows(self, cursor, work_type: str, rows_data: List[Dict]) -> Tuple[List[int], int]:
+        """
+        Insert structure works and their components without committing.
+
+        Returns:
+            (comp_id of every row, number of component rows inserted)
+        """
+        created_comp_ids: List[int] = []
+        components = []
+        for row in rows_data:
+            # Get component type from first row
+            component_type = row[0].get(KEY_COMPONENT, "Unknown")
+
+            # Create structure work entry - this generates comp_id
+            cursor.execute('''
+                INSERT INTO struct_works_data (type, component_type)
+                VALUES (?, ?)
+            ''', (work_type, component_type))
+            comp_id = cursor.lastrowid
+            created_comp_ids.append(comp_id)
+
+            for row_dict in row:
+                components.append((
+                    comp_id,
+                    row_dict.get(KEY_TYPE, ""),
+                    row_dict.get(KEY_GRADE, ""),
+                    float(row_dict.get(KEY_QUANTITY, 0)),
+                    row_dict.get(KEY_UNIT_M3, ""),
+                    float(row_dict.get(KEY_RATE, 0.0)),
+                    row_dict.get(KEY_RATE_DATA_SOURCE, "")
+                ))
+
+        # All material rows in one statement
+        cursor.executemany('''
+            INSERT INTO component (comp_id, type_material, grade, quantity, unit, rate, rate_data_source)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', components)
+        return created_comp_ids, len(components)
+
+    def _delete_structure_works(self, cursor, comp_ids: List[int]):
+        """Delete structure works and their components by comp_id (IN-list), without committing."""
+        comp_ids = list(comp_ids)
+        for i in range(0, len(comp_ids), DELETE_CHUNK_SIZE):
+            chunk = comp_ids[i:i + DELETE_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor.execute(f'DELETE FROM component WHERE comp_id IN ({placeholders})', chunk)
+            cursor.execute(f'DELETE FROM struct_works_data WHERE comp_id IN ({placeholders})', chunk)
+
+    def delete_structure_works(self, comp_ids: List[int]):
+        """Delete several structure works and all their components in one transaction"""
+        with self.conn:
+            self._delete_structure_works(self.conn.cursor(), comp_ids)
+        self.invalidate(KEY_STRUCTURE_WORKS_DATA)
 
     def delete_structure_work(self, comp_id: int):
         """Delete a structure work and all its components (CASCADE)"""
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM struct_works_data WHERE comp_id = ?', (comp_id,))
         self.conn.commit()
+        self.invalidate(KEY_STRUCTURE_WORKS_DATA)
     
     def delete_component(self, component_id: int):
         """Delete a specific component by its ID"""
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM component WHERE comp_id = ?', (component_id,))
         self.conn.commit()
+        self.invalidate(KEY_STRUCTURE_WORKS_DATA)
 
     def get_all_materials_info(self) -> List[Dict]:
         """
@@ -419,6 +478,40 @@ class DatabaseManager:
         
         return results
 
+    def get_material_cost_totals(self) -> Dict[Tuple[str, str], float]:
+        """
+        Total cost (SUM(quantity * rate)) of every material in every structure work type,
+        computed by one grouped query.
+
+        The result is cached until the structure works change.
+
+        Returns:
+            Dictionary {(work_type, type_material): total cost}, e.g.
+            {(KEY_SUPERSTRUCTURE, "Structural Steel"): 1800000.0, ...}
+        """
+        if self._material_cost_totals is None:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                SELECT s.type, c.type_material, SUM(c.quantity * c.rate)
+                FROM component c
+                LEFT JOIN struct_works_data s ON s.comp_id = c.comp_id
+                GROUP BY s.type, c.type_material
+            ''')
+            self._material_cost_totals = {(row[0], row[1]): row[2] for row in cursor.fetchall()}
+        return self._material_cost_totals
+
+    def get_total_material_cost(self, work_type: str = None, type_material: str = None) -> float:
+        """
+        Sum of quantity * rate over the component rows, read from get_material_cost_totals().
+
+        Args:
+            work_type: Only this structure work type (Foundation, Super-Structure, ...); all if None
+            type_material: Only this material (e.g. "Steel Rebar"); all if None
+        """
+        return sum(total for (work, material), total in self.get_material_cost_totals().items()
+                   if (work_type is None or work == work_type)
+                   and (type_material is None or material == type_material))
+
     def get_unique_materials_and_grades(self) -> List[List[str]]:
         """
         Retrieve all unique material and grade pairs from the component table
@@ -477,6 +570,7 @@ class DatabaseManager:
             # Execute batch insert
             cursor.executemany(insert_query, records)
             self.conn.commit()
+            self.invalidate(KEY_CARBON_EMISSION)
             
             print(f"Successfully inserted {len(records)} records")
             return True
@@ -513,26 +607,87 @@ class DatabaseManager:
         if self.conn:
             self.conn.close()
 
+    #==========Incremental-Recompute-Start=====================
+    def invalidate(self, *names: str):
+        """
+        Mark every result depending on the given input groups (or results) dirty
+        and drop their stale values.
+
+        Assigning one of the UI data attributes and editing the structure works
+        or carbon emission tables does this automatically; call it after changing
+        one of the UI data dictionaries in place, e.g.
+        invalidate(KEY_FINANCIAL) after financial_data[KEY_DESIGN_LIFE] = 60.
+
+        Args:
+            names: Input groups (KEY_FINANCIAL, KEY_STRUCTURE_WORKS_DATA, ...) or result keys
+        """
+        if KEY_STRUCTURE_WORKS_DATA in names:
+            self._material_cost_totals = None
+        for key in self.dependencies.invalidate(*names):
+            self.results[key] = None
+            self.ledger.discard(key)
+
+    def _store_result(self, key: str, value):
+        """Save a computed result; results computed from a different previous value become dirty."""
+        previous = self.results.get(key)
+        self.results[key] = value
+        self.dependencies.mark_clean(key)
+        if previous != value:
+            self.invalidate(key)
+
+    def _input_available(self, group: str) -> bool:
+        """Whether the UI data of an input group has been entered (database inputs always are)."""
+        return all(getattr(self, name) for name, g in INPUT_ATTRIBUTES.items() if g == group)
+
+    def result(self, key: str):
+        """
+        Value of a result, recomputed first if one of its inputs changed.
+
+        Args:
+            key: Result key (COST_TOTAL_INIT_CONST, COST_TIME, ...)
+        """
+        if key in self.dependencies.dirty:
+            getattr(self, self.dependencies.method(key))()
+        return self.results.get(key)
+
+    def recompute(self, targets: List[str] = None) -> Dict[str, float]:
+        """
+        Recompute the dirty results in topological order.
+
+        Results whose input data has not been entered yet (e.g. the maintenance
+        costs before the maintenance tab is saved) stay dirty until it is.
+
+        Args:
+            targets: Only recompute what these results need (default: all dirty results)
+
+        Returns:
+            Dictionary of the recomputed results
+        """
+        recomputed = {}
+        for key in self.dependencies.pending(targets):
+            if key not in self.dependencies.dirty:
+                continue
+            ready = (all(self._input_available(group) for group in self.dependencies.input_groups(key))
+                     and not any(r in self.dependencies.dirty for r in self.dependencies.upstream_results(key)))
+            if ready:
+                recomputed[key] = getattr(self, self.dependencies.method(key))()
+        return recomputed
+    #==========Incremental-Recompute-End=======================
+
     #========================Calculations========================
 
     #=================Initial-Stage-Cost-Start===================
     # 1. Initial Cost Calculation 
     def calculate_total_initial_cost(self) -> float:
-        obj = InitialConstructionCost()
-        data = self.get_all_materials_info()
         total_cost = 0.0
-        for item in data:
-            cost = obj.calculate_cost(
-                quantity=item.get(KEY_QUANTITY),
-                rate=item.get(KEY_RATE)
-            )
-            print(f"\nMaterial={item.get(KEY_TYPE)}\nQuantity={item.get(KEY_QUANTITY)}\nRate={item.get(KEY_RATE)}\nCost={cost}")
+        for (work_type, material), cost in self.get_material_cost_totals().items():
+            print(f"\nWork={work_type}\nMaterial={material}\nCost={cost}")
             total_cost += cost
 
         print("\n1.Total Initial Construction Cost:", total_cost)
 
         # Store Total Initial cost
-        self.results[COST_TOTAL_INIT_CONST] = total_cost
+        self._store_result(COST_TOTAL_INIT_CONST, total_cost)
         return total_cost
 
     # 2. Initial Carbon Emission Cost
@@ -558,7 +713,7 @@ class DatabaseManager:
             print(f"Carbon Emission Cost for {item.get(KEY_TYPE)}:", carbon_emission_cost)
         
         print("\n2.Total Carbon Emission Cost:", total_carbon_emission_cost)
-        self.results[COST_TOTAL_INIT_CARBON_EMISSION] = total_carbon_emission_cost
+        self._store_result(COST_TOTAL_INIT_CARBON_EMISSION, total_carbon_emission_cost)
         return total_carbon_emission_cost
     
     # 3. Time Cost
@@ -566,14 +721,14 @@ class DatabaseManager:
 
         component = TimeCost()
         cost = component.calculate_cost(
-            construction_cost=self.results.get(COST_TOTAL_INIT_CONST),
+            construction_cost=self.result(COST_TOTAL_INIT_CONST),
             interest_rate=self.financial_data.get(KEY_INTEREST_RATE),
             time=self.financial_data.get(KEY_CONSTR_TIME),
             investment_ratio=self.financial_data.get(KEY_INVESTMENT_RATIO)
         )
         print("\n3.Time Cost: ", cost)
         # Save the time cost
-        self.results[COST_TIME] = cost
+        self._store_result(COST_TIME, cost)
         return cost
 
     # Helper function to get total traffic
@@ -593,7 +748,7 @@ class DatabaseManager:
         SCC = self.carbon_emission_cost_data.get(KEY_SCC)
         cost = total_traffic * init_const_time * 12 * self.WORKING_DAYS_IN_MONTH * SCC * self.CO2_EMISSION_PER_KM * rerouting_dist
 
-        self.results[COST_CARBON_EMISSION_REROUTING_INIT] = cost
+        self._store_result(COST_CARBON_EMISSION_REROUTING_INIT, cost)
         print(f"\n5.Carbon Emission due to Rerouting during Initial Construction. {cost}")
         return cost
     
@@ -603,18 +758,18 @@ class DatabaseManager:
     # 1. Routine Inspection Cost Calculation
     def routine_inspection_cost(self) -> float:
 
-        component = RoutineInspectionCost()
+        component = RoutineInspectionCost(pwf_cache=self.pwf_cache)
 
         cost = component.calculate_cost(
             inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            init_construction_cost=self.results.get(COST_TOTAL_INIT_CONST),
+            init_construction_cost=self.result(COST_TOTAL_INIT_CONST),
             cost=self.maintainance_and_repair_data.get(KEY_ROUTINE_INSP_COST),
             frequency=self.maintainance_and_repair_data.get(KEY_ROUTINE_INSP_FREQ),
             discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
             design_life=self.financial_data.get(KEY_DESIGN_LIFE)
         )
 
-        self.results[COST_TOTAL_ROUTINE_INSPECTION] = cost
+        self._store_result(COST_TOTAL_ROUTINE_INSPECTION, cost)
         print("\n1.Routine Inspection Cost: ", cost)
         return cost
 
@@ -622,97 +777,97 @@ class DatabaseManager:
     # 2. Periodic Maintainance Cost
     def periodic_maintainance_cost(self) -> float:
 
-        component = PeriodicMaintenanceCost()
+        component = PeriodicMaintenanceCost(pwf_cache=self.pwf_cache)
 
         cost = component.calculate_cost(
             inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            init_construction_cost=self.results.get(COST_TOTAL_INIT_CONST),
+            init_construction_cost=self.result(COST_TOTAL_INIT_CONST),
             cost=self.maintainance_and_repair_data.get(KEY_PERIODIC_MAINT_COST),
             frequency=self.maintainance_and_repair_data.get(KEY_PERIODIC_MAINT_FREQ),
             discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
             design_life=self.financial_data.get(KEY_DESIGN_LIFE)
         )
 
-        self.results[COST_PERIODIC_MAINTAINANCE] = cost
+        self._store_result(COST_PERIODIC_MAINTAINANCE, cost)
         print("\n2.Periodic Maintenance Cost: ", cost)
         return cost
     
     # 3. Periodic Maintenance Carbon Emission Cost Calculation
     def periodic_maintainance_carbon_emission_cost(self):
 
-        component = PeriodicMaintenanceCarbonCost()
+        component = PeriodicMaintenanceCarbonCost(pwf_cache=self.pwf_cache)
 
         cost = component.calculate_cost(
             inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            total_carbon_emission_cost=self.results.get(COST_TOTAL_INIT_CARBON_EMISSION),
+            total_carbon_emission_cost=self.result(COST_TOTAL_INIT_CARBON_EMISSION),
             cost=self.maintainance_and_repair_data.get(KEY_PERIODIC_MAINT_COST),
             frequency=self.maintainance_and_repair_data.get(KEY_PERIODIC_MAINT_FREQ),
             discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
             design_life=self.financial_data.get(KEY_DESIGN_LIFE)
         )
 
-        self.results[COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION] = cost
+        self._store_result(COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION, cost)
         print("\n3.Periodic Maintenance Carbon Emission Cost:", cost)
         return cost
     
     # 4. Major Inspection Cost
     def major_inspection_cost(self) -> float:
 
-        component = MajorInspectionCost()
+        component = MajorInspectionCost(pwf_cache=self.pwf_cache)
 
         cost = component.calculate_cost(
             inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            init_construction_cost=self.results.get(COST_TOTAL_INIT_CONST),
+            init_construction_cost=self.result(COST_TOTAL_INIT_CONST),
             cost=self.maintainance_and_repair_data.get(KEY_MAJOR_INSP_COST),
             frequency=self.maintainance_and_repair_data.get(KEY_MAJOR_INSP_FREQ),
             discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
             design_life=self.financial_data.get(KEY_DESIGN_LIFE)
         )
 
-        self.results[COST_MAJOR_INSPECTION] = cost
+        self._store_result(COST_MAJOR_INSPECTION, cost)
         print("\n4.Major Inspection Cost: ", cost)
         return cost
     
     # 5. Major Repair Cost
     def major_repair_cost(self) -> float:
 
-        component = MajorRepairCost()
+        component = MajorRepairCost(pwf_cache=self.pwf_cache)
 
         cost = component.calculate_cost(
             inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            init_construction_cost=self.results.get(COST_TOTAL_INIT_CONST),
+            init_construction_cost=self.result(COST_TOTAL_INIT_CONST),
             cost=self.maintainance_and_repair_data.get(KEY_MAJOR_REPAIR_COST),
             frequency=self.maintainance_and_repair_data.get(KEY_MAJOR_REPAIR_FREQ),
             discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
             design_life=self.financial_data.get(KEY_DESIGN_LIFE)
         )
 
-        self.results[COST_MAJOR_REPAIR] = cost
+        self._store_result(COST_MAJOR_REPAIR, cost)
         print("\n5.Major Repair Cost: ", cost)
         return cost
     
     # 6. Major Repair Related Carbon Emisson Cost
     def major_repair_related_carbon_emission_cost(self):
 
-        component = MajorRepairRelCarbonEmissionCost()
+        component = MajorRepairRelCarbonEmissionCost(pwf_cache=self.pwf_cache)
 
         cost = component.calculate_cost(
             inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
-            total_carbon_emission_cost=self.results.get(COST_TOTAL_INIT_CARBON_EMISSION),
+            total_carbon_emission_cost=self.result(COST_TOTAL_INIT_CARBON_EMISSION),
             cost=self.maintainance_and_repair_data.get(KEY_MAJOR_REPAIR_COST),
             frequency=self.maintainance_and_repair_data.get(KEY_MAJOR_REPAIR_FREQ),
             discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
             design_life=self.financial_data.get(KEY_DESIGN_LIFE)
         )
 
-        self.results[COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION] = cost
+        self._store_result(COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION, cost)
         print("\n6.Major Repair Related Carbon Emisson Cost: ", cost)
         return cost
     
     # 8. Carbon Emission due to rerouting during Major Repairs
     def carbon_emission_rerouting_during_major_repairs(self):
 
-        component = CarbonEmissionDueToRerouting()
+        component = CarbonEmissionDueToRerouting(pwf_cache=self.pwf_cache)
 
         total_traffic = self._get_total_traffic()
         SCC = self.carbon_emission_cost_data.get(KEY_SCC)
@@ -731,37 +886,25 @@ class DatabaseManager:
             design_life=self.financial_data.get(KEY_DESIGN_LIFE)
         )
 
-        self.results[COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR] = cost
+        self._store_result(COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR, cost)
         print("\n8.Carbon Emission due to rerouting during Major Repairs: ", cost)
         return cost
     
     # Helper function for 9
     def _calculate_superstructure_cost(self) -> float:
-        obj = InitialConstructionCost()
-        data = self.get_all_superstructures_data()
-        print("\nCalculating Total of SuperStructures")
-        total_cost = 0.0
-        print(data)
-        for item in data:
-            print(item.get(KEY_QUANTITY),item.get(KEY_RATE))
-            cost = obj.calculate_cost(
-                quantity=item.get(KEY_QUANTITY),
-                rate=item.get(KEY_RATE)
-            )
-            print(f"\nMaterial={item.get(KEY_TYPE)}\nQuantity={item.get(KEY_QUANTITY)}\nRate={item.get(KEY_RATE)}\nCost={cost}")
-            total_cost += cost
+        total_cost = self.get_total_material_cost(work_type=KEY_SUPERSTRUCTURE)
 
         print("\nTotal SuperStructures Cost:", total_cost)
 
         # Store Total SuperStructures cost
-        self.results[COST_TOTAL_SUPERSTRUCTURE] = total_cost
+        self._store_result(COST_TOTAL_SUPERSTRUCTURE, total_cost)
         return total_cost
     
     # 9. Replacement cost of Bearing and Expansion Joints
     def bearing_expansion_joint_replacement_cost(self) -> float:
 
-        component = BearingAndExpansionJointReplacementCost()
-        total_superstructure_cost = self._calculate_superstructure_cost()
+        component = BearingAndExpansionJointReplacementCost(pwf_cache=self.pwf_cache)
+        total_superstructure_cost = self.result(COST_TOTAL_SUPERSTRUCTURE)
 
         cost = component.calculate_cost(
             inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
@@ -772,14 +915,14 @@ class DatabaseManager:
             design_life=self.financial_data.get(KEY_DESIGN_LIFE)
         )
 
-        self.results[COST_MAJOR_INSPECTION] = cost
+        self._store_result(COST_BEARING_EXP_JOINT_REPLACEMENT, cost)
         print("\n9.Replacement cost of Bearing and Expansion Joints: ", cost)
         return cost
 
     # 11. Carbon Emission due to rerouting during Replacement
     def carbon_emission_rerouting_during_replacement(self):
 
-        component = CarbonEmissionDueToRerouting()
+        component = CarbonEmissionDueToRerouting(pwf_cache=self.pwf_cache)
 
         total_traffic = self._get_total_traffic()
         SCC = self.carbon_emission_cost_data.get(KEY_SCC)
@@ -798,7 +941,7 @@ class DatabaseManager:
             design_life=self.financial_data.get(KEY_DESIGN_LIFE)
         )
 
-        self.results[COST_CARBON_EMISSION_RR_DURING_REPLACEMENT] = cost
+        self._store_result(COST_CARBON_EMISSION_RR_DURING_REPLACEMENT, cost)
         print("\n11.Carbon Emission due to rerouting during Replacement: ", cost)
         return cost
     #=================Use-Stage-Cost-End=====================
@@ -806,17 +949,7 @@ class DatabaseManager:
     #==========End-Of-Life-Stage-Cost-Start==================
     # Helper function to get sum(quantity*rate) for given Type(Material)
     def _get_total_cost_material(self, type:str)->float:
-        obj = InitialConstructionCost()
-        data = self.get_all_materials_info()
-        total_cost = 0.0
-        for item in data:
-            if item.get(KEY_TYPE) == type:
-                cost = obj.calculate_cost(
-                    quantity=item.get(KEY_QUANTITY),
-                    rate=item.get(KEY_RATE)
-                )
-                total_cost += cost
-        
+        total_cost = self.get_total_material_cost(type_material=type)
         print(f"\nMaterial={type}\nTotal Cost={total_cost}")
         return total_cost
     
@@ -826,13 +959,13 @@ class DatabaseManager:
         component = DemolitionCost()
         
         cost = component.calculate_cost(
-            init_constr_cost=self.results.get(COST_TOTAL_INIT_CONST),
+            init_constr_cost=self.result(COST_TOTAL_INIT_CONST),
             demolition_disposal_cost=self.demolition_and_recycling_data.get(KEY_DEMOLITION_DISPOSAL_COST),
             analysis_period=self.financial_data.get(KEY_ANALYSIS_PERIOD),
             inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
             discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA)
         )
-        self.results[COST_DEMOLITION_DISPOSAL] = cost
+        self._store_result(COST_DEMOLITION_DISPOSAL, cost)
         print("\n1.Demolition and Disposal Cost:", cost)
         return cost
     
@@ -842,26 +975,26 @@ class DatabaseManager:
         component = DemolitionCarbonCost()
         
         cost = component.calculate_cost(
-            init_carbon_emission_cost=self.results.get(COST_TOTAL_INIT_CARBON_EMISSION),
+            init_carbon_emission_cost=self.result(COST_TOTAL_INIT_CARBON_EMISSION),
             demolition_disposal_cost=self.demolition_and_recycling_data.get(KEY_DEMOLITION_DISPOSAL_COST),
             analysis_period=self.financial_data.get(KEY_ANALYSIS_PERIOD),
             inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
             discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA)
         )
-        self.results[COST_DEMOLITION_DISPOSAL_CARBON] = cost
+        self._store_result(COST_DEMOLITION_DISPOSAL_CARBON, cost)
         print("\n2.Demolition and Disposal related Carbon Emission:", cost)
         return cost
     
     # 4. Carbon Emission due to Rerouting during Demolition and Disposal
     def demolition_disposal_rerouting_carbon_emission_cost(self) -> float:
         
-        component = DemolitionCarbonReroutingCost()
+        component = DemolitionCarbonReroutingCost(pwf_cache=self.pwf_cache)
         SCC = self.carbon_emission_cost_data.get(KEY_SCC)
         addit_rerouting = self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE)
 
         cost = component.calculate_cost(
             additional_rerouting_dist=addit_rerouting,
-            init_constr_cost=self.results.get(COST_TOTAL_INIT_CONST),
+            init_constr_cost=self.result(COST_TOTAL_INIT_CONST),
             demolition_disposal_time=self.DURATION_DEMOLITION_DISPOSAL,
             working_days_month=self.WORKING_DAYS_IN_MONTH,
             scc=SCC,
@@ -871,7 +1004,7 @@ class DatabaseManager:
             inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
             discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA)
         )
-        self.results[COST_DEMOLITION_DISPOSAL_CARBON_REROUTING] = cost
+        self._store_result(COST_DEMOLITION_DISPOSAL_CARBON_REROUTING, cost)
         print("\n4.Carbon Emission due to Rerouting during Demolition and Disposal:", cost)
         return cost
     
@@ -883,7 +1016,7 @@ class DatabaseManager:
         struct_steel_cost = self._get_total_cost_material(type="Structural Steel")
         pre_stressed_tendons_cost = self._get_total_cost_material(type="Tendons")
         
-        component = RecyclingCost()
+        component = RecyclingCost(pwf_cache=self.pwf_cache)
 
         #-------Steel-Rebar-Cost-----------------------------------
         steel_rebar_recycle_cost = component.calculate_cost(
@@ -923,13 +1056,148 @@ class DatabaseManager:
 
         total_recycling_cost = steel_rebar_recycle_cost + struct_steel_recycle_cost + pre_stressed_tendons_recycle_cost
 
-        self.results[COST_RECYCLING] = total_recycling_cost
+        self._store_result(COST_RECYCLING, total_recycling_cost)
         print(f"\n5.Total Recycling Cost: ", total_recycling_cost)
         return total_recycling_cost
 
 
     #==========End-Of-Life-Stage-Cost-End====================
 
+    #==========Scenario-Sweep-Start==========================
+    def sweep(self, scenarios) -> SweepResult:
+        """
+        Evaluate all life-cycle cost lines for many scenarios in one vectorized pass.
+
+        Args:
+            scenarios: Mapping (or pandas DataFrame) of parameter name -> column of values,
+                       e.g. {KEY_DISCOUNT_RATE_IA: np.linspace(0.04, 0.08, 1000)}.
+                       Parameters not given keep the current value of this manager.
+                       See sweep.SWEEP_PARAMETERS for the accepted names.
+
+        Returns:
+            SweepResult: one row per scenario, one column per cost line
+        """
+        return evaluate_scenarios(snapshot_inputs(self), scenarios)
+
+    def monte_carlo(self, distributions, n_samples: int = 100_000, block_size: int = 10_000,
+                    seed: int = None, max_workers: int = None) -> MonteCarloEngine:
+        """
+        Set up a Monte-Carlo run around the current inputs.
+
+        Args:
+            distributions: Parameter name -> distribution, e.g.
+                           {KEY_DISCOUNT_RATE_IA: Triangular(0.05, 0.067, 0.09),
+                            KEY_SCC: LogNormal(6.3936, 0.3)}
+            n_samples: Total number of samples
+            block_size: Samples evaluated together by one worker task
+            seed: Seed of the random generator
+            max_workers: Number of worker processes (1 runs in this process)
+
+        Returns:
+            MonteCarloEngine: iterate over engine.run() to receive the percentiles
+            and CDFs as the blocks finish, or call engine.result()
+        """
+        return MonteCarloEngine(snapshot_inputs(self), distributions, n_samples=n_samples,
+                                block_size=block_size, seed=seed, max_workers=max_workers)
+    #==========Scenario-Sweep-End============================
+
+    #==========Cash-Flow-Ledger-Start========================
+    def _cash_flow_line(self, key: str) -> CashFlowLine:
+        kind, attribute, timing_key = CASH_FLOW_SCHEDULES[key]
+        return CashFlowLine.from_present_value(
+            present_value=self.result(key),
+            kind=kind,
+            timing=0 if kind == INITIAL else getattr(self, attribute).get(timing_key),
+            design_life=self.financial_data.get(KEY_DESIGN_LIFE),
+            inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
+            discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
+            pwf_cache=self.pwf_cache
+        )
+
+    def cash_flows(self, lines: List[str] = None) -> CashFlowTable:
+        """
+        Year-by-year cash-flow table of the life-cycle cost lines.
+
+        Dirty results are recomputed first. Lines whose input data has not been
+        entered yet are left out of the table. Every line is spread over its
+        payment years once and kept in self.ledger until one of its inputs
+        changes, so only the changed lines are rebuilt.
+
+        Args:
+            lines: Cost lines (default: ledger.CASH_FLOW_LINES)
+
+        Returns:
+            CashFlowTable: payments at today's prices, inflated and discounted, per line and year
+        """
+        lines = CASH_FLOW_LINES if lines is None else lines
+        unknown = [line for line in lines if line not in CASH_FLOW_SCHEDULES]
+        if unknown:
+            raise ValueError(f"Invalid cost lines: {unknown}. Valid options: {CASH_FLOW_LINES}")
+
+        self.recompute(lines)
+        ready = [line for line in lines if line not in self.dependencies.dirty]
+        self.ledger.resize(analysis_horizon(self.financial_data.get(KEY_ANALYSIS_PERIOD),
+                                            self.financial_data.get(KEY_DESIGN_LIFE)))
+        for line in ready:
+            if line not in self.ledger:
+                self.ledger.set_line(line, self._cash_flow_line(line))
+
+        return self.ledger.table(inflation_rate=self.financial_data.get(KEY_INFLATION_RATE),
+                                 discount_rate=self.financial_data.get(KEY_DISCOUNT_RATE_IA),
+                                 keys=ready)
+
+    def _end_of_life_payment(self, line: str) -> float:
+        """
+        One payment of an end-of-life line whose result is discounted with
+        present_worth_factor(analysis period, design life). That factor is 0
+        once the analysis period reaches the design life, so the payment can
+        not be recovered from the result as in the ledger.
+        """
+        if line == COST_DEMOLITION_DISPOSAL_CARBON_REROUTING:
+            return (self.result(COST_TOTAL_INIT_CONST) * self.DURATION_DEMOLITION_DISPOSAL
+                    * self.WORKING_DAYS_IN_MONTH * self.carbon_emission_cost_data.get(KEY_SCC)
+                    * self.CO2_EMISSION_PER_KM * self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE))
+        return sum(self.demolition_and_recycling_data.get(scrap) * self.demolition_and_recycling_data.get(recyclability)
+                   * self.get_total_material_cost(type_material=material)
+                   for material, scrap, recyclability in RECYCLED_MATERIALS)
+
+    def lifecycle_costs(self, horizon: float = None, inflation_rate=None, discount_rate=None) -> LifecycleCosts:
+        """
+        Present value of the cost lines over repeated build/maintain/demolish cycles.
+
+        The bridge is rebuilt every design life until the horizon: initial costs
+        are paid at every build, maintenance recurs within every cycle and the
+        end-of-life costs are paid at the end of every cycle. The cost of one
+        payment of every line is taken from the ledger (see cash_flows()),
+        except for the end-of-life lines priced per payment from their inputs
+        (see _end_of_life_payment()).
+
+        Args:
+            horizon: Years analysed (default: the analysis period), e.g. 120 with a 50 year design life
+            inflation_rate, discount_rate: Rates, scalars or arrays for a sweep (default: financial data)
+
+        Returns:
+            LifecycleCosts with the present values of shape rates.shape + (lines,)
+        """
+        lines = self.cash_flows().lines
+        if horizon is None:
+            horizon = self.financial_data.get(KEY_ANALYSIS_PERIOD)
+        if inflation_rate is None:
+            inflation_rate = self.financial_data.get(KEY_INFLATION_RATE)
+        if discount_rate is None:
+            discount_rate = self.financial_data.get(KEY_DISCOUNT_RATE_IA)
+
+        schedule = lifecycle_schedule(self.financial_data.get(KEY_DESIGN_LIFE), horizon)
+        timings = []
+        for line in lines:
+            kind, attribute, timing_key = CASH_FLOW_SCHEDULES[line]
+            timings.append(lifecycle_timing(kind, attribute, None if kind == INITIAL
+                                            else getattr(self, attribute).get(timing_key)))
+        amounts = np.array([self._end_of_life_payment(line) if line in END_OF_LIFE_PAYMENTS
+                            else self.ledger.line(line).amount for line in lines])
+        return LifecycleCosts(lines, schedule.present_worth(timings, inflation_rate, discount_rate) * amounts, schedule)
+    #==========Cash-Flow-Ledger-End==========================
+
     #==========IRC-Road_User-Cost-Start======================
     
     #==========2. Accident-Related-Cost-Start==========
@@ -937,11 +1205,11 @@ class DatabaseManager:
     #==========2.1 Human-Injury-Cost-Start==========
     
     def _no_of_accidents(self) -> float: # Per Day
-        crash_rate = self.traffic_data.get(KEY_CRASH_RATE) 
-        adt = self._get_total_traffic()
-        multiplier = self.WORK_ZONE_MULTIPLIER
-        rerouting_dist = self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE)
-        return crash_rate * adt * multiplier * rerouting_dist * (10**-6)
+        return float(accident_exposure(crash_rate=self.traffic_data.get(KEY_CRASH_RATE),
+                                       daily_traffic=self._get_total_traffic(),
+                                       rerouting_distance=self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE),
+                                       days=1,
+                                       work_zone_multiplier=self.WORK_ZONE_MULTIPLIER))
     
     def _accident_in_constr_time(self) -> float:
         no_of_accidents = self._no_of_accidents()
@@ -949,125 +1217,87 @@ class DatabaseManager:
         days = self.WORKING_DAYS_IN_MONTH * month
         return no_of_accidents * days
 
-    def _wpi_adj_economic_cost_of_accident_category(self, accident_category:str) -> float:
-        wpi = self.irc_sp_30._get_wpi(table=TABLE_WPI_MEDICAL,
-                                       column=accident_category,
-                                       current_year=2024, # Hard Coded
+    def _accident_costs(self) -> AccidentCosts:
+        exposure = self._accident_in_constr_time()
+        return evaluate_accident_costs(exposure,
+                                       distribution_vector(self.accident_distribution, INJURY_CATEGORIES),
+                                       distribution_vector(self.vehicle_distribution, DAMAGE_VEHICLES),
+                                       current_year=self.PRICE_YEAR,
                                        base_year=BASE_YEAR)
-        economic_cost_of_accident = self.irc_sp_30._get_accident_cost(accident_category)
-        return economic_cost_of_accident * wpi
 
-    def _count_accident_type(self, accident_category:str) -> float:
-        accident_dist = self.accident_distribution.get(accident_category)
-        return self._accident_in_constr_time() * accident_dist
-
-    def _injury_cost(self, accident_category:str) -> float:
-        cost = self._wpi_adj_economic_cost_of_accident_category(accident_category)
-        return cost * self._count_accident_type(accident_category)
-    
     def total_human_injury_cost(self) -> float:
-        cost = 0.0
-        for injury in [KEY_MINOR_INJURY, KEY_MAJOR_INJURY, KEY_FATAL]:
-            cost += self._injury_cost(injury)
-        return cost
+        return float(self._accident_costs().human_injury)
     #==========2.1 Human-Injury-Cost-End==========
 
     #==========2.2 Vehicle-Damage-Cost-Start==========
-    def _wpi_adj_economic_cost_of_quantum_damage(self, vehicle_category:str) -> float:
-        wpi = self.irc_sp_30._get_wpi(table=TABLE_VOT,
-                                       column=vehicle_category,
-                                       current_year=2024, # Hard Coded
-                                       base_year=BASE_YEAR)
-        economic_cost_of_quantum_damage = self.irc_sp_30._get_vehicle_damage_cost(vehicle_category)
-        return economic_cost_of_quantum_damage * wpi
-    
-    def _count_vehicle_damage(self, vehicle_category:str) -> float:
-        vehicle_dist = self.vehicle_distribution.get(vehicle_category)
-        return self._accident_in_constr_time() * vehicle_dist
-
-    def _vehicle_damage_cost(self, vehicle_category:str):
-        cost = self._wpi_adj_economic_cost_of_quantum_damage(vehicle_category)
-        return cost * self._count_vehicle_damage(vehicle_category)
-
     def total_vehicle_damage_cost(self) -> float:
-        cost = 0.0
-        for vehicle in [KEY_TWO_WHEELER,
-                        KEY_SMALL_CARS,
-                        KEY_BIG_CARS,
-                        KEY_ORDINARY_BUS,
-                        KEY_DELUXE_BUS,
-                        KEY_LCV,
-                        KEY_HCV,
-                        KEY_MCV]:
-            cost += self._vehicle_damage_cost(vehicle)
-        return cost
+        return float(self._accident_costs().vehicle_damage)
     #==========2.2 Vehicle-Damage-Cost-End==========
 
     def accident_related_cost(self) -> float:
-        return self.total_human_injury_cost() + self.total_vehicle_damage_cost()
+        return float(self._accident_costs().total())
     #==========2. Accident-Related-Cost-End==========
 
     #==========3. VOT-Start==========================
-    def _wpi_adj_vot(self, vehicle_type:str, type_of_road:str) -> float:
-        wpi = self.irc_sp_30._get_wpi(table=TABLE_VOT,
-                            column=vehicle_type,
-                            current_year=2024, # Hard Coded
-                            base_year=BASE_YEAR)
-        time_value = self.irc_sp_30._get_vot(column=type_of_road,
-                                             vehicle_type=vehicle_type)
-        return time_value * wpi
-    
-    def _vot_per_day(self, vehicle_type: str, type_of_road: str) -> float:
-        time_value = self._wpi_adj_vot(vehicle_type=vehicle_type,
-                                       type_of_road=type_of_road)
-        vehicle_per_day = self.daily_average_traffic_data.get(vehicle_type)
-        addit_travel_time = self.traffic_data.get(KEY_ADDIT_TRAVEL_TIME)
-        occupancy = self.irc_sp_30._get_occupancy(vehicle_type=vehicle_type)
-        return time_value * vehicle_per_day * addit_travel_time * occupancy
-
     def vot_per_year(self) -> float:
         month = self.financial_data.get(KEY_CONSTR_TIME) * 12
         days = self.WORKING_DAYS_IN_MONTH * month
         road_type = self.traffic_data.get(KEY_ALTER_ROAD_CARRIAGEWAY)
+        addit_travel_time = self.traffic_data.get(KEY_ADDIT_TRAVEL_TIME)
 
-        total_vot = 0.0
-        for vehicle_type in self.daily_average_traffic_data.keys():
-            total_vot += self._vot_per_day(vehicle_type=vehicle_type,
-                                       type_of_road=road_type)
-
-        return total_vot * days
+        total_vot = vot_per_day(counts=vehicle_counts(self.daily_average_traffic_data),
+                                road_types=road_type,
+                                detour_hours=addit_travel_time,
+                                years=self.PRICE_YEAR,
+                                base_year=BASE_YEAR)
+        return float(total_vot) * days
 
     #==========3. VOT-End============================
 
-    def total_road_user_cost(self) -> float:
-        vot = self.vot_per_year()
-        accident_cost = self.accident_related_cost()
-
+    def _voc_vehicle_info(self) -> Dict[str, float]:
+        """Daily traffic by VOC vehicle type (see VOC_VEHICLE_TYPES); types without traffic count 0."""
+        vehicle_info = dict.fromkeys(VOC_VEHICLE_TYPES.values(), 0)
+        for vehicle_type, count in self.daily_average_traffic_data.items():
+            vehicle_info[VOC_VEHICLE_TYPES[vehicle_type]] += count
+        return vehicle_info
 
-        ui_inputs = {
-            "vehicle_info": self.daily_average_traffic_data,
-            # "carriageway_width": 10, ### ONLY REQUIRED WHEN "lane_type" = "EW"
-            "rg_roughness_factor": 2000,
-            "fl_fall_factor": 0,
-            "rs_rise_factor": 0,
-            "lane_type": "2L",
-            "power_weight_ratio_pwr": {
-                "mcv": 8,
-                "hcv": 7.22
-            }
+    def _voc_inputs(self) -> Dict:
+        """
+        VOC model input of the alternate road: lane type from its carriageway,
+        roughness (mm/km), rise and fall (m/km) from the traffic data.
+        """
+        carriageway = self.traffic_data.get(KEY_ALTER_ROAD_CARRIAGEWAY)
+        lane_type = VOC_LANE_TYPES.get(carriageway)
+        if lane_type is None:
+            raise ValueError(f"Invalid alternate road carriageway: '{carriageway}'. "
+                             f"Valid options: {list(VOC_LANE_TYPES)}")
+        return {
+            "vehicle_info": self._voc_vehicle_info(),
+            "rg_roughness_factor": float(self.traffic_data.get(KEY_ROAD_ROUGHNESS)),
+            "fl_fall_factor": float(self.traffic_data.get(KEY_ROAD_FALL)),
+            "rs_rise_factor": float(self.traffic_data.get(KEY_ROAD_RISE)),
+            "lane_type": lane_type,
+            "power_weight_ratio_pwr": dict(self.VOC_POWER_WEIGHT_RATIO)
         }
 
-        
+    def total_road_user_cost(self) -> float:
+        vot = self.vot_per_year()
+        accident_cost = self.accident_related_cost()
 
         voc = calc_voc(
-            inputs=ui_inputs,
-            all_wpi=self.irc_sp_30.getWPI(),
-            vehicle_cost=23
+            inputs=self._voc_inputs(),
+            all_wpi=self.irc_sp_30.getWPI(self.PRICE_YEAR),
+            vc=VOLUME_CAPACITY_RATIO,
+            cache=self.voc_cache
         )
 
+        # Daily VOC (Rs/km) over the rerouting distance for the construction period
+        month = self.financial_data.get(KEY_CONSTR_TIME) * 12
+        days = self.WORKING_DAYS_IN_MONTH * month
+        rerouting_distance = self.traffic_data.get(KEY_ADDIT_REROUTING_DISTANCE)
+        voc_cost = voc["total"]["ET"] * rerouting_distance * days
 
-
-    
+        return vot + accident_cost + voc_cost
 
     #==========IRC-Road_User-Cost-End====================
 
@@ -1101,9 +1331,15 @@ class DatabaseManager:
         reconstruction_roaduser_cost = roaduser_cost
         reconstruction_rerouting_carbon_cost = rerouting_carbon_cost
 
+        analysis_period = self.financial_data.get(KEY_ANALYSIS_PERIOD)
+        design_life = self.financial_data.get(KEY_DESIGN_LIFE)
+        discount_rate = self.financial_data.get(KEY_DISCOUNT_RATE_IA)
+
         reconstruction_result = 0
 
-        if self.analysis_period > self.design_life:
+        if analysis_period > design_life:
+            # One reconstruction every design life within the analysis period
+            schedule = lifecycle_schedule(design_life, analysis_period)
             reconstruction_component = ReconstructionCost(
                 demolition_cost=demolition_cost,
                 reconstruction_cost=reconstruction_cost,
@@ -1111,8 +1347,9 @@ class DatabaseManager:
                 reconstruction_time_cost=reconstruction_time_cost,
                 reconstruction_roaduser_cost=reconstruction_roaduser_cost,
                 reconstruction_rerouting_carbon_cost=reconstruction_rerouting_carbon_cost,
-                design_life=self.design_life,
-                discount_rate=self.discount_rate
+                design_life=design_life,
+                discount_rate=discount_rate,
+                present_worth_factor=float(schedule.present_worth([RECONSTRUCTION], 0.0, discount_rate)[0])
             )
             reconstruction_result = reconstruction_component.calculate_cost()
         else:
@@ -0,0 +1,168 @@
+from typing import Dict, Iterable, List, Set, Tuple
+from .data import *
+
+# Input groups are named after the UI tab (or database table) they come from.
+# DatabaseManager attributes holding each input group:
+INPUT_ATTRIBUTES = {
+    "financial_data": KEY_FINANCIAL,
+    "carbon_emission_cost_data": KEY_CARBON_EMISSION_COST,
+    "maintainance_and_repair_data": KEY_MAINTAINANCE_REPAIR,
+    "demolition_and_recycling_data": KEY_DEMOLITION_RECYCLE,
+    "traffic_data": KEY_BRIDGE_TRAFFIC,
+    "daily_average_traffic_data": KEY_BRIDGE_TRAFFIC,
+    "accident_distribution": KEY_BRIDGE_TRAFFIC,
+    "vehicle_distribution": KEY_BRIDGE_TRAFFIC,
+}
+
+# Input groups stored in the database rather than in attributes
+DATABASE_INPUTS = [KEY_STRUCTURE_WORKS_DATA, KEY_CARBON_EMISSION]
+
+INPUT_GROUPS = DATABASE_INPUTS + sorted(set(INPUT_ATTRIBUTES.values()))
+
+# Result key -> (DatabaseManager method computing it, input groups and results it reads)
+RESULT_NODES: Dict[str, Tuple[str, List[str]]] = {
+    # Initial stage
+    COST_TOTAL_INIT_CONST: ("calculate_total_initial_cost", [KEY_STRUCTURE_WORKS_DATA]),
+    COST_TOTAL_SUPERSTRUCTURE: ("_calculate_superstructure_cost", [KEY_STRUCTURE_WORKS_DATA]),
+    COST_TOTAL_INIT_CARBON_EMISSION: ("carbon_emission_cost", [KEY_CARBON_EMISSION, KEY_CARBON_EMISSION_COST]),
+    COST_TIME: ("calculate_time_cost", [COST_TOTAL_INIT_CONST, KEY_FINANCIAL]),
+    COST_CARBON_EMISSION_REROUTING_INIT: ("init_carbon_emission_rerouting",
+                                          [KEY_FINANCIAL, KEY_BRIDGE_TRAFFIC, KEY_CARBON_EMISSION_COST]),
+    # Use stage
+    COST_TOTAL_ROUTINE_INSPECTION: ("routine_inspection_cost",
+                                    [COST_TOTAL_INIT_CONST, KEY_FINANCIAL, KEY_MAINTAINANCE_REPAIR]),
+    COST_PERIODIC_MAINTAINANCE: ("periodic_maintainance_cost",
+                                 [COST_TOTAL_INIT_CONST, KEY_FINANCIAL, KEY_MAINTAINANCE_REPAIR]),
+    COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION: ("periodic_maintainance_carbon_emission_cost",
+                                                 [COST_TOTAL_INIT_CARBON_EMISSION, KEY_FINANCIAL,
+                                                  KEY_MAINTAINANCE_REPAIR]),
+    COST_MAJOR_INSPECTION: ("major_inspection_cost",
+                            [COST_TOTAL_INIT_CONST, KEY_FINANCIAL, KEY_MAINTAINANCE_REPAIR]),
+    COST_MAJOR_REPAIR: ("major_repair_cost",
+                        [COST_TOTAL_INIT_CONST, KEY_FINANCIAL, KEY_MAINTAINANCE_REPAIR]),
+    COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION: ("major_repair_related_carbon_emission_cost",
+                                                [COST_TOTAL_INIT_CARBON_EMISSION, KEY_FINANCIAL,
+                                                 KEY_MAINTAINANCE_REPAIR]),
+    COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR: ("carbon_emission_rerouting_during_major_repairs",
+                                                  [KEY_FINANCIAL, KEY_MAINTAINANCE_REPAIR, KEY_BRIDGE_TRAFFIC,
+                                                   KEY_CARBON_EMISSION_COST]),
+    COST_BEARING_EXP_JOINT_REPLACEMENT: ("bearing_expansion_joint_replacement_cost",
+                                         [COST_TOTAL_SUPERSTRUCTURE, KEY_FINANCIAL, KEY_MAINTAINANCE_REPAIR]),
+    COST_CARBON_EMISSION_RR_DURING_REPLACEMENT: ("carbon_emission_rerouting_during_replacement",
+                                                 [KEY_FINANCIAL, KEY_MAINTAINANCE_REPAIR, KEY_BRIDGE_TRAFFIC,
+                                                  KEY_CARBON_EMISSION_COST]),
+    # End of life stage
+    COST_DEMOLITION_DISPOSAL: ("demolition_and_disposal_cost",
+                               [COST_TOTAL_INIT_CONST, KEY_FINANCIAL, KEY_DEMOLITION_RECYCLE]),
+    COST_DEMOLITION_DISPOSAL_CARBON: ("demolition_disposal_carbon_emission_cost",
+                                      [COST_TOTAL_INIT_CARBON_EMISSION, KEY_FINANCIAL, KEY_DEMOLITION_RECYCLE]),
+    COST_DEMOLITION_DISPOSAL_CARBON_REROUTING: ("demolition_disposal_rerouting_carbon_emission_cost",
+                                                [COST_TOTAL_INIT_CONST, KEY_FINANCIAL, KEY_BRIDGE_TRAFFIC,
+                                                 KEY_CARBON_EMISSION_COST]),
+    COST_RECYCLING: ("recycling_cost", [KEY_STRUCTURE_WORKS_DATA, KEY_FINANCIAL, KEY_DEMOLITION_RECYCLE]),
+}
+
+
+class DependencyGraph:
+    """
+    Directed acyclic graph from input groups to result keys, with dirty flags.
+
+    Nodes are either input groups (INPUT_GROUPS) or result keys (RESULT_NODES).
+    Invalidating a node marks every result downstream of it dirty; the owner
+    then recomputes the dirty results in topological order.
+    """
+
+    def __init__(self, nodes: Dict[str, Tuple[str, List[str]]] = RESULT_NODES,
+                 inputs: Iterable[str] = INPUT_GROUPS):
+        """
+        Args:
+            nodes: Result key -> (method name, dependencies)
+            inputs: Names of the input groups
+
+        Raises:
+            ValueError: If a dependency is unknown or the graph has a cycle
+        """
+        self.nodes = dict(nodes)
+        self.inputs = set(inputs)
+
+        self._dependents: Dict[str, List[str]] = {name: [] for name in self.inputs | set(self.nodes)}
+        for key, (_, dependencies) in self.nodes.items():
+            for dependency in dependencies:
+                if dependency not in self._dependents:
+                    raise ValueError(f"Unknown dependency '{dependency}' of result '{key}'")
+                self._dependents[dependency].append(key)
+
+        self.order = self._topological_order()
+        self.dirty: Set[str] = set()
+
+    def _topological_order(self) -> List[str]:
+        """Result keys ordered so that every result comes after the results it reads (Kahn's algorithm)."""
+        pending = {key: sum(d in self.nodes for d in dependencies) for key, (_, dependencies) in self.nodes.items()}
+        ready = [key for key in self.nodes if pending[key] == 0]
+        order = []
+        while ready:
+            key = ready.pop(0)
+            order.append(key)
+            for dependent in self._dependents[key]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(self.nodes):
+            raise ValueError(f"Cycle between results: {sorted(set(self.nodes) - set(order))}")
+        return order
+
+    def method(self, key: str) -> str:
+        return self.nodes[key][0]
+
+    def input_groups(self, key: str) -> List[str]:
+        """Input groups read directly by a result."""
+        return [d for d in self.nodes[key][1] if d in self.inputs]
+
+    def upstream_results(self, key: str) -> List[str]:
+        """Results read directly by a result."""
+        return [d for d in self.nodes[key][1] if d in self.nodes]
+
+    def downstream(self, *names: str) -> Set[str]:
+        """All results depending (directly or not) on the given inputs or results, excluding the names themselves."""
+        found = set()
+        stack = list(names)
+        while stack:
+            for dependent in self._dependents[stack.pop()]:
+                if dependent not in found:
+                    found.add(dependent)
+                    stack.append(dependent)
+        return found
+
+    def upstream(self, keys: Iterable[str]) -> Set[str]:
+        """The given results together with all results they depend on."""
+        found = set()
+        stack = list(keys)
+        while stack:
+            key = stack.pop()
+            if key not in found:
+                found.add(key)
+                stack.extend(self.upstream_results(key))
+        return found
+
+    def invalidate(self, *names: str) -> Set[str]:
+        """
+        Mark everything downstream of the given input groups or results dirty.
+
+        Returns:
+            Result keys that were clean before
+        """
+        for name in names:
+            if name not in self._dependents:
+                raise ValueError(f"Unknown input group or result: '{name}'")
+        affected = self.downstream(*names)
+        newly_dirty = affected - self.dirty
+        self.dirty |= affected
+        return newly_dirty
+
+    def mark_clean(self, key: str):
+        self.dirty.discard(key)
+
+    def pending(self, targets: Iterable[str] = None) -> List[str]:
+        """Dirty results (restricted to what the targets need), in topological order."""
+        needed = self.upstream(targets) if targets is not None else set(self.nodes)
+        return [key for key in self.order if key in self.dirty and key in needed]
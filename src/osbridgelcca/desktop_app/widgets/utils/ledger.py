@@ -0,0 +1,302 @@
+import math
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import numpy as np
+from .data import *
+from .pwf import PWFCache, _number_of_periods, present_worth_factor, single_payment_pwf
+
+# Timing of the life-cycle cost lines. A line is paid once at the end of
+# construction (year 0), once after `timing` years, or every `timing` years
+# within the design life (the series of pwf.present_worth_factor). The timing
+# is read from the given DatabaseManager attribute and key.
+INITIAL = "initial"
+SINGLE = "single"
+RECURRING = "recurring"
+
+CASH_FLOW_SCHEDULES: Dict[str, Tuple[str, Optional[str], Optional[str]]] = {
+    COST_TOTAL_INIT_CONST: (INITIAL, None, None),
+    COST_TOTAL_INIT_CARBON_EMISSION: (INITIAL, None, None),
+    COST_TIME: (INITIAL, None, None),
+    COST_CARBON_EMISSION_REROUTING_INIT: (INITIAL, None, None),
+    COST_TOTAL_ROUTINE_INSPECTION: (RECURRING, "maintainance_and_repair_data", KEY_ROUTINE_INSP_FREQ),
+    COST_PERIODIC_MAINTAINANCE: (RECURRING, "maintainance_and_repair_data", KEY_PERIODIC_MAINT_FREQ),
+    COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION: (RECURRING, "maintainance_and_repair_data", KEY_PERIODIC_MAINT_FREQ),
+    COST_MAJOR_INSPECTION: (RECURRING, "maintainance_and_repair_data", KEY_MAJOR_INSP_FREQ),
+    COST_MAJOR_REPAIR: (RECURRING, "maintainance_and_repair_data", KEY_MAJOR_REPAIR_FREQ),
+    COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION: (RECURRING, "maintainance_and_repair_data", KEY_MAJOR_REPAIR_FREQ),
+    COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR: (RECURRING, "maintainance_and_repair_data",
+                                                  KEY_MAJOR_REPAIR_FREQ),
+    # Mirrors DatabaseManager.bearing_expansion_joint_replacement_cost()
+    COST_BEARING_EXP_JOINT_REPLACEMENT: (RECURRING, "maintainance_and_repair_data", KEY_MAJOR_REPAIR_FREQ),
+    COST_CARBON_EMISSION_RR_DURING_REPLACEMENT: (RECURRING, "maintainance_and_repair_data",
+                                                 KEY_BEARING_EXP_JOINT_REPAIR_FREQ),
+    COST_DEMOLITION_DISPOSAL: (SINGLE, "financial_data", KEY_ANALYSIS_PERIOD),
+    COST_DEMOLITION_DISPOSAL_CARBON: (SINGLE, "financial_data", KEY_ANALYSIS_PERIOD),
+    COST_DEMOLITION_DISPOSAL_CARBON_REROUTING: (RECURRING, "financial_data", KEY_ANALYSIS_PERIOD),
+    COST_RECYCLING: (RECURRING, "financial_data", KEY_ANALYSIS_PERIOD),
+}
+
+# Cost lines of the ledger, in row order
+CASH_FLOW_LINES = list(CASH_FLOW_SCHEDULES)
+
+
+def _check_lines(lines: Iterable[str]) -> List[str]:
+    lines = list(lines)
+    unknown = [line for line in lines if line not in CASH_FLOW_SCHEDULES]
+    if unknown:
+        raise ValueError(f"Invalid cost lines: {unknown}. Valid options: {CASH_FLOW_LINES}")
+    return lines
+
+
+def payment_years(kind: str, timing: float, design_life: float) -> np.ndarray:
+    """
+    Years in which a cost line is paid.
+
+    Payments are booked in the nearest whole year, so a ledger reproduces the
+    present worth factors exactly when the frequencies are whole years.
+
+    Args:
+        kind: INITIAL, SINGLE or RECURRING
+        timing: Year of a SINGLE payment, years between two RECURRING payments
+        design_life: Upper limit (exclusive) of RECURRING payments
+    """
+    if kind == INITIAL:
+        return np.zeros(1, dtype=int)
+    if kind == SINGLE:
+        return np.array([round(timing)])
+    if kind == RECURRING:
+        n = _number_of_periods(timing, design_life)
+        return np.rint(timing * np.arange(1, n + 1)).astype(int)
+    raise ValueError(f"Invalid schedule kind: '{kind}'. Valid options: {[INITIAL, SINGLE, RECURRING]}")
+
+
+def analysis_horizon(analysis_period: float, design_life: float) -> int:
+    """Last year of the ledger: recurring costs run to the design life, end-of-life costs to the analysis period."""
+    return int(math.ceil(max(analysis_period, design_life)))
+
+
+def discount_factors(inflation_rate, discount_rate, horizon: int) -> np.ndarray:
+    """
+    ((1 + i) / (1 + d)) ** t for the years t = 0..horizon.
+
+    Rates may be arrays; the result has shape rates.shape + (horizon + 1,).
+    """
+    q = (1 + np.asarray(inflation_rate, dtype=float)) / (1 + np.asarray(discount_rate, dtype=float))
+    return q[..., np.newaxis] ** np.arange(horizon + 1)
+
+
+class CashFlowLine(NamedTuple):
+    """One cost line: the cost of one payment at today's prices and the years it is paid in."""
+    amount: float
+    years: np.ndarray
+
+    @classmethod
+    def from_present_value(cls, present_value: float, kind: str, timing: float, design_life: float,
+                           inflation_rate: float, discount_rate: float,
+                           pwf_cache: Optional[PWFCache] = None) -> "CashFlowLine":
+        """
+        Spread a present value computed with the present worth factors over its payment years.
+
+        Args:
+            present_value: Result of the DatabaseManager method of the line
+            kind, timing, design_life: Schedule of the line (see payment_years)
+            inflation_rate, discount_rate: Rates the present value was computed with
+            pwf_cache: Cache the present worth factors were looked up in
+        """
+        years = payment_years(kind, timing, design_life)
+        if kind == RECURRING:
+            factor = present_worth_factor(inflation_rate, discount_rate, timing, design_life, cache=pwf_cache)
+        elif kind == SINGLE:
+            factor = single_payment_pwf(inflation_rate, discount_rate, timing)
+        else:
+            factor = 1.0
+        return cls(present_value / factor if factor else 0.0, years)
+
+    def row(self, horizon: int) -> np.ndarray:
+        """Payments of every year 0..horizon at today's prices."""
+        return np.bincount(self.years, minlength=horizon + 1)[:horizon + 1] * float(self.amount)
+
+
+class CashFlowTable(NamedTuple):
+    """Yearly payments (columns) of the cost lines (rows)."""
+    lines: Tuple[str, ...]
+    years: np.ndarray
+    real: np.ndarray        # at today's prices
+    nominal: np.ndarray     # inflated to the year of payment
+    discounted: np.ndarray  # present values
+
+    def __getitem__(self, line: str) -> np.ndarray:
+        try:
+            return self.discounted[self.lines.index(line)]
+        except ValueError:
+            raise KeyError(f"Unknown cost line: '{line}'. Valid options: {list(self.lines)}")
+
+    def yearly(self) -> np.ndarray:
+        """Present value of the payments of every year (sum over the cost lines)."""
+        return self.discounted.sum(axis=0)
+
+    def cumulative(self) -> np.ndarray:
+        """Present value of all payments up to every year."""
+        return np.cumsum(self.yearly())
+
+    def npv(self) -> float:
+        """Present value of all payments (the life-cycle cost)."""
+        return float(self.discounted.sum())
+
+    def line_npv(self) -> Dict[str, float]:
+        """Present value of every cost line, as computed by the DatabaseManager methods."""
+        return dict(zip(self.lines, self.discounted.sum(axis=1).tolist()))
+
+    def to_dataframe(self, values: str = "nominal"):
+        """Return one of the tables as a pandas DataFrame (one row per year, one column per cost line)."""
+        import pandas as pd
+        return pd.DataFrame(getattr(self, values).T, index=pd.Index(self.years, name="Year"), columns=self.lines)
+
+
+class CashFlowLedger:
+    """
+    Dense yearly payments of the life-cycle cost lines.
+
+    Lines are set and discarded one at a time; the dense row of a line is built
+    once per horizon, so changing one input only rebuilds the lines reading it.
+    All discounting is a product of the (lines, years) payment matrix with the
+    discount factors, for one pair of rates or whole arrays of them.
+    """
+
+    def __init__(self, horizon: int = 0):
+        """
+        Args:
+            horizon: Last year of the ledger
+        """
+        self.horizon = horizon
+        self._lines: Dict[str, CashFlowLine] = {}
+        self._rows: Dict[str, np.ndarray] = {}
+
+    def resize(self, horizon: int):
+        """Change the last year of the ledger (dense rows are rebuilt on demand)."""
+        if horizon != self.horizon:
+            self.horizon = horizon
+            self._rows.clear()
+
+    def set_line(self, key: str, line: CashFlowLine):
+        _check_lines([key])
+        if line.years.size and line.years.max() > self.horizon:
+            raise ValueError(f"Cost line '{key}' is paid in year {line.years.max()}, "
+                             f"after the horizon of the ledger ({self.horizon})")
+        self._lines[key] = line
+        self._rows.pop(key, None)
+
+    def discard(self, *keys: str):
+        """Drop cost lines (unknown or absent keys are ignored)."""
+        for key in keys:
+            self._lines.pop(key, None)
+            self._rows.pop(key, None)
+
+    def clear(self):
+        self._lines.clear()
+        self._rows.clear()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._lines
+
+    def line(self, key: str) -> CashFlowLine:
+        return self._lines[key]
+
+    def __len__(self):
+        return len(self._lines)
+
+    def lines(self) -> List[str]:
+        """Cost lines held, in CASH_FLOW_LINES order."""
+        return [key for key in CASH_FLOW_LINES if key in self._lines]
+
+    def _row(self, key: str) -> np.ndarray:
+        row = self._rows.get(key)
+        if row is None:
+            row = self._lines[key].row(self.horizon)
+            row.flags.writeable = False
+            self._rows[key] = row
+        return row
+
+    def matrix(self, keys: Iterable[str] = None) -> np.ndarray:
+        """(lines, years) payments at today's prices."""
+        keys = self.lines() if keys is None else keys
+        missing = [key for key in keys if key not in self._lines]
+        if missing:
+            raise KeyError(f"Cost lines not in the ledger: {missing}")
+        return np.array([self._row(key) for key in keys]).reshape(len(keys), self.horizon + 1)
+
+    def present_values(self, inflation_rate, discount_rate, keys: Iterable[str] = None) -> np.ndarray:
+        """
+        Present value of every cost line.
+
+        Args:
+            inflation_rate, discount_rate: Rates, scalars or broadcastable arrays
+            keys: Cost lines (default: all lines held)
+
+        Returns:
+            Array of shape rates.shape + (lines,)
+        """
+        return discount_factors(inflation_rate, discount_rate, self.horizon) @ self.matrix(keys).T
+
+    def npv(self, inflation_rate, discount_rate, keys: Iterable[str] = None) -> np.ndarray:
+        """Life-cycle cost for every pair of rates (shape of the broadcast rates)."""
+        return discount_factors(inflation_rate, discount_rate, self.horizon) @ self.matrix(keys).sum(axis=0)
+
+    def table(self, inflation_rate: float, discount_rate: float, keys: Iterable[str] = None) -> CashFlowTable:
+        """Yearly cash-flow table of the cost lines at one pair of rates."""
+        keys = self.lines() if keys is None else list(keys)
+        real = self.matrix(keys)
+        years = np.arange(self.horizon + 1)
+        nominal = real * (1 + float(inflation_rate)) ** years
+        discounted = real * discount_factors(inflation_rate, discount_rate, self.horizon)
+        return CashFlowTable(tuple(keys), years, real, nominal, discounted)
+
+
+def equivalent_annual_cost(npv, discount_rate, years) -> np.ndarray:
+    """
+    Uniform yearly payment over `years` with the present value `npv` (vectorised).
+
+    A zero discount rate spreads the present value evenly.
+    """
+    npv = np.asarray(npv, dtype=float)
+    d = np.asarray(discount_rate, dtype=float)
+    n = np.asarray(years, dtype=float)
+    safe_d = np.where(d == 0, 1.0, d)
+    return np.where(d == 0, npv / n, npv * safe_d / (1 - (1 + safe_d) ** -n))
+
+
+def internal_rate_of_return(cash_flows, low: float = -0.99, high: float = 1.0,
+                            tolerance: float = 1e-10, max_iterations: int = 200) -> np.ndarray:
+    """
+    Rate at which the present value of yearly cash flows is zero, by bisection on all rows at once.
+
+    For cost ledgers this is the rate at which two alternatives break even,
+    e.g. with the cash flows nominal_a.sum(0) - nominal_b.sum(0) of two tables.
+
+    Args:
+        cash_flows: (..., years) cash flows of the years 0, 1, ...
+        low, high: Bracket of the rate
+
+    Returns:
+        Array of rates of shape cash_flows.shape[:-1]; NaN where the present
+        value does not change sign within the bracket
+    """
+    flows = np.asarray(cash_flows, dtype=float)
+    years = np.arange(flows.shape[-1])
+
+    def npv(rate):
+        return (flows * (1 + rate[..., np.newaxis]) ** -years).sum(axis=-1)
+
+    low = np.full(flows.shape[:-1], low)
+    high = np.full(flows.shape[:-1], high)
+    npv_low = npv(low)
+    bracketed = np.sign(npv_low) * np.sign(npv(high)) <= 0
+    for _ in range(max_iterations):
+        middle = (low + high) / 2
+        npv_middle = npv(middle)
+        lower_half = np.sign(npv_middle) * np.sign(npv_low) <= 0
+        high = np.where(lower_half, middle, high)
+        low = np.where(lower_half, low, middle)
+        npv_low = np.where(lower_half, npv_low, npv_middle)
+        if np.all(high - low < tolerance):
+            break
+    return np.where(bracketed, (low + high) / 2, np.nan)
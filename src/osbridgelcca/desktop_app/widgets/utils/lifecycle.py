@@ -0,0 +1,130 @@
+import math
+from functools import lru_cache
+from typing import Dict, NamedTuple, Sequence, Tuple, Union
+import numpy as np
+from .pwf import _number_of_periods
+from .ledger import INITIAL, SINGLE, discount_factors
+
+# Build/maintain/demolish cycles over an analysis horizon longer than the
+# design life. The bridge is built in year 0 and rebuilt every design life
+# until the horizon; every cycle repeats the maintenance of the first one and
+# ends with a demolition (the last one at the horizon). Events are counted per
+# year as arrays, so discounting all of them is one product with the discount
+# factors, for one pair of rates or whole arrays of them.
+
+# Timings of cycle events; a number is the frequency of an event recurring within every cycle
+BUILD = "build"
+RECONSTRUCTION = "reconstruction"
+END_OF_LIFE = "end of life"
+
+Timing = Union[str, float]
+
+
+class LifecycleSchedule:
+    """
+    Years of the cycle events for one design life and horizon.
+
+    Use lifecycle_schedule() to share schedules: the yearly event counts of
+    every timing are built once per schedule.
+    """
+
+    def __init__(self, design_life: int, horizon: int):
+        """
+        Args:
+            design_life: Years between two builds
+            horizon: Last year of the analysis (the analysis period)
+        """
+        if design_life <= 0 or horizon <= 0:
+            raise ValueError(f"Design life and horizon must be positive, got {design_life} and {horizon}")
+        self.design_life = design_life
+        self.horizon = horizon
+        self.cycle_starts = np.arange(0, horizon, design_life)
+        self.cycle_starts.flags.writeable = False
+        self._counts: Dict[Timing, np.ndarray] = {}
+
+    def __len__(self):
+        """Number of cycles."""
+        return self.cycle_starts.size
+
+    def event_years(self, timing: Timing) -> np.ndarray:
+        """
+        Years of the events of a timing.
+
+        BUILD: every cycle start; RECONSTRUCTION: every cycle start after year 0;
+        END_OF_LIFE: the end of every cycle, truncated at the horizon; a
+        frequency f: f, 2f, ... (below the design life) after every cycle start,
+        before the horizon, as in pwf.present_worth_factor.
+        """
+        if timing == BUILD:
+            return self.cycle_starts
+        if timing == RECONSTRUCTION:
+            return self.cycle_starts[1:]
+        if timing == END_OF_LIFE:
+            return np.append(self.cycle_starts[1:], self.horizon)
+        if isinstance(timing, str):
+            raise ValueError(f"Invalid timing: '{timing}'. Valid options: {[BUILD, RECONSTRUCTION, END_OF_LIFE]} "
+                             f"or a frequency in years")
+        n = _number_of_periods(timing, self.design_life)
+        offsets = np.rint(timing * np.arange(1, n + 1)).astype(int)
+        years = (self.cycle_starts[:, np.newaxis] + offsets).ravel()
+        return years[years < self.horizon]
+
+    def counts(self, timing: Timing) -> np.ndarray:
+        """Number of events of a timing in every year 0..horizon (read-only, cached)."""
+        counts = self._counts.get(timing)
+        if counts is None:
+            counts = np.bincount(self.event_years(timing), minlength=self.horizon + 1).astype(float)
+            counts.flags.writeable = False
+            self._counts[timing] = counts
+        return counts
+
+    def event_matrix(self, timings: Sequence[Timing]) -> np.ndarray:
+        """(timings, years) event counts."""
+        return np.array([self.counts(timing) for timing in timings]).reshape(len(timings), self.horizon + 1)
+
+    def present_worth(self, timings: Sequence[Timing], inflation_rate, discount_rate) -> np.ndarray:
+        """
+        Present worth factor of every timing: sum of ((1 + i) / (1 + d)) ** year over its events.
+
+        Returns:
+            Array of shape rates.shape + (timings,)
+        """
+        return discount_factors(inflation_rate, discount_rate, self.horizon) @ self.event_matrix(timings).T
+
+
+@lru_cache(maxsize=64)
+def _schedule(design_life: int, horizon: int) -> LifecycleSchedule:
+    return LifecycleSchedule(design_life, horizon)
+
+
+def lifecycle_schedule(design_life: float, horizon: float) -> LifecycleSchedule:
+    """Shared schedule of a design life (rounded to whole years) and a horizon (rounded up)."""
+    return _schedule(int(round(design_life)), int(math.ceil(horizon)))
+
+
+def lifecycle_timing(kind: str, attribute: str, timing: float) -> Timing:
+    """
+    Cycle timing of a cost line of ledger.CASH_FLOW_SCHEDULES.
+
+    Initial costs are paid at every build; costs paid after the analysis
+    period (demolition, recycling) at every end of life; maintenance recurs
+    within every cycle.
+    """
+    if kind == INITIAL:
+        return BUILD
+    if kind == SINGLE or attribute == "financial_data":
+        return END_OF_LIFE
+    return timing
+
+
+class LifecycleCosts(NamedTuple):
+    """Present value of the cost lines over all cycles."""
+    lines: Tuple[str, ...]
+    present_values: np.ndarray  # (..., lines)
+    schedule: LifecycleSchedule
+
+    def total(self) -> np.ndarray:
+        return self.present_values.sum(axis=-1)
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        return {line: self.present_values[..., j] for j, line in enumerate(self.lines)}
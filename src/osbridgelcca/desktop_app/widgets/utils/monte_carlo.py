@@ -0,0 +1,240 @@
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Mapping, Optional
+import numpy as np
+from .sweep import SWEEP_PARAMETERS, SWEEP_RESULTS, SweepResult, evaluate_scenarios
+
+# Column holding the sum of all cost lines
+KEY_LIFE_CYCLE_COST = "Life Cycle Cost"
+
+DEFAULT_PERCENTILES = (5, 50, 95)
+
+
+class Uniform:
+    """Uniform distribution on [low, high]."""
+
+    def __init__(self, low: float, high: float):
+        if low > high:
+            raise ValueError(f"Uniform distribution needs low <= high, got {low} > {high}")
+        self.low = low
+        self.high = high
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.uniform(self.low, self.high, size)
+
+    def __repr__(self):
+        return f"Uniform({self.low}, {self.high})"
+
+
+class Triangular:
+    """Triangular distribution on [low, high] with its peak at mode."""
+
+    def __init__(self, low: float, mode: float, high: float):
+        if not low <= mode <= high or low == high:
+            raise ValueError(f"Triangular distribution needs low <= mode <= high and low < high, "
+                             f"got ({low}, {mode}, {high})")
+        self.low = low
+        self.mode = mode
+        self.high = high
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.triangular(self.low, self.mode, self.high, size)
+
+    def __repr__(self):
+        return f"Triangular({self.low}, {self.mode}, {self.high})"
+
+
+class LogNormal:
+    """
+    Lognormal distribution given by its median and the standard deviation of log(x).
+
+    Suited to strictly positive inputs with a long upper tail, such as traffic
+    counts or the social cost of carbon.
+    """
+
+    def __init__(self, median: float, sigma: float):
+        if median <= 0 or sigma < 0:
+            raise ValueError(f"LogNormal distribution needs median > 0 and sigma >= 0, got ({median}, {sigma})")
+        self.median = median
+        self.sigma = sigma
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.lognormal(math.log(self.median), self.sigma, size)
+
+    def __repr__(self):
+        return f"LogNormal({self.median}, {self.sigma})"
+
+
+def _evaluate_block(baseline: Mapping[str, float], distributions: Mapping[str, object],
+                    size: int, seed: np.random.SeedSequence) -> np.ndarray:
+    """
+    Draw one block of samples and evaluate it. Runs in the worker processes.
+
+    Returns:
+        Array (size, len(SWEEP_RESULTS) + 1); the last column is the life-cycle cost
+    """
+    rng = np.random.default_rng(seed)
+    scenarios = {key: distribution.sample(rng, size) for key, distribution in distributions.items()}
+    values = evaluate_scenarios(baseline, scenarios).values
+    return np.column_stack([values, values.sum(axis=1)])
+
+
+class MonteCarloSummary:
+    """Percentiles and empirical CDF of every cost line over the samples evaluated so far."""
+
+    def __init__(self, lines: List[str], samples: np.ndarray, total_samples: int,
+                 percentiles=DEFAULT_PERCENTILES, cdf_points: int = 101):
+        self.lines = list(lines)
+        self.n_samples = samples.shape[0]
+        self.total_samples = total_samples
+        self.percentile_levels = tuple(percentiles)
+        self.cdf_levels = np.linspace(0.0, 1.0, cdf_points)
+        # One quantile pass for both the percentiles and the CDF; (levels, lines) arrays
+        levels = np.concatenate([np.asarray(self.percentile_levels, dtype=float) / 100, self.cdf_levels])
+        quantiles = np.quantile(samples, levels, axis=0)
+        self._percentiles = quantiles[:len(self.percentile_levels)]
+        self._cdf = quantiles[len(self.percentile_levels):]
+
+    @property
+    def done(self) -> bool:
+        return self.n_samples >= self.total_samples
+
+    def _column(self, line: str) -> int:
+        try:
+            return self.lines.index(line)
+        except ValueError:
+            raise KeyError(f"Unknown cost line: '{line}'. Valid options: {self.lines}")
+
+    def percentiles(self, line: str = KEY_LIFE_CYCLE_COST) -> Dict[float, float]:
+        """Percentiles of one cost line, e.g. {5: ..., 50: ..., 95: ...}."""
+        column = self._percentiles[:, self._column(line)]
+        return dict(zip(self.percentile_levels, column.tolist()))
+
+    def cdf(self, line: str = KEY_LIFE_CYCLE_COST):
+        """
+        Empirical CDF of one cost line.
+
+        Returns:
+            (values, probabilities): the cost below which the given fraction of samples lie
+        """
+        return self._cdf[:, self._column(line)], self.cdf_levels
+
+    def __repr__(self):
+        p = ", ".join(f"P{level:g}={value:,.2f}" for level, value in self.percentiles().items())
+        return f"MonteCarloSummary({self.n_samples}/{self.total_samples} samples, {p})"
+
+
+class MonteCarloEngine:
+    """
+    Probabilistic life-cycle cost evaluation.
+
+    Samples are drawn and evaluated in vectorized blocks with evaluate_scenarios();
+    blocks are sharded across a ProcessPoolExecutor and a MonteCarloSummary is
+    yielded every time a block finishes, so percentiles and CDFs can be shown
+    while the run is still going.
+
+    Every block has its own seed spawned from one SeedSequence, so a run with a
+    given seed gives the same samples regardless of the number of workers.
+    """
+
+    def __init__(self, baseline: Mapping[str, float], distributions: Mapping[str, object],
+                 n_samples: int = 100_000, block_size: int = 10_000, seed: Optional[int] = None,
+                 max_workers: Optional[int] = None, percentiles=DEFAULT_PERCENTILES, cdf_points: int = 101):
+        """
+        Args:
+            baseline: Scalar inputs, as returned by sweep.snapshot_inputs()
+            distributions: Parameter name -> distribution (Uniform, Triangular, LogNormal
+                or any object with a sample(rng, size) method). Names are the
+                sweep.SWEEP_PARAMETERS.
+            n_samples: Total number of samples
+            block_size: Number of samples evaluated together by one task
+            seed: Seed of the random generator (None for a random run)
+            max_workers: Number of worker processes; 1 evaluates the blocks in this process
+            percentiles: Percentile levels reported in the summaries
+            cdf_points: Number of probability levels of the reported CDFs
+        """
+        unknown = [key for key in distributions if key not in SWEEP_PARAMETERS]
+        if unknown:
+            raise ValueError(f"Invalid uncertain parameters: {unknown}. Valid options: {SWEEP_PARAMETERS}")
+        if n_samples <= 0 or block_size <= 0:
+            raise ValueError(f"n_samples and block_size must be positive, got {n_samples} and {block_size}")
+
+        self.baseline = dict(baseline)
+        self.distributions = dict(distributions)
+        self.n_samples = n_samples
+        self.block_size = block_size
+        self.seed = seed
+        self.max_workers = max_workers
+        self.percentiles = percentiles
+        self.cdf_points = cdf_points
+        self.lines = SWEEP_RESULTS + [KEY_LIFE_CYCLE_COST]
+        self.samples = None
+
+    def _blocks(self):
+        """(start row, size, seed) of every block."""
+        sizes = [min(self.block_size, self.n_samples - start) for start in range(0, self.n_samples, self.block_size)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        starts = np.cumsum([0] + sizes[:-1])
+        return list(zip(starts.tolist(), sizes, seeds))
+
+    def _summary(self, rows) -> MonteCarloSummary:
+        """Summary of the finished rows (a slice or a boolean mask of the samples)."""
+        return MonteCarloSummary(self.lines, self.samples[rows], self.n_samples,
+                                 self.percentiles, self.cdf_points)
+
+    def run(self) -> Iterator[MonteCarloSummary]:
+        """
+        Evaluate all samples.
+
+        Yields:
+            MonteCarloSummary after every finished block; the last one covers all samples
+        """
+        self.samples = np.empty((self.n_samples, len(self.lines)))
+        blocks = self._blocks()
+
+        if self.max_workers == 1:
+            for start, size, seed in blocks:
+                self.samples[start:start + size] = _evaluate_block(self.baseline, self.distributions, size, seed)
+                yield self._summary(slice(0, start + size))
+            return
+
+        # Blocks finish out of order: every block is written at its own rows, so
+        # the samples do not depend on the number of workers, and the summaries
+        # look at the rows of the finished blocks.
+        finished = np.zeros(self.n_samples, dtype=bool)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(_evaluate_block, self.baseline, self.distributions, size, seed): (start, size)
+                       for start, size, seed in blocks}
+            for future in as_completed(futures):
+                start, size = futures[future]
+                self.samples[start:start + size] = future.result()
+                finished[start:start + size] = True
+                yield self._summary(finished)
+
+    def result(self) -> MonteCarloSummary:
+        """Run to completion and return the final summary."""
+        summary = None
+        for summary in self.run():
+            pass
+        return summary
+
+    def to_sweep_result(self) -> SweepResult:
+        """All evaluated samples (after run()), one row per sample."""
+        if self.samples is None:
+            raise ValueError("No samples yet, call run() or result() first")
+        return SweepResult(self.lines, self.samples)
+
+
+if __name__ == "__main__":
+    from .data import *
+    baseline = {key: 0.0 for key in SWEEP_PARAMETERS}
+    baseline.update({KEY_DISCOUNT_RATE_IA: 0.067, KEY_INFLATION_RATE: 0.0515, KEY_DESIGN_LIFE: 50,
+                     KEY_ANALYSIS_PERIOD: 50, KEY_ROUTINE_INSP_FREQ: 1, KEY_ROUTINE_INSP_COST: 0.01,
+                     COST_TOTAL_INIT_CONST: 1e8, KEY_MATERIAL_QUANTITY_FACTOR: 1.0,
+                     "CO2_EMISSION_PER_KM": 0.0, "WORKING_DAYS_IN_MONTH": 25, "DURATION_MAJOR_REPAIRS": 0,
+                     "DURATION_REPLACEMENT": 0, "DURATION_DEMOLITION_DISPOSAL": 0,
+                     "Steel Rebar": 0.0, "Structural Steel": 0.0, "Tendons": 0.0})
+    engine = MonteCarloEngine(baseline, {KEY_DISCOUNT_RATE_IA: Triangular(0.05, 0.067, 0.09),
+                                         KEY_MATERIAL_QUANTITY_FACTOR: Uniform(0.9, 1.1)}, seed=1)
+    for summary in engine.run():
+        print(summary)
@@ -0,0 +1,158 @@
+import math
+from collections import OrderedDict, namedtuple
+from typing import Optional
+import numpy as np
+
+PWFCacheInfo = namedtuple("PWFCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def _number_of_periods(frequency: float, design_life: float) -> int:
+    """
+    Number of terms in range(frequency, design_life, frequency).
+
+    Returns 0 when the frequency is not positive (no recurring event).
+    """
+    if frequency <= 0:
+        return 0
+    return max(0, math.ceil((design_life - frequency) / frequency))
+
+
+def single_payment_pwf(inflation_rate: float, discount_rate: float, period: float) -> float:
+    """
+    Present worth factor of a single payment made after `period` years.
+
+    Args:
+        inflation_rate: Annual inflation rate (e.g. 0.0515)
+        discount_rate: Annual discount rate (e.g. 0.067)
+        period: Year in which the payment is made
+
+    Returns:
+        ((1 + inflation_rate) / (1 + discount_rate)) ** period
+    """
+    return ((1 + inflation_rate) / (1 + discount_rate)) ** period
+
+
+def present_worth_factor(inflation_rate: float, discount_rate: float,
+                         frequency: float, design_life: float,
+                         cache: Optional["PWFCache"] = None) -> float:
+    """
+    Present worth factor of a cost recurring every `frequency` years.
+
+    Closed form of
+        sum(((1 + i) / (1 + d)) ** p for p in range(frequency, design_life, frequency))
+    evaluated as a geometric series, so the cost does not grow with design life.
+
+    Args:
+        inflation_rate: Annual inflation rate
+        discount_rate: Annual discount rate
+        frequency: Years between two occurrences (0 means no occurrence)
+        design_life: Upper limit (exclusive) of the series in years
+        cache: Optional PWFCache to look the factor up in
+
+    Returns:
+        Present worth factor (0.0 if the cost never occurs)
+    """
+    if cache is not None:
+        return cache.get(inflation_rate, discount_rate, frequency, design_life)
+
+    n = _number_of_periods(frequency, design_life)
+    if n == 0:
+        return 0.0
+
+    q = single_payment_pwf(inflation_rate, discount_rate, frequency)
+    if math.isclose(q, 1.0, rel_tol=0.0, abs_tol=1e-12):
+        return float(n)
+    return q * (1 - q ** n) / (1 - q)
+
+
+class PWFCache:
+    """
+    LRU bounded cache of present worth factors.
+
+    Keyed on (inflation_rate, discount_rate, frequency, design_life) so that
+    every distinct series is evaluated once, however many cost lines (or
+    bridges) share the same financial profile.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Args:
+            maxsize: Maximum number of factors kept before the least recently
+                used one is evicted
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._factors = OrderedDict()
+
+    def get(self, inflation_rate: float, discount_rate: float,
+            frequency: float, design_life: float) -> float:
+        """Return the present worth factor, computing it on a miss."""
+        key = (float(inflation_rate), float(discount_rate), float(frequency), float(design_life))
+        try:
+            factor = self._factors[key]
+        except KeyError:
+            self.misses += 1
+            factor = present_worth_factor(*key)
+            self._factors[key] = factor
+            if len(self._factors) > self.maxsize:
+                self._factors.popitem(last=False)
+            return factor
+
+        self.hits += 1
+        self._factors.move_to_end(key)
+        return factor
+
+    def cache_info(self) -> PWFCacheInfo:
+        """Hit/miss statistics, in the style of functools.lru_cache."""
+        return PWFCacheInfo(self.hits, self.misses, self.maxsize, len(self._factors))
+
+    def clear(self):
+        """Drop all cached factors and reset the statistics."""
+        self._factors.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._factors)
+
+
+def present_worth_factors(inflation_rate, discount_rate, frequency, design_life) -> np.ndarray:
+    """
+    Vectorised present_worth_factor().
+
+    All arguments are broadcast against each other, so any of them may be a
+    scalar or a NumPy array (e.g. thousands of discount/inflation pairs).
+
+    Returns:
+        Array of present worth factors with the broadcast shape of the inputs
+    """
+    i = np.asarray(inflation_rate, dtype=float)
+    d = np.asarray(discount_rate, dtype=float)
+    f = np.asarray(frequency, dtype=float)
+    life = np.asarray(design_life, dtype=float)
+
+    valid = f > 0
+    safe_f = np.where(valid, f, 1.0)
+    n = np.where(valid, np.maximum(0.0, np.ceil((life - safe_f) / safe_f)), 0.0)
+
+    q = ((1 + i) / (1 + d)) ** safe_f
+    near_one = np.isclose(q, 1.0, rtol=0.0, atol=1e-12)
+    denominator = np.where(near_one, 1.0, 1 - q)
+    series = np.where(near_one, n, q * (1 - q ** n) / denominator)
+    return np.where(n > 0, series, 0.0)
+
+
+def single_payment_pwfs(inflation_rate, discount_rate, period) -> np.ndarray:
+    """Vectorised single_payment_pwf()."""
+    i = np.asarray(inflation_rate, dtype=float)
+    d = np.asarray(discount_rate, dtype=float)
+    return ((1 + i) / (1 + d)) ** np.asarray(period, dtype=float)
+
+
+if __name__ == "__main__":
+    print(present_worth_factor(0.0515, 0.067, 1, 50))
+    print(sum(((1 + 0.0515) / (1 + 0.067)) ** p for p in range(1, 50, 1)))
+    print(present_worth_factors([0.04, 0.0515], [0.067, 0.08], [1, 5], 50))
@@ -0,0 +1,184 @@
+import os
+import re
+import sqlite3
+from dataclasses import dataclass
+from typing import List
+
+# Folder holding one database per project (see project_db_path)
+PROJECTS_DIR = os.path.join(os.path.expanduser("~"), ".osbridgelcca", "projects")
+# Databases of batch runs stored on disk, apart from the saved projects
+BATCH_PROJECTS_DIR = os.path.join(os.path.expanduser("~"), ".osbridgelcca", "batch")
+
+IN_MEMORY = ":memory:"
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """
+    SQLite connection settings used by DatabaseManager.
+
+    Attributes:
+        journal_mode: PRAGMA journal_mode (WAL lets readers run alongside a writer)
+        synchronous: PRAGMA synchronous (NORMAL is safe with WAL and avoids an fsync per commit)
+        mmap_size: Bytes of the database file memory mapped for reads (0 disables it)
+        cache_size: PRAGMA cache_size; negative values are in KiB
+        foreign_keys: Enforce the FOREIGN KEY constraints (and ON DELETE CASCADE)
+        in_memory: Keep the database in memory only, e.g. for batch runs
+    """
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size: int = -64 * 1024
+    foreign_keys: bool = True
+    in_memory: bool = False
+
+    def connect(self, db_path: str) -> sqlite3.Connection:
+        """
+        Open a connection to db_path (ignored when in_memory) and apply the profile.
+
+        Args:
+            db_path: Path of the database file; its folder is created if needed
+        """
+        if self.in_memory:
+            conn = sqlite3.connect(IN_MEMORY)
+        else:
+            folder = os.path.dirname(db_path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            conn = sqlite3.connect(db_path)
+            # WAL only applies to file databases
+            conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+            conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute(f"PRAGMA cache_size={int(self.cache_size)}")
+        conn.execute(f"PRAGMA foreign_keys={'ON' if self.foreign_keys else 'OFF'}")
+        return conn
+
+
+# Default profile of the desktop application
+DEFAULT_PROFILE = StorageProfile()
+
+# Throw-away database for headless batch runs
+BATCH_PROFILE = StorageProfile(synchronous="OFF", in_memory=True)
+
+
+# Schema migrations: MIGRATIONS[i] upgrades a database from version i to i + 1.
+# The version is stored in PRAGMA user_version; databases created before the
+# schema was versioned report 0, which is why the first step uses IF NOT EXISTS.
+MIGRATIONS: List[List[str]] = [
+    # 1: initial schema
+    [
+        '''
+        CREATE TABLE IF NOT EXISTS struct_works_data (
+            comp_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            type TEXT NOT NULL CHECK(type IN (
+                'Foundation',
+                'Sub-Structure',
+                'Super-Structure',
+                'Miscellaneous'
+            )),
+            component_type TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS component (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            comp_id INTEGER NOT NULL,
+            type_material TEXT NOT NULL,
+            grade TEXT NOT NULL,
+            quantity REAL NOT NULL DEFAULT 0,
+            unit TEXT NOT NULL,
+            rate REAL NOT NULL DEFAULT 0.0,
+            rate_data_source TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (comp_id) REFERENCES struct_works_data(comp_id) ON DELETE CASCADE
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS financial_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            real_discount_rate REAL NOT NULL,
+            interest_rate REAL NOT NULL,
+            investment_ratio REAL NOT NULL,
+            duration_of_study INTEGER NOT NULL,
+            time_of_project INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS carbon_emission(
+            type_material TEXT NOT NULL,
+            grade TEXT NOT NULL,
+            quantity REAL NOT NULL DEFAULT 0,
+            unit TEXT NOT NULL,
+            emission_factor REAL NOT NULL,
+            embodied REAL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (type_material, grade, unit)
+        )
+        ''',
+    ],
+    # 2: indexes for the aggregated material totals and the deletes by comp_id
+    [
+        'CREATE INDEX IF NOT EXISTS idx_component_comp_id ON component(comp_id)',
+        'CREATE INDEX IF NOT EXISTS idx_struct_works_type ON struct_works_data(type)',
+    ],
+    # 3: foreign keys are enforced from now on, drop components left without a structure work
+    [
+        'DELETE FROM component WHERE comp_id NOT IN (SELECT comp_id FROM struct_works_data)',
+    ],
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Bring a database up to SCHEMA_VERSION. Every step runs in its own transaction.
+
+    Returns:
+        Number of migrations applied
+
+    Raises:
+        ValueError: If the database was written by a newer version of the application
+    """
+    version = schema_version(conn)
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Database schema version {version} is newer than the supported "
+                         f"version {SCHEMA_VERSION}")
+
+    for target in range(version + 1, SCHEMA_VERSION + 1):
+        with conn:
+            for statement in MIGRATIONS[target - 1]:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {target}")
+    return SCHEMA_VERSION - version
+
+
+def project_db_path(project_name: str, projects_dir: str = PROJECTS_DIR) -> str:
+    """
+    Path of the database of a project.
+
+    Args:
+        project_name: Name of the project; characters not allowed in file names are replaced
+        projects_dir: Folder holding the project databases
+    """
+    file_name = re.sub(r"[^\w\-. ]", "_", project_name).strip() or "project"
+    return os.path.join(projects_dir, f"{file_name}.db")
+
+
+def remove_database(db_path: str):
+    """Delete a database file together with its WAL and shared memory files."""
+    for path in (db_path, db_path + "-wal", db_path + "-shm"):
+        if os.path.exists(path):
+            os.remove(path)
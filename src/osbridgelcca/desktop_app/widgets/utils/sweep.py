@@ -0,0 +1,215 @@
+from typing import Dict, List, Mapping
+import numpy as np
+from .data import *
+from .pwf import present_worth_factors, single_payment_pwfs
+
+# Vehicle classes counted in the daily average traffic
+TRAFFIC_VEHICLES = [KEY_TWO_WHEELER, KEY_SMALL_CARS, KEY_BIG_CARS,
+                    KEY_ORDINARY_BUS, KEY_DELUXE_BUS,
+                    KEY_LCV, KEY_HCV, KEY_MCV]
+
+# Parameters that can be swept, grouped by the DatabaseManager attribute they come from
+FINANCIAL_PARAMETERS = [KEY_DISCOUNT_RATE_IA, KEY_INFLATION_RATE, KEY_INTEREST_RATE,
+                        KEY_INVESTMENT_RATIO, KEY_DESIGN_LIFE, KEY_CONSTR_TIME,
+                        KEY_ANALYSIS_PERIOD]
+MAINTAINANCE_PARAMETERS = [KEY_ROUTINE_INSP_COST, KEY_ROUTINE_INSP_FREQ,
+                           KEY_PERIODIC_MAINT_COST, KEY_PERIODIC_MAINT_FREQ,
+                           KEY_MAJOR_INSP_COST, KEY_MAJOR_INSP_FREQ,
+                           KEY_MAJOR_REPAIR_COST, KEY_MAJOR_REPAIR_FREQ,
+                           KEY_BEARING_EXP_JOINT_REPAIR_COST, KEY_BEARING_EXP_JOINT_REPAIR_FREQ]
+DEMOLITION_PARAMETERS = [KEY_DEMOLITION_DISPOSAL_COST] + [key for _, scrap, recyclability in RECYCLED_MATERIALS
+                                                          for key in (scrap, recyclability)]
+TRAFFIC_PARAMETERS = [KEY_ADDIT_REROUTING_DISTANCE] + TRAFFIC_VEHICLES
+CARBON_PARAMETERS = [KEY_SCC]
+# Totals taken from the bill of quantities; sweeping them (or the common quantity
+# factor applied to all of them) models quantity uncertainty
+MATERIAL_PARAMETERS = [COST_TOTAL_INIT_CONST, COST_TOTAL_INIT_CARBON_EMISSION, COST_TOTAL_SUPERSTRUCTURE,
+                       KEY_MATERIAL_QUANTITY_FACTOR]
+
+SWEEP_PARAMETERS = (FINANCIAL_PARAMETERS + MAINTAINANCE_PARAMETERS + DEMOLITION_PARAMETERS
+                    + TRAFFIC_PARAMETERS + CARBON_PARAMETERS + MATERIAL_PARAMETERS)
+
+# Life-cycle cost lines returned by a sweep, in column order
+SWEEP_RESULTS = [
+    COST_TOTAL_INIT_CONST,
+    COST_TOTAL_INIT_CARBON_EMISSION,
+    COST_TIME,
+    COST_CARBON_EMISSION_REROUTING_INIT,
+    COST_TOTAL_ROUTINE_INSPECTION,
+    COST_PERIODIC_MAINTAINANCE,
+    COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION,
+    COST_MAJOR_INSPECTION,
+    COST_MAJOR_REPAIR,
+    COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION,
+    COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR,
+    COST_BEARING_EXP_JOINT_REPLACEMENT,
+    COST_CARBON_EMISSION_RR_DURING_REPLACEMENT,
+    COST_DEMOLITION_DISPOSAL,
+    COST_DEMOLITION_DISPOSAL_CARBON,
+    COST_DEMOLITION_DISPOSAL_CARBON_REROUTING,
+    COST_RECYCLING,
+]
+
+
+class SweepResult:
+    """Matrix of life-cycle cost lines (columns) for every scenario (rows)."""
+
+    def __init__(self, lines: List[str], values: np.ndarray):
+        self.lines = list(lines)
+        self.values = values
+
+    def __len__(self):
+        return self.values.shape[0]
+
+    def __getitem__(self, line: str) -> np.ndarray:
+        try:
+            return self.values[:, self.lines.index(line)]
+        except ValueError:
+            raise KeyError(f"Unknown cost line: '{line}'. Valid options: {self.lines}")
+
+    def total(self) -> np.ndarray:
+        """Life-cycle cost of every scenario (sum over all cost lines)."""
+        return self.values.sum(axis=1)
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        return {line: self.values[:, j] for j, line in enumerate(self.lines)}
+
+    def to_dataframe(self):
+        """Return the results as a pandas DataFrame (one column per cost line)."""
+        import pandas as pd
+        return pd.DataFrame(self.values, columns=self.lines)
+
+
+def snapshot_inputs(manager) -> Dict[str, float]:
+    """
+    Collect the current scalar inputs of a DatabaseManager into a plain dictionary.
+
+    The snapshot holds only floats, so it can be pickled and sent to worker
+    processes without the database connection.
+
+    Args:
+        manager: DatabaseManager holding the UI data and the bill of quantities
+
+    Returns:
+        Dictionary keyed by the SWEEP_PARAMETERS plus the constants used by the
+        cost formulas. Missing UI data is stored as 0.0.
+    """
+    def value(data, key):
+        v = data.get(key)
+        return 0.0 if v is None else float(v)
+
+    baseline = {}
+    for key in FINANCIAL_PARAMETERS:
+        baseline[key] = value(manager.financial_data, key)
+    for key in MAINTAINANCE_PARAMETERS:
+        baseline[key] = value(manager.maintainance_and_repair_data, key)
+    for key in DEMOLITION_PARAMETERS:
+        baseline[key] = value(manager.demolition_and_recycling_data, key)
+    baseline[KEY_ADDIT_REROUTING_DISTANCE] = value(manager.traffic_data, KEY_ADDIT_REROUTING_DISTANCE)
+    for key in TRAFFIC_VEHICLES:
+        baseline[key] = value(manager.daily_average_traffic_data, key)
+    baseline[KEY_SCC] = value(manager.carbon_emission_cost_data, KEY_SCC)
+
+    for key in (COST_TOTAL_INIT_CONST, COST_TOTAL_INIT_CARBON_EMISSION):
+        total = manager.result(key)
+        baseline[key] = 0.0 if total is None else float(total)
+    baseline[COST_TOTAL_SUPERSTRUCTURE] = manager.get_total_material_cost(work_type=KEY_SUPERSTRUCTURE)
+    baseline[KEY_MATERIAL_QUANTITY_FACTOR] = 1.0
+    for material, _, _ in RECYCLED_MATERIALS:
+        baseline[material] = manager.get_total_material_cost(type_material=material)
+
+    baseline["CO2_EMISSION_PER_KM"] = manager.CO2_EMISSION_PER_KM
+    baseline["WORKING_DAYS_IN_MONTH"] = manager.WORKING_DAYS_IN_MONTH
+    baseline["DURATION_MAJOR_REPAIRS"] = manager.DURATION_MAJOR_REPAIRS
+    baseline["DURATION_REPLACEMENT"] = manager.DURATION_REPLACEMENT
+    baseline["DURATION_DEMOLITION_DISPOSAL"] = manager.DURATION_DEMOLITION_DISPOSAL
+    return baseline
+
+
+def _as_columns(scenarios) -> Dict[str, np.ndarray]:
+    """Convert a mapping (or DataFrame) of parameter columns into float arrays."""
+    columns = {key: np.asarray(values, dtype=float) for key, values in scenarios.items()}
+    unknown = [key for key in columns if key not in SWEEP_PARAMETERS]
+    if unknown:
+        raise ValueError(f"Invalid sweep parameters: {unknown}. Valid options: {SWEEP_PARAMETERS}")
+    return columns
+
+
+def evaluate_scenarios(baseline: Mapping[str, float], scenarios) -> SweepResult:
+    """
+    Evaluate every life-cycle cost line for all scenarios in one vectorized pass.
+
+    Args:
+        baseline: Scalar inputs, as returned by snapshot_inputs()
+        scenarios: Mapping (or pandas DataFrame) of parameter name -> column of
+            values. Parameters that are not given keep their baseline value.
+
+    Returns:
+        SweepResult with one row per scenario and one column per SWEEP_RESULTS line
+    """
+    columns = _as_columns(scenarios)
+    sizes = {column.size for column in columns.values() if column.ndim > 0}
+    if len(sizes) > 1:
+        raise ValueError(f"All sweep columns must have the same length, got {sorted(sizes)}")
+    n = sizes.pop() if sizes else 1
+
+    def p(key):
+        return np.broadcast_to(columns.get(key, baseline[key]), (n,))
+
+    inflation = p(KEY_INFLATION_RATE)
+    discount = p(KEY_DISCOUNT_RATE_IA)
+    design_life = p(KEY_DESIGN_LIFE)
+    analysis_period = p(KEY_ANALYSIS_PERIOD)
+    constr_time = p(KEY_CONSTR_TIME)
+    scc = p(KEY_SCC)
+    rerouting_dist = p(KEY_ADDIT_REROUTING_DISTANCE)
+    total_traffic = sum(p(key) for key in TRAFFIC_VEHICLES)
+
+    quantity_factor = p(KEY_MATERIAL_QUANTITY_FACTOR)
+    init_cost = p(COST_TOTAL_INIT_CONST) * quantity_factor
+    carbon_cost = p(COST_TOTAL_INIT_CARBON_EMISSION) * quantity_factor
+    superstructure_cost = p(COST_TOTAL_SUPERSTRUCTURE) * quantity_factor
+
+    working_days = baseline["WORKING_DAYS_IN_MONTH"]
+    rerouting_carbon = scc * baseline["CO2_EMISSION_PER_KM"] * rerouting_dist
+
+    def pwf(frequency_key):
+        return present_worth_factors(inflation, discount, p(frequency_key), design_life)
+
+    pwf_routine = pwf(KEY_ROUTINE_INSP_FREQ)
+    pwf_periodic = pwf(KEY_PERIODIC_MAINT_FREQ)
+    pwf_major_insp = pwf(KEY_MAJOR_INSP_FREQ)
+    pwf_major_repair = pwf(KEY_MAJOR_REPAIR_FREQ)
+    pwf_bearing = pwf(KEY_BEARING_EXP_JOINT_REPAIR_FREQ)
+    pwf_end_of_life = present_worth_factors(inflation, discount, analysis_period, design_life)
+    spwf_end_of_life = single_payment_pwfs(inflation, discount, analysis_period)
+
+    results = {
+        COST_TOTAL_INIT_CONST: init_cost,
+        COST_TOTAL_INIT_CARBON_EMISSION: carbon_cost,
+        COST_TIME: init_cost * p(KEY_INTEREST_RATE) * constr_time * p(KEY_INVESTMENT_RATIO),
+        COST_CARBON_EMISSION_REROUTING_INIT: total_traffic * constr_time * 12 * working_days * rerouting_carbon,
+        COST_TOTAL_ROUTINE_INSPECTION: init_cost * pwf_routine * p(KEY_ROUTINE_INSP_COST),
+        COST_PERIODIC_MAINTAINANCE: init_cost * pwf_periodic * p(KEY_PERIODIC_MAINT_COST),
+        COST_PERIODIC_MAINTAINANCE_CARBON_EMISSION: carbon_cost * pwf_periodic * p(KEY_PERIODIC_MAINT_COST),
+        COST_MAJOR_INSPECTION: init_cost * pwf_major_insp * p(KEY_MAJOR_INSP_COST),
+        COST_MAJOR_REPAIR: init_cost * pwf_major_repair * p(KEY_MAJOR_REPAIR_COST),
+        COST_MAJOR_REPAIR_RELATED_CARBON_EMISSION: carbon_cost * pwf_major_repair * p(KEY_MAJOR_REPAIR_COST),
+        COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR: (total_traffic * baseline["DURATION_MAJOR_REPAIRS"] * working_days
+                                                      * rerouting_carbon * pwf_major_repair),
+        # Mirrors DatabaseManager.bearing_expansion_joint_replacement_cost()
+        COST_BEARING_EXP_JOINT_REPLACEMENT: superstructure_cost * pwf_major_repair * p(KEY_MAJOR_INSP_COST),
+        COST_CARBON_EMISSION_RR_DURING_REPLACEMENT: (total_traffic * baseline["DURATION_REPLACEMENT"] * working_days
+                                                     * rerouting_carbon * pwf_bearing),
+        COST_DEMOLITION_DISPOSAL: init_cost * spwf_end_of_life * p(KEY_DEMOLITION_DISPOSAL_COST),
+        COST_DEMOLITION_DISPOSAL_CARBON: carbon_cost * spwf_end_of_life * p(KEY_DEMOLITION_DISPOSAL_COST),
+        COST_DEMOLITION_DISPOSAL_CARBON_REROUTING: (init_cost * pwf_end_of_life * baseline["DURATION_DEMOLITION_DISPOSAL"]
+                                                    * working_days * rerouting_carbon),
+        COST_RECYCLING: sum(p(scrap) * p(recyclability) * baseline[material] * quantity_factor * pwf_end_of_life
+                            for material, scrap, recyclability in RECYCLED_MATERIALS),
+    }
+
+    values = np.empty((n, len(SWEEP_RESULTS)))
+    for j, line in enumerate(SWEEP_RESULTS):
+        values[:, j] = results[line]
+    return SweepResult(SWEEP_RESULTS, values)
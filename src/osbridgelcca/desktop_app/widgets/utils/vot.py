@@ -0,0 +1,72 @@
+from functools import lru_cache
+from typing import Mapping
+import numpy as np
+from .data import *
+from .IRC_SP_30 import OCCUPANCY, ROAD_INDEX, VEHICLE_INDEX, VEHICLES, VOT, YEAR_INDEX, YEARS, _codes, wpi_ratios
+
+# Value of travel time of the traffic delayed by a closure. VOT per vehicle-hour
+# (Table 6 VOT x occupancy x WPI of the year) is precomputed as a
+# (year, vehicle, road type) tensor, so the VOT of any vector of vehicle counts
+# is one contraction over the vehicle axis, for every road type and year at once.
+
+
+@lru_cache(maxsize=8)
+def vot_tensor(base_year: int = BASE_YEAR) -> np.ndarray:
+    """
+    WPI adjusted VOT per vehicle-hour (INR), shape (len(YEARS), len(VEHICLES), len(ROAD_TYPES)).
+
+    Built once per base year; read-only.
+    """
+    wpi = np.stack([wpi_ratios(TABLE_VOT, VEHICLES, year, base_year) for year in YEARS])
+    tensor = wpi[:, :, np.newaxis] * (VOT * OCCUPANCY[:, np.newaxis])[np.newaxis]
+    tensor.flags.writeable = False
+    return tensor
+
+
+def _code_array(index: Mapping, keys, what: str) -> np.ndarray:
+    """Integer codes of a key or an array of keys of any shape."""
+    keys = np.asarray(keys, dtype=object)
+    return _codes(index, keys.ravel().tolist(), what).reshape(keys.shape)
+
+
+def vehicle_counts(traffic: Mapping[str, float]) -> np.ndarray:
+    """Daily traffic of a {vehicle type: count} dictionary as a vector in VEHICLES order."""
+    counts = np.zeros(len(VEHICLES))
+    counts[_codes(VEHICLE_INDEX, list(traffic), "vehicle type")] = list(traffic.values())
+    return counts
+
+
+def vot_per_day(counts, road_types, detour_hours, years=PRICE_YEAR, base_year: int = BASE_YEAR) -> np.ndarray:
+    """
+    Daily VOT (INR) of delayed traffic, for one or many scenarios.
+
+    Args:
+        counts: (..., vehicle) vehicles per day in VEHICLES order
+        road_types: Road type or array of road types (ROAD_TYPES names)
+        detour_hours: Additional travel time per vehicle (hours)
+        years: Price year or array of years
+        base_year: Reference year of the VOT table
+
+    Returns:
+        Array with the broadcast shape of counts[..., 0], road_types, detour_hours and years
+    """
+    roads = _code_array(ROAD_INDEX, road_types, "road type")
+    years = _code_array(YEAR_INDEX, years, "year")
+    # (..., vehicle) VOT per vehicle-hour of every scenario
+    values = vot_tensor(base_year)[years[..., np.newaxis], np.arange(len(VEHICLES)), roads[..., np.newaxis]]
+    return np.einsum("...v,...v->...", np.asarray(counts, dtype=float), values) * detour_hours
+
+
+def vot_table(counts, detour_hours, base_year: int = BASE_YEAR) -> np.ndarray:
+    """
+    Daily VOT (INR) of every scenario for every price year and road type.
+
+    Args:
+        counts: (..., vehicle) vehicles per day in VEHICLES order
+        detour_hours: Additional travel time per vehicle (hours), scalar or shape (...)
+
+    Returns:
+        Array of shape (..., len(YEARS), len(ROAD_TYPES))
+    """
+    table = np.tensordot(np.asarray(counts, dtype=float), vot_tensor(base_year), axes=([-1], [1]))
+    return table * np.asarray(detour_hours, dtype=float)[..., np.newaxis, np.newaxis]
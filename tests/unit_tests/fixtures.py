@@ -0,0 +1,26 @@
+import pytest
+from desktop_app.widgets.utils.data import *
+from desktop_app.widgets.utils.database import DatabaseManager
+
+# Shared by the cost engine tests; import the fixture into a test module to use it
+# (the conftest of this folder needs the Flask backend).
+
+MAINTAINANCE_DATA = {
+    KEY_ROUTINE_INSP_COST: 0.01, KEY_ROUTINE_INSP_FREQ: 1,
+    KEY_PERIODIC_MAINT_COST: 0.0055, KEY_PERIODIC_MAINT_FREQ: 5,
+    KEY_MAJOR_INSP_COST: 0.02, KEY_MAJOR_INSP_FREQ: 10,
+    KEY_MAJOR_REPAIR_COST: 0.1, KEY_MAJOR_REPAIR_FREQ: 30,
+    KEY_BEARING_EXP_JOINT_REPAIR_COST: 0.05, KEY_BEARING_EXP_JOINT_REPAIR_FREQ: 15,
+}
+
+CARBON_EMISSION_COST_DATA = {KEY_SOURCE: SCC_NITI_Aayog, KEY_SCC: 6.3936}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """DatabaseManager with the maintenance and carbon emission cost data entered."""
+    db = DatabaseManager(db_path=str(tmp_path / "structure_works.db"))
+    db.maintainance_and_repair_data = dict(MAINTAINANCE_DATA)
+    db.carbon_emission_cost_data = dict(CARBON_EMISSION_COST_DATA)
+    yield db
+    db.close()
@@ -0,0 +1,36 @@
+import pytest
+import numpy as np
+from desktop_app.widgets.utils.data import *
+from desktop_app.widgets.utils.IRC_SP_30 import IRC_SP_30
+from desktop_app.widgets.utils.accident import (DAMAGE_VEHICLES, INJURY_CATEGORIES, accident_exposure,
+                                                accident_unit_costs, evaluate_accident_costs)
+
+INJURIES = np.array([60.0, 20.0, 20.0])
+VEHICLES = np.array([5.0, 10.0, 50.0, 10.0, 10.0, 5.0, 5.0, 5.0])
+
+# ✅ Unit costs are the IRC SP-30 costs adjusted with the WPI of the year
+@pytest.mark.unit
+def test_accident_unit_costs():
+    irc = IRC_SP_30()
+    injury, damage = accident_unit_costs(2024)
+    assert injury[INJURY_CATEGORIES.index(KEY_FATAL)] == pytest.approx(
+        irc._get_accident_cost(KEY_FATAL) * irc._get_wpi(TABLE_WPI_MEDICAL, KEY_FATAL, 2024, BASE_YEAR))
+    assert damage[DAMAGE_VEHICLES.index(KEY_LCV)] == pytest.approx(
+        irc._get_vehicle_damage_cost(KEY_LCV) * irc._get_wpi(TABLE_VOT, KEY_LCV, 2024, BASE_YEAR))
+    assert accident_unit_costs(BASE_YEAR)[0][0] == irc._get_accident_cost(INJURY_CATEGORIES[0])
+    with pytest.raises(ValueError):
+        accident_unit_costs(1990)
+
+# ✅ Scenario arrays give the same costs as evaluating every scenario alone
+@pytest.mark.unit
+def test_accident_cost_scenarios():
+    crash_rate = np.array([10.0, 30.0, 45.0])
+    exposure = accident_exposure(crash_rate, 700, 6.0, 26 * 60)
+    assert exposure[1] == pytest.approx(30.0 * 700 * 6.0 * 1e-6 * 26 * 60)
+    injuries = np.stack([INJURIES, INJURIES[::-1], INJURIES * 0.5])
+    costs = evaluate_accident_costs(exposure, injuries, VEHICLES, 2024)
+    assert costs.human_injury.shape == costs.vehicle_damage.shape == (3,)
+    for s in range(3):
+        alone = evaluate_accident_costs(exposure[s], injuries[s], VEHICLES, 2024)
+        assert costs.total()[s] == pytest.approx(alone.total())
+    assert costs.vehicle_damage[1] == pytest.approx(3 * costs.vehicle_damage[0])
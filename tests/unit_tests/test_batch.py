@@ -0,0 +1,89 @@
+import csv
+import json
+import os
+import pytest
+from desktop_app.widgets.utils.data import *
+from desktop_app.widgets.utils.batch import (RESULT_COLUMNS, VOC_CACHE, PortfolioRunner, evaluate_project,
+                                             iter_projects, load_into, run_portfolio)
+from desktop_app.widgets.utils.database import DatabaseManager
+from desktop_app.widgets.utils.monte_carlo import KEY_LIFE_CYCLE_COST
+from desktop_app.widgets.utils.storage import DEFAULT_PROFILE, PROJECTS_DIR
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "..", "src", "osbridgelcca", "examples")
+
+
+def _example(name):
+    with open(os.path.join(EXAMPLES, name), encoding="utf-8") as file:
+        return json.load(file)
+
+# ✅ The example projects are evaluated with every cost line
+@pytest.mark.unit
+def test_evaluate_example_project():
+    record = evaluate_project(0, "highway_bridge.json", _example("highway_bridge.json"))
+    assert record["error"] is None and record["project"] == "Highway Bridge"
+    assert record[COST_TOTAL_INIT_CONST] == 12997000
+    assert record[KEY_LIFE_CYCLE_COST] == pytest.approx(sum(record[line] for line in RESULT_COLUMNS[3:-3]))
+    assert record[COST_TOTAL_ROAD_USER] > 0
+    bad = evaluate_project(1, "bad.json", {"financial_data": {}, "colour": "red"})
+    assert bad["error"].startswith("ValueError") and bad[COST_TOTAL_INIT_CONST] is None
+
+# ✅ Projects evaluated in one process share the vehicle models of the road user cost
+@pytest.mark.unit
+def test_projects_share_voc_cache():
+    project = _example("highway_bridge.json")
+    first = evaluate_project(0, "highway_bridge.json", project)
+    misses = VOC_CACHE.cache_info().misses
+    hits = VOC_CACHE.cache_info().hits
+    second = evaluate_project(1, "highway_bridge.json", project)
+    assert VOC_CACHE.cache_info().misses == misses and VOC_CACHE.cache_info().hits > hits
+    assert second[COST_TOTAL_ROAD_USER] == first[COST_TOTAL_ROAD_USER]
+
+# ✅ The vehicle operation cost is evaluated on the alternate road of the project
+@pytest.mark.unit
+def test_voc_follows_alternate_road(tmp_path):
+    manager = DatabaseManager(db_path=str(tmp_path / "structure_works.db"))
+    load_into(manager, _example("urban_flyover.json"))
+    inputs = manager._voc_inputs()
+    assert inputs["lane_type"] == "4L" and inputs["rg_roughness_factor"] == 2000.0
+    cost = manager.total_road_user_cost()
+    manager.traffic_data = {**manager.traffic_data, KEY_ROAD_ROUGHNESS: "6000", KEY_ROAD_RISE: "20"}
+    assert manager._voc_inputs()["rs_rise_factor"] == 20.0
+    assert manager.total_road_user_cost() > cost
+    manager.traffic_data = {**manager.traffic_data, KEY_ALTER_ROAD_CARRIAGEWAY: "Dirt Track"}
+    with pytest.raises(ValueError):
+        manager.total_road_user_cost()
+    manager.close()
+
+# ✅ A directory and a JSONL stream give the same consolidated results; bad projects are reported
+@pytest.mark.unit
+def test_run_portfolio(tmp_path):
+    projects = [_example("highway_bridge.json"), _example("urban_flyover.json")]
+    stream = tmp_path / "portfolio.jsonl"
+    stream.write_text("\n".join(json.dumps(p) for p in projects) + "\n{not json\n", encoding="utf-8")
+    assert [index for index, _, _ in iter_projects(str(stream))] == [0, 1, 2]
+
+    assert run_portfolio(str(stream), str(tmp_path / "a.jsonl"), max_workers=2, chunk_size=1) == (3, 1)
+    assert run_portfolio(EXAMPLES, str(tmp_path / "b.csv"), max_workers=1) == (2, 0)
+
+    with open(tmp_path / "a.jsonl", encoding="utf-8") as file:
+        streamed = sorted((json.loads(line) for line in file), key=lambda record: record["index"])
+    with open(tmp_path / "b.csv", encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert list(rows[0]) == RESULT_COLUMNS
+    assert streamed[2]["error"].startswith("ValueError: Invalid JSON")
+    for record, row in zip(streamed, rows):
+        assert record["project"] == row["project"]
+        assert record[KEY_LIFE_CYCLE_COST] == pytest.approx(float(row[KEY_LIFE_CYCLE_COST]))
+
+# ✅ On-disk batch runs keep their databases apart from the saved projects
+@pytest.mark.unit
+def test_on_disk_batch_keeps_saved_projects(tmp_path):
+    project = _example("highway_bridge.json")
+    record = evaluate_project(0, "highway_bridge.json", project, DEFAULT_PROFILE, str(tmp_path))
+    assert record["error"] is None and (tmp_path / "Highway Bridge.db").exists()
+    assert evaluate_project(0, "highway_bridge.json", project, DEFAULT_PROFILE, str(tmp_path)) == record
+
+    refused = evaluate_project(0, "highway_bridge.json", project, DEFAULT_PROFILE, PROJECTS_DIR)
+    assert refused["error"].startswith("ValueError") and refused[COST_TOTAL_INIT_CONST] is None
+    with pytest.raises(ValueError):
+        PortfolioRunner([], profile=DEFAULT_PROFILE, projects_dir=os.path.join(PROJECTS_DIR, "batch"))
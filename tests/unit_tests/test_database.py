@@ -0,0 +1,71 @@
+import sqlite3
+import pytest
+from desktop_app.widgets.utils.data import *
+from desktop_app.widgets.utils.database import DatabaseManager
+
+
+def _row(component, material, quantity, rate):
+    return {KEY_COMPONENT: component, KEY_TYPE: material, KEY_GRADE: "", KEY_QUANTITY: quantity,
+            KEY_UNIT_M3: "cum", KEY_RATE: rate}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    db = DatabaseManager(db_path=str(tmp_path / "structure_works.db"))
+    db.input_data_row(KEY_FOUNDATION, [[_row("Pile", "Concrete", 30, 5000), _row("Pile", "Steel Rebar", 100, 50)]])
+    db.input_data_row(KEY_SUPERSTRUCTURE, [[_row("Girder", "Structural Steel", 20, 90000)],
+                                           [_row("Deck", "Steel Rebar", 10, 50)]])
+    yield db
+    db.close()
+
+# ✅ Material totals are grouped by work type and material
+@pytest.mark.unit
+def test_material_cost_totals(manager):
+    assert manager.get_material_cost_totals() == {
+        (KEY_FOUNDATION, "Concrete"): 150000,
+        (KEY_FOUNDATION, "Steel Rebar"): 5000,
+        (KEY_SUPERSTRUCTURE, "Structural Steel"): 1800000,
+        (KEY_SUPERSTRUCTURE, "Steel Rebar"): 500,
+    }
+    assert manager.get_total_material_cost(type_material="Steel Rebar") == 5500
+    assert manager.get_total_material_cost(work_type=KEY_SUPERSTRUCTURE) == 1800500
+    assert manager.calculate_total_initial_cost() == 1955500
+
+# ✅ The cached totals follow the structure works
+@pytest.mark.unit
+def test_material_cost_totals_refresh(manager):
+    manager.get_material_cost_totals()
+    manager.input_data_row(KEY_AUXILIARY, [[_row("Railing", "Steel Rebar", 2, 50)]])
+    assert manager.get_total_material_cost(type_material="Steel Rebar") == 5600
+
+# ✅ Replacing rows deletes the old ones and reports the throughput
+@pytest.mark.unit
+def test_replace_structure_work_rows(manager):
+    ids = manager.input_data_row(KEY_FOUNDATION, [[_row("Pile", "Concrete", 1, 1)] * 3 for _ in range(5)])
+    new_ids = manager.replace_structure_work_rows(KEY_FOUNDATION, [[_row("Pile", "Concrete", 2, 1)]], ids)
+    stats = manager.last_ingest_stats
+    assert (stats.rows, stats.deleted) == (1, 5)
+    assert stats.rows_per_second > 0
+    remaining = [row[0] for row in manager.conn.execute("SELECT comp_id FROM struct_works_data")]
+    assert not set(ids) & set(remaining) and set(new_ids) <= set(remaining)
+    assert manager.get_total_material_cost(work_type=KEY_FOUNDATION, type_material="Concrete") == 150002
+
+# ✅ A failing save leaves the database untouched
+@pytest.mark.unit
+def test_failed_save_is_rolled_back(manager):
+    before = manager.get_total_material_cost()
+    ids = [row[0] for row in manager.conn.execute("SELECT comp_id FROM struct_works_data")]
+    with pytest.raises(sqlite3.IntegrityError):
+        manager.replace_structure_work_rows("Not a work type", [[_row("Pile", "Concrete", 1, 1)]], ids)
+    assert manager.conn.execute("SELECT COUNT(*) FROM struct_works_data").fetchone()[0] == len(ids)
+    assert manager.get_total_material_cost() == before
+
+# ✅ The road user cost adds the VOC over the rerouting distance to the time and accident costs
+@pytest.mark.unit
+def test_total_road_user_cost(manager):
+    total = manager.total_road_user_cost()
+    voc_cost = total - manager.vot_per_year() - manager.accident_related_cost()
+    assert voc_cost > 0
+    manager.traffic_data[KEY_ADDIT_REROUTING_DISTANCE] *= 2
+    assert manager.total_road_user_cost() - manager.vot_per_year() - manager.accident_related_cost() == \
+        pytest.approx(2 * voc_cost)
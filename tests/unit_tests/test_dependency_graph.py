@@ -0,0 +1,69 @@
+import pytest
+from desktop_app.widgets.utils.data import *
+from desktop_app.widgets.utils.database import DatabaseManager
+from desktop_app.widgets.utils.dependency_graph import RESULT_NODES, DependencyGraph
+from tests.unit_tests.fixtures import MAINTAINANCE_DATA
+
+
+def _row(material, quantity, rate):
+    return [{KEY_COMPONENT: "Pile", KEY_TYPE: material, KEY_GRADE: "", KEY_QUANTITY: quantity,
+             KEY_UNIT_M3: "cum", KEY_RATE: rate}]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    db = DatabaseManager(db_path=str(tmp_path / "structure_works.db"))
+    db.input_data_row(KEY_FOUNDATION, [_row("Concrete", 30, 5000)])
+    db.maintainance_and_repair_data = dict(MAINTAINANCE_DATA)
+    yield db
+    db.close()
+
+# ✅ Results are ordered after the results they read
+@pytest.mark.unit
+def test_topological_order():
+    graph = DependencyGraph()
+    for key, (_, dependencies) in RESULT_NODES.items():
+        for dependency in dependencies:
+            if dependency in RESULT_NODES:
+                assert graph.order.index(dependency) < graph.order.index(key)
+
+# ✅ Cycles are rejected
+@pytest.mark.unit
+def test_cycle_is_rejected():
+    with pytest.raises(ValueError):
+        DependencyGraph({"a": ("f", ["b"]), "b": ("g", ["a"])}, inputs=[])
+
+# ✅ Changing the structure works never leaves stale totals behind
+@pytest.mark.unit
+def test_structure_change_invalidates_dependent_results(manager):
+    manager.recompute()
+    assert manager.results[COST_TOTAL_INIT_CONST] == 150000
+    assert manager.results[COST_MAJOR_REPAIR] is not None
+
+    manager.input_data_row(KEY_FOUNDATION, [_row("Concrete", 30, 5000)])
+    assert manager.results[COST_TOTAL_INIT_CONST] is None
+    assert manager.results[COST_MAJOR_REPAIR] is None
+    repair = manager.result(COST_MAJOR_REPAIR)
+    assert manager.results[COST_TOTAL_INIT_CONST] == 300000
+    assert repair == pytest.approx(manager.major_repair_cost())
+
+# ✅ Only the results affected by an input group are recomputed
+@pytest.mark.unit
+def test_recompute_is_incremental(manager):
+    manager.recompute()
+    manager.demolition_and_recycling_data = {KEY_DEMOLITION_DISPOSAL_COST: 0.1,
+                                             KEY_STRUCT_STEEL_SCRAP_RATE: 0.9, KEY_STRUCT_STEEL_RECYLABILITY: 0.8,
+                                             KEY_STEEL_REBAR_SCRAP_RATE: 0.7, KEY_STEEL_REBAR_RECYLABILITY: 0.6,
+                                             KEY_PS_TENDONS_SCRAP_RATE: 0.5, KEY_PS_TENDONS_RECYLABILITY: 0.4}
+    recomputed = manager.recompute()
+    assert COST_DEMOLITION_DISPOSAL in recomputed
+    assert COST_TOTAL_INIT_CONST not in recomputed
+    assert COST_MAJOR_REPAIR not in recomputed
+    assert manager.recompute() == {}
+
+# ✅ Results waiting for data that has not been entered stay dirty
+@pytest.mark.unit
+def test_recompute_skips_missing_inputs(manager):
+    manager.recompute()
+    assert COST_DEMOLITION_DISPOSAL in manager.dependencies.dirty
+    assert manager.results[COST_CARBON_EMISSION_REROUTING_INIT] is None
@@ -0,0 +1,53 @@
+import pytest
+import numpy as np
+from desktop_app.widgets.utils.data import *
+from desktop_app.widgets.utils.IRC_SP_30 import (IRC_SP_30, VEHICLES, VOT, occupancies, vot_values,
+                                                 WPI_CATEGORIES, wpi_ratio_tensor, wpi_ratios)
+
+# ✅ Scalar lookups
+@pytest.mark.unit
+def test_scalar_lookups():
+    irc = IRC_SP_30()
+    assert irc._get_accident_cost(KEY_FATAL) == 1325049.00
+    assert irc._get_vot(KEY_BIG_CARS, KEY_FOUR_LANE_DIVIDED_ROAD) == 258.0
+    assert irc._get_occupancy(KEY_ORDINARY_BUS) == 30.0
+    assert irc._get_wpi(TABLE_VOT, KEY_LCV, 2024, 2019) == pytest.approx(154.0 / 121.2)
+
+# ✅ Vectorized lookups match the scalar ones
+@pytest.mark.unit
+def test_vectorized_lookups():
+    irc = IRC_SP_30()
+    expected = [irc._get_vot(vehicle, KEY_TWO_LANE_ROAD) * irc._get_occupancy(vehicle) for vehicle in VEHICLES]
+    assert vot_values(VEHICLES, KEY_TWO_LANE_ROAD) * occupancies(VEHICLES) == pytest.approx(expected)
+    assert wpi_ratios(TABLE_WPI_MEDICAL, KEY_FATAL, [2019, 2024]) == pytest.approx([1.0, 144.0 / 132.5])
+
+# ✅ Unknown keys raise ValueError and the tables are read-only
+@pytest.mark.unit
+def test_invalid_keys_and_immutability():
+    with pytest.raises(ValueError):
+        IRC_SP_30()._get_vehicle_damage_cost("Tractor")
+    with pytest.raises(ValueError):
+        wpi_ratios(TABLE_VOT, KEY_LCV, 1990)
+    with pytest.raises(ValueError):
+        VOT[0, 0] = 1.0
+
+# ✅ Years outside the tables give None in the nested WPI view
+@pytest.mark.unit
+def test_get_wpi_unknown_year():
+    wpi = IRC_SP_30().getWPI(2030)
+    assert wpi["WPI"]["fuelCost"][KEY_PETROL] is None
+    assert IRC_SP_30().getWPI(2024)["WPI"]["passengerCrewCost"][KEY_CREW_COST] == pytest.approx(164.18 / 118.07)
+
+# ✅ The ratio tensor is built once per base year and matches the nested WPI view
+@pytest.mark.unit
+def test_wpi_ratio_tensor():
+    ratios = wpi_ratio_tensor(2019)
+    assert wpi_ratio_tensor(2019) is ratios
+    assert ratios.values.shape == (len(WPI_CATEGORIES), len(VEHICLES), 6)
+    assert ratios.at(2019) == pytest.approx(np.ones((len(WPI_CATEGORIES), len(VEHICLES))))
+    assert ratios.select("tyreCost", KEY_TWO_WHEELER, 2024) == pytest.approx(117.9 / 104.0)
+    assert ratios.select(KEY_DIESEL, VEHICLES, 2024) == pytest.approx([167.4 / 94.4] * len(VEHICLES))
+    wpi = IRC_SP_30().getWPI(2023)
+    assert wpi["WPI"]["vehicleCost"]["tyreCost"][KEY_LCV] == pytest.approx(114.4 / 97.5)
+    assert wpi["WPI"]["fuelCost"][KEY_ENGINE_OIL] == pytest.approx(188.0 / 131.2)
+    assert wpi_ratio_tensor(2024).select("votCost", KEY_LCV, 2019) == pytest.approx(121.2 / 154.0)
@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+from desktop_app.widgets.utils.data import *
+from desktop_app.widgets.utils.ledger import (CashFlowLedger, CashFlowLine, equivalent_annual_cost,
+                                              internal_rate_of_return)
+from tests.unit_tests.fixtures import manager
+
+
+# ✅ Discounted yearly payments add up to the scalar results of every line
+@pytest.mark.unit
+def test_cash_flows_match_scalar_methods(manager):
+    table = manager.cash_flows()
+    assert COST_TOTAL_ROUTINE_INSPECTION in table.lines and COST_RECYCLING not in table.lines
+    for line, value in table.line_npv().items():
+        assert value == pytest.approx(manager.results[line], rel=1e-12)
+    assert table.cumulative()[-1] == pytest.approx(table.npv())
+    major_repair = table.real[table.lines.index(COST_MAJOR_REPAIR)]
+    assert np.flatnonzero(major_repair).tolist() == [30]
+    assert table.nominal[:, 30] == pytest.approx(table.real[:, 30] * 1.0515 ** 30)
+
+# ✅ Changing one input group only rebuilds the lines reading it
+@pytest.mark.unit
+def test_cash_flows_invalidate_per_line(manager):
+    manager.cash_flows()
+    manager.maintainance_and_repair_data = dict(manager.maintainance_and_repair_data,
+                                                **{KEY_MAJOR_REPAIR_FREQ: 20})
+    assert COST_TIME in manager.ledger and COST_MAJOR_REPAIR not in manager.ledger
+    table = manager.cash_flows()
+    assert np.flatnonzero(table.real[table.lines.index(COST_MAJOR_REPAIR)]).tolist() == [20, 40]
+    assert table[COST_MAJOR_REPAIR].sum() == pytest.approx(manager.results[COST_MAJOR_REPAIR])
+    with pytest.raises(ValueError):
+        manager.cash_flows(["Not a cost line"])
+
+# ✅ The ledger discounts for arrays of rates at once; IRR and annual cost metrics
+@pytest.mark.unit
+def test_ledger_metrics():
+    ledger = CashFlowLedger(horizon=10)
+    ledger.set_line(COST_TOTAL_INIT_CONST, CashFlowLine(1000.0, np.array([0])))
+    ledger.set_line(COST_MAJOR_INSPECTION, CashFlowLine(50.0, np.array([2, 4, 6, 8])))
+    rates = np.array([0.0, 0.05, 0.1])
+    npv = ledger.npv(0.0, rates)
+    assert npv[0] == pytest.approx(1200.0)
+    for rate, value in zip(rates, npv):
+        assert ledger.table(0.0, rate).npv() == pytest.approx(value)
+    assert ledger.present_values(0.0, rates).shape == (3, 2)
+    assert equivalent_annual_cost(1000.0, 0.0, 10) == pytest.approx(100.0)
+    assert equivalent_annual_cost(1000.0, 0.1, 1) == pytest.approx(1100.0)
+    irr = internal_rate_of_return([[-100.0, 110.0], [-100.0, 50.0], [-100.0, -10.0]])
+    assert irr[0] == pytest.approx(0.1) and irr[1] == pytest.approx(-0.5) and np.isnan(irr[2])
+    with pytest.raises(ValueError):
+        ledger.set_line(COST_RECYCLING, CashFlowLine(1.0, np.array([11])))
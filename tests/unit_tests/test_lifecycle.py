@@ -0,0 +1,65 @@
+import pytest
+import numpy as np
+from desktop_app.widgets.utils.data import *
+from desktop_app.widgets.utils.database import END_OF_LIFE_PAYMENTS
+from desktop_app.widgets.utils.lifecycle import BUILD, END_OF_LIFE, RECONSTRUCTION, lifecycle_schedule
+from tests.unit_tests.fixtures import manager
+
+
+# ✅ Cycle events over a horizon of more than two design lives
+@pytest.mark.unit
+def test_lifecycle_schedule():
+    schedule = lifecycle_schedule(50, 120)
+    assert schedule is lifecycle_schedule(50.0, 119.5)
+    assert len(schedule) == 3
+    assert schedule.event_years(BUILD).tolist() == [0, 50, 100]
+    assert schedule.event_years(RECONSTRUCTION).tolist() == [50, 100]
+    assert schedule.event_years(END_OF_LIFE).tolist() == [50, 100, 120]
+    assert schedule.event_years(30).tolist() == [30, 80]
+    assert schedule.counts(1).sum() == 49 + 49 + 19
+    factors = schedule.present_worth([RECONSTRUCTION, 30], 0.0, np.array([0.05, 0.1]))
+    assert factors.shape == (2, 2)
+    assert factors[1, 0] == pytest.approx(1.1 ** -50 + 1.1 ** -100)
+    with pytest.raises(ValueError):
+        schedule.event_years("never")
+
+# ✅ One cycle reproduces the ledger; longer horizons add reconstructions
+@pytest.mark.unit
+def test_lifecycle_costs(manager):
+    single = manager.lifecycle_costs().to_dict()
+    ledger = manager.cash_flows().line_npv()
+    assert {line: single[line] for line in ledger if line not in END_OF_LIFE_PAYMENTS} == pytest.approx(
+        {line: npv for line, npv in ledger.items() if line not in END_OF_LIFE_PAYMENTS})
+    costs = manager.lifecycle_costs(horizon=120)
+    q = 1.0515 / 1.067
+    assert costs.to_dict()[COST_TOTAL_INIT_CONST] == pytest.approx(
+        manager.results[COST_TOTAL_INIT_CONST] * (1 + q ** 50 + q ** 100))
+    swept = manager.lifecycle_costs(horizon=120, discount_rate=np.array([0.05, 0.067]))
+    assert swept.total()[1] == pytest.approx(costs.total())
+
+# ✅ Reconstruction cost reads the financial data and repeats every design life
+@pytest.mark.unit
+def test_reconstruction_cost(manager):
+    assert manager.reconstruction_cost(1e6, 1e5, 0, 0, 0, 0) == 0
+    manager.financial_data = {**manager.financial_data, KEY_ANALYSIS_PERIOD: 90}
+    assert manager.reconstruction_cost(1e6, 1e5, 0, 0, 0, 0) == pytest.approx(1.1e6 / 1.067 ** 50)
+    manager.financial_data = {**manager.financial_data, KEY_ANALYSIS_PERIOD: 120}
+    assert manager.reconstruction_cost(1e6, 1e5, 0, 0, 0, 0) == pytest.approx(
+        1.1e6 * (1.067 ** -50 + 1.067 ** -100))
+
+# ✅ Recycling is paid at every end of life, also when the analysis period reaches the design life
+@pytest.mark.unit
+def test_end_of_life_costs(manager):
+    manager.input_data_row(KEY_FOUNDATION, [[{KEY_COMPONENT: "Pile", KEY_TYPE: "Steel Rebar", KEY_GRADE: "",
+                                              KEY_QUANTITY: 2, KEY_UNIT_M3: "t", KEY_RATE: 60000}]])
+    manager.demolition_and_recycling_data = {KEY_DEMOLITION_DISPOSAL_COST: 0.1,
+                                             KEY_STRUCT_STEEL_SCRAP_RATE: 0.9, KEY_STRUCT_STEEL_RECYLABILITY: 0.8,
+                                             KEY_STEEL_REBAR_SCRAP_RATE: 0.7, KEY_STEEL_REBAR_RECYLABILITY: 0.6,
+                                             KEY_PS_TENDONS_SCRAP_RATE: 0.5, KEY_PS_TENDONS_RECYLABILITY: 0.4}
+    q = 1.0515 / 1.067
+    assert manager.lifecycle_costs().to_dict()[COST_RECYCLING] == pytest.approx(0.7 * 0.6 * 120000 * q ** 50)
+    manager.financial_data = {**manager.financial_data, KEY_ANALYSIS_PERIOD: 120}
+    assert manager.cash_flows().line_npv()[COST_RECYCLING] == 0
+    costs = manager.lifecycle_costs().to_dict()
+    assert costs[COST_RECYCLING] == pytest.approx(0.7 * 0.6 * 120000 * (q ** 50 + q ** 100 + q ** 120))
+    assert costs[COST_DEMOLITION_DISPOSAL_CARBON_REROUTING] > 0
@@ -0,0 +1,61 @@
+import pytest
+import numpy as np
+from desktop_app.widgets.utils.data import *
+from desktop_app.widgets.utils.sweep import SWEEP_PARAMETERS, evaluate_scenarios
+from desktop_app.widgets.utils.monte_carlo import (KEY_LIFE_CYCLE_COST, LogNormal, MonteCarloEngine,
+                                                   Triangular, Uniform)
+
+
+@pytest.fixture
+def baseline():
+    values = {key: 0.0 for key in SWEEP_PARAMETERS}
+    values.update({KEY_DISCOUNT_RATE_IA: 0.067, KEY_INFLATION_RATE: 0.0515, KEY_DESIGN_LIFE: 50,
+                   KEY_ANALYSIS_PERIOD: 50, KEY_ROUTINE_INSP_FREQ: 1, KEY_ROUTINE_INSP_COST: 0.01,
+                   COST_TOTAL_INIT_CONST: 1e8, KEY_MATERIAL_QUANTITY_FACTOR: 1.0,
+                   "CO2_EMISSION_PER_KM": 0.0, "WORKING_DAYS_IN_MONTH": 25, "DURATION_MAJOR_REPAIRS": 0,
+                   "DURATION_REPLACEMENT": 0, "DURATION_DEMOLITION_DISPOSAL": 0,
+                   "Steel Rebar": 0.0, "Structural Steel": 0.0, "Tendons": 0.0})
+    return values
+
+# ✅ A degenerate distribution reproduces the deterministic result
+@pytest.mark.unit
+def test_monte_carlo_degenerate_distribution(baseline):
+    expected = evaluate_scenarios(baseline, {}).total()[0]
+    engine = MonteCarloEngine(baseline, {KEY_INFLATION_RATE: Uniform(0.0515, 0.0515)},
+                              n_samples=1000, block_size=300, seed=0, max_workers=1)
+    summary = engine.result()
+    assert summary.done
+    assert list(summary.percentiles(KEY_LIFE_CYCLE_COST).values()) == pytest.approx([expected] * 3)
+
+# ✅ Summaries are streamed per block and the run is reproducible
+@pytest.mark.unit
+def test_monte_carlo_streams_and_is_reproducible(baseline):
+    distributions = {KEY_DISCOUNT_RATE_IA: Triangular(0.05, 0.067, 0.09),
+                     KEY_MATERIAL_QUANTITY_FACTOR: LogNormal(1.0, 0.1)}
+    engine = MonteCarloEngine(baseline, distributions, n_samples=1000, block_size=300, seed=7, max_workers=1)
+    summaries = list(engine.run())
+    assert [s.n_samples for s in summaries] == [300, 600, 900, 1000]
+    p = summaries[-1].percentiles()
+    assert p[5] < p[50] < p[95]
+    values, probabilities = summaries[-1].cdf()
+    assert np.all(np.diff(values) >= 0) and probabilities[-1] == 1.0
+    again = MonteCarloEngine(baseline, distributions, n_samples=1000, block_size=300, seed=7, max_workers=1)
+    assert again.result().percentiles() == p
+
+# ✅ A process pool gives the same samples, in the same order, as a serial run
+@pytest.mark.unit
+def test_monte_carlo_pool_matches_serial(baseline):
+    distributions = {KEY_DISCOUNT_RATE_IA: Triangular(0.05, 0.067, 0.09),
+                     KEY_MATERIAL_QUANTITY_FACTOR: LogNormal(1.0, 0.1)}
+    serial = MonteCarloEngine(baseline, distributions, n_samples=1000, block_size=100, seed=3, max_workers=1)
+    pool = MonteCarloEngine(baseline, distributions, n_samples=1000, block_size=100, seed=3, max_workers=2)
+    summaries = list(pool.run())
+    assert sorted(s.n_samples for s in summaries) == list(range(100, 1001, 100))
+    serial.result()
+    np.testing.assert_array_equal(pool.samples, serial.samples)
+
+# ✅ Unknown parameters are rejected
+@pytest.mark.unit
+def test_monte_carlo_rejects_unknown_parameter(baseline):
+    with pytest.raises(ValueError):
+        MonteCarloEngine(baseline, {"Not a parameter": Uniform(0, 1)})
@@ -0,0 +1,47 @@
+import pytest
+import numpy as np
+from desktop_app.widgets.utils.pwf import PWFCache, present_worth_factor, present_worth_factors
+
+
+def _series(i, d, f, life):
+    return sum(((1 + i) / (1 + d)) ** p for p in range(f, life, f))
+
+# ✅ Closed form matches the explicit series
+@pytest.mark.unit
+@pytest.mark.parametrize("i, d, f, life", [(0.0515, 0.067, 1, 50), (0.04, 0.04, 5, 50), (0.05, 0.08, 30, 50), (0.05, 0.08, 50, 50)])
+def test_present_worth_factor(i, d, f, life):
+    assert present_worth_factor(i, d, f, life) == pytest.approx(_series(i, d, f, life))
+
+# ✅ Zero frequency means the cost never recurs
+@pytest.mark.unit
+def test_present_worth_factor_zero_frequency():
+    assert present_worth_factor(0.05, 0.06, 0, 50) == 0.0
+
+# ✅ Batched path matches the scalar path
+@pytest.mark.unit
+def test_present_worth_factors_batched():
+    inflation = np.array([0.03, 0.0515, 0.06])
+    discount = np.array([0.067, 0.0515, 0.08])
+    expected = [present_worth_factor(i, d, 5, 50) for i, d in zip(inflation, discount)]
+    assert present_worth_factors(inflation, discount, 5, 50) == pytest.approx(expected)
+
+# ✅ Identical series are computed once and counted as hits
+@pytest.mark.unit
+def test_pwf_cache_hits_and_misses():
+    cache = PWFCache(maxsize=2)
+    first = present_worth_factor(0.0515, 0.067, 5, 50, cache=cache)
+    second = present_worth_factor(0.0515, 0.067, 5, 50, cache=cache)
+    assert first == second == pytest.approx(_series(0.0515, 0.067, 5, 50))
+    assert cache.cache_info() == (1, 1, 2, 1)
+
+# ✅ Least recently used factor is evicted
+@pytest.mark.unit
+def test_pwf_cache_eviction():
+    cache = PWFCache(maxsize=2)
+    cache.get(0.05, 0.06, 1, 50)
+    cache.get(0.05, 0.06, 5, 50)
+    cache.get(0.05, 0.06, 1, 50)
+    cache.get(0.05, 0.06, 10, 50)
+    assert len(cache) == 2
+    cache.get(0.05, 0.06, 5, 50)
+    assert cache.misses == 4
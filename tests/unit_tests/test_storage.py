@@ -0,0 +1,69 @@
+import sqlite3
+import pytest
+from desktop_app.widgets.utils.data import *
+from desktop_app.widgets.utils.database import DatabaseManager
+from desktop_app.widgets.utils.storage import (SCHEMA_VERSION, StorageProfile, migrate, project_db_path,
+                                               schema_version)
+
+ROW = [[{KEY_COMPONENT: "Pile", KEY_TYPE: "Concrete", KEY_GRADE: "M25", KEY_QUANTITY: 30,
+         KEY_UNIT_M3: "cum", KEY_RATE: 5000}]]
+
+# ✅ The profile is applied to the connection
+@pytest.mark.unit
+def test_storage_profile_pragmas(tmp_path):
+    conn = StorageProfile().connect(str(tmp_path / "s.db"))
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+# ✅ A project database keeps its data between sessions
+@pytest.mark.unit
+def test_project_database_persists(tmp_path):
+    manager = DatabaseManager.open_project("Bridge A/1", projects_dir=str(tmp_path))
+    manager.input_data_row(KEY_FOUNDATION, ROW)
+    manager.close()
+    manager = DatabaseManager.open_project("Bridge A/1", projects_dir=str(tmp_path))
+    assert manager.db_path == project_db_path("Bridge A/1", str(tmp_path))
+    assert manager.result(COST_TOTAL_INIT_CONST) == 150000
+    manager.close()
+
+# ✅ Deleting a structure work cascades to its components
+@pytest.mark.unit
+def test_foreign_keys_cascade(tmp_path):
+    manager = DatabaseManager(db_path=str(tmp_path / "s.db"))
+    comp_id = manager.input_data_row(KEY_FOUNDATION, ROW)[0]
+    manager.delete_structure_work(comp_id)
+    assert manager.conn.execute("SELECT COUNT(*) FROM component").fetchone()[0] == 0
+    manager.close()
+
+# ✅ In-memory mode never touches the disk
+@pytest.mark.unit
+def test_in_memory_profile(tmp_path):
+    manager = DatabaseManager(db_path=str(tmp_path / "s.db"), profile=StorageProfile(in_memory=True))
+    manager.input_data_row(KEY_FOUNDATION, ROW)
+    assert not (tmp_path / "s.db").exists()
+    manager.close()
+
+# ✅ Databases created before schema versioning are migrated
+@pytest.mark.unit
+def test_migrate_unversioned_database(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "old.db"))
+    conn.execute("CREATE TABLE struct_works_data (comp_id INTEGER PRIMARY KEY AUTOINCREMENT, type TEXT NOT NULL, "
+                 "component_type TEXT NOT NULL)")
+    conn.execute("CREATE TABLE component (id INTEGER PRIMARY KEY AUTOINCREMENT, comp_id INTEGER NOT NULL, "
+                 "type_material TEXT NOT NULL, grade TEXT NOT NULL, quantity REAL NOT NULL DEFAULT 0, "
+                 "unit TEXT NOT NULL, rate REAL NOT NULL DEFAULT 0.0, rate_data_source TEXT)")
+    conn.execute("INSERT INTO component (comp_id, type_material, grade, unit) VALUES (42, 'Concrete', '', 'cum')")
+    conn.commit()
+    assert migrate(conn) == SCHEMA_VERSION
+    assert schema_version(conn) == SCHEMA_VERSION
+    assert conn.execute("SELECT COUNT(*) FROM component").fetchone()[0] == 0
+    assert migrate(conn) == 0
+
+# ✅ Databases from a newer application are refused
+@pytest.mark.unit
+def test_migrate_newer_database(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "new.db"))
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    with pytest.raises(ValueError):
+        migrate(conn)
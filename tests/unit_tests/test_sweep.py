@@ -0,0 +1,31 @@
+import pytest
+import numpy as np
+from desktop_app.widgets.utils.data import *
+from tests.unit_tests.fixtures import manager
+
+
+# ✅ A single-scenario sweep reproduces the scalar cost methods
+@pytest.mark.unit
+def test_sweep_matches_scalar_methods(manager):
+    result = manager.sweep({})
+    assert result[COST_TIME][0] == pytest.approx(manager.calculate_time_cost())
+    assert result[COST_TOTAL_ROUTINE_INSPECTION][0] == pytest.approx(manager.routine_inspection_cost())
+    assert result[COST_MAJOR_REPAIR][0] == pytest.approx(manager.major_repair_cost())
+    assert result[COST_CARBON_EMISSION_RR_DURING_MAJOR_REPAIR][0] == pytest.approx(
+        manager.carbon_emission_rerouting_during_major_repairs())
+
+# ✅ Every scenario row matches the scalar evaluation of the same inputs
+@pytest.mark.unit
+def test_sweep_over_discount_rates(manager):
+    rates = np.array([0.04, 0.067, 0.09])
+    result = manager.sweep({KEY_DISCOUNT_RATE_IA: rates})
+    assert len(result) == 3
+    for row, rate in enumerate(rates):
+        manager.financial_data = {**manager.financial_data, KEY_DISCOUNT_RATE_IA: rate}
+        assert result[COST_PERIODIC_MAINTAINANCE][row] == pytest.approx(manager.periodic_maintainance_cost())
+
+# ✅ Unknown parameters are rejected
+@pytest.mark.unit
+def test_sweep_rejects_unknown_parameter(manager):
+    with pytest.raises(ValueError):
+        manager.sweep({"Not a parameter": [1.0]})
@@ -0,0 +1,273 @@
+import copy
+import json
+import os
+from collections import Counter
+import numpy as np
+import pytest
+from desktop_app.widgets.utils.core.main import calc_voc, vehicle_input, wpi
+from desktop_app.widgets.utils.core.voc import core
+from desktop_app.widgets.utils.core.voc.cache import VOCCache
+from desktop_app.widgets.utils.core.voc.congestion import core as congestion_core, formulas
+from desktop_app.widgets.utils.core.voc.fleet import FLEET_VEHICLES, FLEET_VOC_FIELDS, fleet_voc, voc_results
+from desktop_app.widgets.utils.core.voc.utils import input_validation, post_processor as pp
+from desktop_app.widgets.utils.core.voc.utils import trace as trace_module
+from desktop_app.widgets.utils.core.voc.utils.trace import JSONLTraceSink
+
+FLEET = {"small_cars": 3943, "big_cars": 2397, "two_wheelers": 12505, "buses": 329, "lcv": 271, "hcv": 12, "mcv": 1}
+
+
+def fleet_input(vehicle_info):
+    inputs = copy.deepcopy(vehicle_input)
+    inputs["vehicle_info"] = dict(vehicle_info)
+    return inputs
+
+
+def count_wpi_lookups(monkeypatch, vehicle_info):
+    """Run the pipeline and count the WPI lookups of every vehicle type."""
+    lookups = Counter()
+    get_wpi = pp.getWPI
+
+    def counting_get_wpi(category, vehicle_type, wpi):
+        lookups[vehicle_type] += 1
+        return get_wpi(category, vehicle_type, wpi)
+
+    monkeypatch.setattr(pp, "getWPI", counting_get_wpi)
+    summary = core.main(fleet_input(vehicle_info), wpi)
+    monkeypatch.undo()
+    return summary, lookups
+
+# ✅ Post-processing runs once over the fleet: per-vehicle work does not grow with the fleet size
+@pytest.mark.unit
+def test_post_processing_single_pass(monkeypatch):
+    _, fleet_lookups = count_wpi_lookups(monkeypatch, FLEET)
+    for vt in FLEET:
+        alone = {key: (count if key == vt else 0) for key, count in FLEET.items()}
+        _, single_lookups = count_wpi_lookups(monkeypatch, alone)
+        assert fleet_lookups[vt] == single_lookups[vt] > 0
+
+# ✅ The fleet summary is the sum of the single-vehicle summaries
+@pytest.mark.unit
+def test_fleet_summary_adds_up():
+    summary = core.main(fleet_input(FLEET), wpi)
+    total = 0.0
+    for vt in FLEET:
+        alone = core.main(fleet_input({key: (count if key == vt else 0) for key, count in FLEET.items()}), wpi)
+        assert alone["distanceCost"][vt] == pytest.approx(summary["distanceCost"][vt])
+        total += alone["distanceCost"]["total"]["IT"]
+    assert summary["distanceCost"]["total"]["IT"] == pytest.approx(total)
+
+# ✅ A fleet without vehicles gives zero totals
+@pytest.mark.unit
+def test_empty_fleet():
+    summary = core.main(fleet_input({key: 0 for key in FLEET}), wpi)
+    assert summary["distanceCost"]["total"] == {"IT": 0.0, "ET": 0.0}
+
+# ✅ The fleet model matches the per-vehicle models at every road point
+@pytest.mark.unit
+def test_fleet_model_matches_vehicle_models():
+    pwr = {"mcv": 8, "hcv": 7.22}
+    RG = np.array([1500.0, 2000.0, 3500.0, 6000.0])
+    RS = np.array([0.0, 0.0, 5.0, 1.0])
+    FL = np.array([0.0, 0.0, 2.0, 10.0])
+    result = fleet_voc(RG, "4L", RS, FL, pwr=pwr)
+    assert result.shape == (4, len(FLEET_VEHICLES))
+    for i in range(len(RG)):
+        inputs = {"rg_roughness_factor": RG[i], "rs_rise_factor": RS[i], "fl_fall_factor": FL[i],
+                  "lane_type": "4L", "carriageway_width": 7.0, "power_weight_ratio_pwr": pwr}
+        for j, vt in enumerate(FLEET_VEHICLES):
+            output = core.MODEL_MAP[vt].compute_voc(core.model_input(inputs, vt))
+            for field in FLEET_VOC_FIELDS:
+                assert result[field][i, j] == pytest.approx(getattr(output, field))
+
+# ✅ Lanes are evaluated per point; expressways need a custom width
+@pytest.mark.unit
+def test_fleet_model_lanes():
+    result = fleet_voc(2500.0, ["2L", "EW"], W=12.0, pwr=7.0)
+    assert result.shape == (2, len(FLEET_VEHICLES))
+    assert result["velocity"][1, 0] == pytest.approx(93.71 - 0.00323 * 2500 + 0.701 * 12)
+    with pytest.raises(ValueError):
+        fleet_voc(2500.0, "EW", pwr=7.0)
+    with pytest.raises(ValueError):
+        fleet_voc(2500.0, "3L", pwr=7.0)
+
+# ✅ Model results convert to the legacy nested dictionaries and back; post-processing accepts both
+@pytest.mark.unit
+def test_voc_result_legacy_shape():
+    results = voc_results(fleet_voc([2500.0], "2L", pwr={"mcv": 8, "hcv": 7.22})[0], "2L")
+    legacy = {vt: result.to_dict() for vt, result in results.items()}
+    assert legacy["buses"]["VOC_summary"]["time_related"]["crew_cost"]["unit"] == "Rs/km"
+    assert legacy["lcv"]["VOC_summary"]["distance_related"]["spare_parts"]["iHTC"] is True
+    assert type(results["lcv"]).from_dict(legacy["lcv"]) == results["lcv"]
+    assert pp.post_process(legacy, wpi) == pp.post_process(results, wpi)
+
+# ✅ WPI adjusted costs are flat (IT, ET) pairs; their nested dictionary gives the same totals
+@pytest.mark.unit
+def test_wpi_adjusted_costs():
+    adjusted = pp.adjust_for_wpi(voc_results(fleet_voc([2500.0], "2L", pwr={"mcv": 8, "hcv": 7.22})[0], "2L"), wpi)
+    assert len(adjusted.distanceCost["lcv"]) == len(pp.DISTANCE_COMPONENTS)
+    nested = adjusted.to_dict()
+    assert list(nested["timeCost"]["buses"]) == list(pp.TIME_COMPONENTS) + ["total_time_cost"]
+    assert nested["timeCost"]["buses"]["crew_cost"] == {"value": adjusted.timeCost["buses"][3][0], "unit": "Rs/km",
+                                                       "iHTC": False}
+    summary = pp.calculate_total_cost(adjusted)
+    assert summary["timeCost"]["lcv"]["ET"] == pytest.approx(nested["timeCost"]["lcv"]["total_time_cost"]["ET"])
+    assert summary["distanceCost"]["total"]["IT"] == pytest.approx(
+        sum(summary["distanceCost"][vt]["IT"] for vt in adjusted.distanceCost))
+
+# ✅ Congestion factors follow Tables 10/11 and are capped between 1 and 2, for numbers and arrays
+@pytest.mark.unit
+def test_congestion_factors():
+    assert formulas.time_congestion_factors("SL", 0.5)["buses"] == pytest.approx(0.838 + 1.307 * 0.5)
+    assert formulas.distance_congestion_factors("4L", 0.8)["lcv"] == pytest.approx(2.2518 * 0.64 - 1.2471 * 0.8 + 1.1348)
+    assert formulas.time_congestion_factors("EW", 0.3) == formulas.time_congestion_factors("8L", 0.3)
+    vc = np.linspace(0.0, 1.5, 8760)
+    factors = formulas.congestion_factors(formulas.DISTANCE_CONGESTION, "6L", vc)
+    assert factors.shape == (8760, len(formulas.CONGESTION_VEHICLES))
+    assert factors.min() == 1 and factors.max() == 2
+    by_vehicle = formulas.distance_congestion_factors("6L", vc)
+    assert by_vehicle["mcv"][100] == pytest.approx(formulas.distance_congestion_factors("6L", float(vc[100]))["mcv"])
+    with pytest.raises(ValueError):
+        formulas.time_congestion_factors("3L", 0.5)
+    with pytest.raises(ValueError):
+        formulas.time_congestion_factors("2L", "high")
+
+# ✅ A flat traffic profile gives the daily result at the same V/C; the profile can be streamed in blocks
+@pytest.mark.unit
+def test_congestion_profile():
+    inputs = fleet_input(FLEET)
+    summary = core.main(inputs, wpi)
+    hourly = {vt: np.full(24, count / 24) for vt, count in FLEET.items()}
+    pcu_per_hour = sum(count * congestion_core.pcu[vt] for vt, count in FLEET.items()) / 24
+    capacity = pcu_per_hour / 0.8
+    daily = congestion_core.calculate_total_adjusted_costs(summary, 0.8, inputs)
+    profile = congestion_core.calculate_profile_adjusted_costs(summary, hourly, capacity, "2L")
+    assert profile["intervals"] == 24 and profile["max_vc"] == pytest.approx(0.8)
+    assert profile["total"]["IT"] == pytest.approx(daily["total"]["IT"])
+    assert profile["time_total"]["ET"] == pytest.approx(daily["time_total"]["ET"])
+
+    quarter_hourly = {vt: np.repeat(counts / 4, 4) for vt, counts in hourly.items()}
+    assert congestion_core.calculate_profile_adjusted_costs(summary, quarter_hourly, capacity, "2L", 0.25)[
+        "total"]["IT"] == pytest.approx(profile["total"]["IT"])
+
+    blocks = [{vt: counts[:12] for vt, counts in hourly.items()}, {vt: counts[12:] for vt, counts in hourly.items()}]
+    running = list(congestion_core.iter_profile_adjusted_costs(summary, blocks, capacity, "2L"))
+    assert [r["intervals"] for r in running] == [12, 24]
+    assert running[0]["total"]["IT"] == pytest.approx(profile["total"]["IT"] / 2)
+    assert running[-1]["total"]["IT"] == pytest.approx(profile["total"]["IT"])
+
+    with pytest.raises(ValueError):
+        congestion_core.calculate_profile_adjusted_costs(summary, hourly, 0, "2L")
+    with pytest.raises(ValueError):
+        congestion_core.calculate_profile_adjusted_costs(summary, {"trucks": [1.0]}, capacity, "2L")
+    with pytest.raises(ValueError):
+        congestion_core.calculate_profile_adjusted_costs(summary, {"buses": [-1.0]}, capacity, "2L")
+
+# ✅ Bridges with the same lane and (rounded) road condition share the vehicle model results
+@pytest.mark.unit
+def test_voc_cache():
+    cache = VOCCache(maxsize=16)
+    inputs = fleet_input(FLEET)
+    summary = core.main(copy.deepcopy(inputs), wpi)
+    assert core.main(copy.deepcopy(inputs), wpi, cache=cache) == summary
+    assert cache.cache_info() == (0, len(FLEET), 16, len(FLEET))
+
+    inputs["rg_roughness_factor"] = 2000.2
+    assert core.main(inputs, wpi, cache=cache) == summary
+    assert cache.hits == len(FLEET) and cache.hit_rate() == pytest.approx(0.5)
+
+    for rg in range(3000, 3004):
+        core.main(dict(inputs, rg_roughness_factor=rg), wpi, cache=cache)
+    assert len(cache) == 16 and cache.misses == 5 * len(FLEET)
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 16, 0)
+    with pytest.raises(ValueError):
+        VOCCache(maxsize=0)
+
+# ✅ Validation reports every error without modifying the input or exiting; trusted inputs skip it
+@pytest.mark.unit
+def test_input_validation():
+    inputs = fleet_input(FLEET)
+    untouched = copy.deepcopy(inputs)
+    summary = core.main(inputs, wpi)
+    assert inputs == untouched and "carriageway_width" not in inputs
+    assert core.main(inputs, wpi, trusted=True) == summary
+
+    invalid = fleet_input(dict(FLEET, trucks=1))
+    invalid["lane_type"] = "3L"
+    invalid["power_weight_ratio_pwr"] = {"mcv": 0}
+    errors = input_validation.check_input(invalid)
+    assert [error.field for error in errors] == ["lane_type", "vehicle_info"] + ["power_weight_ratio_pwr"] * 2
+    with pytest.raises(ValueError) as excinfo:
+        core.main(invalid, wpi)
+    assert [error.field for error in excinfo.value.errors] == [error.field for error in errors]
+    assert input_validation.check_input(dict(inputs, vehicle_info=None)) == [
+        ("vehicle_info", "vehicle_info must be a dictionary.")]
+
+# ✅ Traces are written as compact JSON Lines in a per-run directory, within the size cap
+@pytest.mark.unit
+def test_trace_sink(tmp_path):
+    inputs = fleet_input(FLEET)
+    with JSONLTraceSink(root=str(tmp_path), run_id="audit") as trace:
+        summary = core.main(inputs, wpi, trace=trace)
+        core.main(inputs, wpi, trace=trace)
+        trace.flush()
+        records = [json.loads(line) for line in open(tmp_path / "audit" / "trace.jsonl")]
+    assert [(r["call"], r["stage"]) for r in records] == [
+        (call, stage) for call in (1, 2) for stage in ("model_outputs", "wpi_adjusted", "summary")]
+    assert records[2]["data"] == json.loads(json.dumps(summary))
+    assert records[0]["data"]["lcv"]["VOC_summary"]["time_related"]["crew_cost"]["unit"] == "Rs/km"
+
+    with JSONLTraceSink(root=str(tmp_path), run_id="capped", max_bytes=2000) as trace:
+        core.main(inputs, wpi, trace=trace)
+    assert os.path.getsize(tmp_path / "capped" / "trace.jsonl") <= 2000
+    assert trace.dropped > 0
+
+# ✅ debug=True traces to the per-process debug sink instead of writing files on the calling thread
+@pytest.mark.unit
+def test_debug_uses_trace_sink(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(trace_module, "_debug_sink", None)
+    summary = core.main(fleet_input(FLEET), wpi, debug=True)
+    sink = trace_module.debug_sink()
+    assert sink.directory.startswith("debug")
+    sink.close()
+    records = [json.loads(line) for line in open(sink.path)]
+    assert [r["stage"] for r in records] == ["model_outputs", "wpi_adjusted", "summary"]
+    assert records[2]["data"] == json.loads(json.dumps(summary))
+    assert not (tmp_path / "debug" / "summaryOfVOC.json").exists()
+
+# ✅ Vehicle models are loaded on first use, only for the vehicle types with traffic
+@pytest.mark.unit
+def test_lazy_vehicle_models(monkeypatch):
+    models = core.LazyModelMap(core.MODEL_MODULES)
+    monkeypatch.setattr(core, "MODEL_MAP", models)
+    core.main(fleet_input({key: (5 if key in ("buses", "lcv") else 0) for key in FLEET}), wpi)
+    assert sorted(models.loaded()) == ["buses", "lcv"]
+    assert len(models) == len(FLEET) and models.get("trucks") is None
+
+# ✅ calc_voc applies the congestion factors to the fleet it was given
+@pytest.mark.unit
+def test_calc_voc():
+    inputs = fleet_input(FLEET)
+    voc = calc_voc(inputs, wpi, vc=0.5)
+    expected = congestion_core.calculate_total_adjusted_costs(core.main(inputs, wpi), 0.5, inputs)
+    assert voc == expected and voc["total"]["IT"] > 0
+
+# ✅ Scenario totals are one matrix product; each scenario matches the single-scenario calculation
+@pytest.mark.unit
+def test_scenario_adjusted_costs():
+    inputs = fleet_input(FLEET)
+    summary = core.main(inputs, wpi)
+    counts = np.array([[count * scale for count in congestion_core.vehicle_counts(FLEET)] for scale in (0.5, 1, 2)])
+    vc = np.array([0.3, 0.8, 1.2])
+    adjusted = congestion_core.calculate_scenario_adjusted_costs(summary, counts, vc, "2L")
+    assert adjusted.totals.shape == (3, 4)
+    for s in range(3):
+        scenario = dict(inputs, vehicle_info=dict(zip(formulas.CONGESTION_VEHICLES, counts[s].tolist())))
+        expected = congestion_core.calculate_total_adjusted_costs(summary, float(vc[s]), scenario, debug=True)
+        assert adjusted.as_dict(s)["total"] == pytest.approx(expected["total"])
+        breakdown = adjusted.breakdown(s)
+        assert breakdown.keys() == expected["breakdown"].keys()
+        assert breakdown["buses"]["total"] == pytest.approx(expected["breakdown"]["buses"]["total"])
+    with pytest.raises(ValueError):
+        congestion_core.calculate_scenario_adjusted_costs(summary, -counts, vc, "2L")
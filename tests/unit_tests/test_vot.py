@@ -0,0 +1,47 @@
+import pytest
+import numpy as np
+from desktop_app.widgets.utils.data import *
+from desktop_app.widgets.utils.IRC_SP_30 import IRC_SP_30, ROAD_TYPES, VEHICLES, YEARS
+from desktop_app.widgets.utils.vot import vehicle_counts, vot_per_day, vot_table, vot_tensor
+
+COUNTS = np.arange(1.0, len(VEHICLES) + 1)
+
+# ✅ VOT tensor matches the IRC SP-30 table, occupancy and WPI lookups
+@pytest.mark.unit
+def test_vot_tensor():
+    irc = IRC_SP_30()
+    tensor = vot_tensor()
+    assert tensor.shape == (len(YEARS), len(VEHICLES), len(ROAD_TYPES))
+    assert not tensor.flags.writeable
+    for vehicle in (KEY_TWO_WHEELER, KEY_HCV):
+        for road in (ROAD_TYPES[0], ROAD_TYPES[-1]):
+            expected = (irc._get_vot(vehicle_type=vehicle, column=road)
+                        * irc._get_occupancy(vehicle_type=vehicle)
+                        * irc._get_wpi(TABLE_VOT, vehicle, 2024, BASE_YEAR))
+            assert tensor[YEARS.index(2024), VEHICLES.index(vehicle), ROAD_TYPES.index(road)] == pytest.approx(expected)
+
+# ✅ Scenario arrays of road types and years agree with the full table
+@pytest.mark.unit
+def test_vot_scenarios():
+    counts = np.stack([COUNTS, COUNTS[::-1]])
+    table = vot_table(counts, 1.5)
+    assert table.shape == (2, len(YEARS), len(ROAD_TYPES))
+    roads = np.array([[ROAD_TYPES[2]], [ROAD_TYPES[5]]])
+    years = np.array(YEARS)
+    per_day = vot_per_day(counts[:, np.newaxis], roads, 1.5, years)
+    assert per_day.shape == (2, len(YEARS))
+    assert per_day[0] == pytest.approx(table[0, :, 2])
+    assert per_day[1] == pytest.approx(table[1, :, 5])
+    assert vot_per_day(COUNTS, ROAD_TYPES[2], 3.0) == pytest.approx(2 * table[0, -1, 2])
+
+# ✅ Traffic dictionaries map onto the vehicle axis and unknown keys are rejected
+@pytest.mark.unit
+def test_vot_vehicle_counts():
+    counts = vehicle_counts({KEY_HCV: 40, KEY_TWO_WHEELER: 10})
+    assert counts[VEHICLES.index(KEY_HCV)] == 40 and counts.sum() == 50
+    with pytest.raises(ValueError):
+        vehicle_counts({"tractor": 1})
+    with pytest.raises(ValueError):
+        vot_per_day(COUNTS, "Dirt Track", 1.0)
+    with pytest.raises(ValueError):
+        vot_per_day(COUNTS, ROAD_TYPES[0], 1.0, years=1990)